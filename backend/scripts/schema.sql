@@ -70,6 +70,18 @@ CREATE TABLE IF NOT EXISTS blog_tags (
   FOREIGN KEY (tag_id) REFERENCES tags(id) ON DELETE CASCADE
 );
 
+-- Resized WebP/AVIF copies of uploaded images, keyed by the upload's SHA-256
+CREATE TABLE IF NOT EXISTS image_variants (
+  image_hash CHAR(64) NOT NULL,
+  format VARCHAR(10) NOT NULL,
+  width INT NOT NULL,
+  height INT NOT NULL,
+  bytes INT NOT NULL,
+  path VARCHAR(500) NOT NULL,
+  created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+  PRIMARY KEY (image_hash, format, width)
+);
+
 -- Comments table
 CREATE TABLE IF NOT EXISTS comments (
   id VARCHAR(36) PRIMARY KEY,
@@ -97,6 +109,120 @@ CREATE TABLE IF NOT EXISTS contacts (
 CREATE INDEX idx_blogs_status ON blogs(status);
 CREATE INDEX idx_blogs_category ON blogs(category_id);
 CREATE INDEX idx_blogs_author ON blogs(author_id);
+-- Posts using an upload, looked up when its image variants are ready
+CREATE INDEX idx_blogs_featured_image ON blogs(featured_image);
 CREATE INDEX idx_comments_blog ON comments(blog_id);
 CREATE INDEX idx_comments_status ON comments(status);
 CREATE INDEX idx_contacts_status ON contacts(status);
+
+-- Keyset pagination indexes: ORDER BY created_at DESC, id DESC with optional status or blog filter
+CREATE INDEX idx_blogs_created ON blogs(created_at, id);
+CREATE INDEX idx_blogs_status_created ON blogs(status, created_at, id);
+CREATE INDEX idx_comments_created ON comments(created_at, id);
+CREATE INDEX idx_comments_status_created ON comments(status, created_at, id);
+CREATE INDEX idx_comments_blog_created ON comments(blog_id, created_at, id);
+CREATE INDEX idx_contacts_created ON contacts(created_at, id);
+CREATE INDEX idx_contacts_status_created ON contacts(status, created_at, id);
+
+-- Full-text search over blog text (GET /api/blogs/search)
+CREATE FULLTEXT INDEX idx_blogs_fulltext ON blogs(title, excerpt, content);
+
+-- Dashboard counters, maintained by the triggers below so the dashboard
+-- reads a handful of rows instead of scanning blogs, comments and contacts
+CREATE TABLE IF NOT EXISTS stats_counters (
+  name VARCHAR(64) PRIMARY KEY,
+  value BIGINT NOT NULL DEFAULT 0
+);
+
+DROP TRIGGER IF EXISTS blogs_after_insert;
+CREATE TRIGGER blogs_after_insert AFTER INSERT ON blogs FOR EACH ROW
+  UPDATE stats_counters SET value = value + 1
+  WHERE name IN ('blogs.total', CONCAT('blogs.', NEW.status));
+
+DROP TRIGGER IF EXISTS blogs_after_update;
+CREATE TRIGGER blogs_after_update AFTER UPDATE ON blogs FOR EACH ROW
+  UPDATE stats_counters SET value = value + IF(name = CONCAT('blogs.', NEW.status), 1, -1)
+  WHERE NOT (OLD.status <=> NEW.status)
+    AND name IN (CONCAT('blogs.', OLD.status), CONCAT('blogs.', NEW.status));
+
+-- Cascaded deletes don't fire triggers, so take a blog's comments off the
+-- counters before the cascade removes them
+DROP TRIGGER IF EXISTS blogs_before_delete;
+CREATE TRIGGER blogs_before_delete BEFORE DELETE ON blogs FOR EACH ROW
+  UPDATE stats_counters s
+  JOIN (
+    SELECT CONCAT('comments.', status) AS name, COUNT(*) AS n FROM comments WHERE blog_id = OLD.id GROUP BY status
+    UNION ALL
+    SELECT 'comments.total', COUNT(*) FROM comments WHERE blog_id = OLD.id
+  ) d ON s.name = d.name
+  SET s.value = s.value - d.n;
+
+DROP TRIGGER IF EXISTS blogs_after_delete;
+CREATE TRIGGER blogs_after_delete AFTER DELETE ON blogs FOR EACH ROW
+  UPDATE stats_counters SET value = value - 1
+  WHERE name IN ('blogs.total', CONCAT('blogs.', OLD.status));
+
+DROP TRIGGER IF EXISTS comments_after_insert;
+CREATE TRIGGER comments_after_insert AFTER INSERT ON comments FOR EACH ROW
+  UPDATE stats_counters SET value = value + 1
+  WHERE name IN ('comments.total', CONCAT('comments.', NEW.status));
+
+DROP TRIGGER IF EXISTS comments_after_update;
+CREATE TRIGGER comments_after_update AFTER UPDATE ON comments FOR EACH ROW
+  UPDATE stats_counters SET value = value + IF(name = CONCAT('comments.', NEW.status), 1, -1)
+  WHERE NOT (OLD.status <=> NEW.status)
+    AND name IN (CONCAT('comments.', OLD.status), CONCAT('comments.', NEW.status));
+
+DROP TRIGGER IF EXISTS comments_after_delete;
+CREATE TRIGGER comments_after_delete AFTER DELETE ON comments FOR EACH ROW
+  UPDATE stats_counters SET value = value - 1
+  WHERE name IN ('comments.total', CONCAT('comments.', OLD.status));
+
+DROP TRIGGER IF EXISTS contacts_after_insert;
+CREATE TRIGGER contacts_after_insert AFTER INSERT ON contacts FOR EACH ROW
+  UPDATE stats_counters SET value = value + 1
+  WHERE name IN ('contacts.total', CONCAT('contacts.', NEW.status));
+
+DROP TRIGGER IF EXISTS contacts_after_update;
+CREATE TRIGGER contacts_after_update AFTER UPDATE ON contacts FOR EACH ROW
+  UPDATE stats_counters SET value = value + IF(name = CONCAT('contacts.', NEW.status), 1, -1)
+  WHERE NOT (OLD.status <=> NEW.status)
+    AND name IN (CONCAT('contacts.', OLD.status), CONCAT('contacts.', NEW.status));
+
+DROP TRIGGER IF EXISTS contacts_after_delete;
+CREATE TRIGGER contacts_after_delete AFTER DELETE ON contacts FOR EACH ROW
+  UPDATE stats_counters SET value = value - 1
+  WHERE name IN ('contacts.total', CONCAT('contacts.', OLD.status));
+
+DROP TRIGGER IF EXISTS categories_after_insert;
+CREATE TRIGGER categories_after_insert AFTER INSERT ON categories FOR EACH ROW
+  UPDATE stats_counters SET value = value + 1 WHERE name = 'categories.total';
+
+DROP TRIGGER IF EXISTS categories_after_delete;
+CREATE TRIGGER categories_after_delete AFTER DELETE ON categories FOR EACH ROW
+  UPDATE stats_counters SET value = value - 1 WHERE name = 'categories.total';
+
+DROP TRIGGER IF EXISTS tags_after_insert;
+CREATE TRIGGER tags_after_insert AFTER INSERT ON tags FOR EACH ROW
+  UPDATE stats_counters SET value = value + 1 WHERE name = 'tags.total';
+
+DROP TRIGGER IF EXISTS tags_after_delete;
+CREATE TRIGGER tags_after_delete AFTER DELETE ON tags FOR EACH ROW
+  UPDATE stats_counters SET value = value - 1 WHERE name = 'tags.total';
+
+-- (Re)build the counters from the tables; safe to re-run to reconcile
+INSERT INTO stats_counters (name, value)
+SELECT 'blogs.total', COUNT(*) FROM blogs
+UNION ALL SELECT 'blogs.published', COUNT(*) FROM blogs WHERE status = 'published'
+UNION ALL SELECT 'blogs.draft', COUNT(*) FROM blogs WHERE status = 'draft'
+UNION ALL SELECT 'comments.total', COUNT(*) FROM comments
+UNION ALL SELECT 'comments.pending', COUNT(*) FROM comments WHERE status = 'pending'
+UNION ALL SELECT 'comments.approved', COUNT(*) FROM comments WHERE status = 'approved'
+UNION ALL SELECT 'comments.rejected', COUNT(*) FROM comments WHERE status = 'rejected'
+UNION ALL SELECT 'contacts.total', COUNT(*) FROM contacts
+UNION ALL SELECT 'contacts.new', COUNT(*) FROM contacts WHERE status = 'new'
+UNION ALL SELECT 'contacts.read', COUNT(*) FROM contacts WHERE status = 'read'
+UNION ALL SELECT 'contacts.replied', COUNT(*) FROM contacts WHERE status = 'replied'
+UNION ALL SELECT 'categories.total', COUNT(*) FROM categories
+UNION ALL SELECT 'tags.total', COUNT(*) FROM tags
+ON DUPLICATE KEY UPDATE value = VALUES(value);
@@ -0,0 +1,352 @@
+import mysql from 'mysql2/promise';
+import bcrypt from 'bcryptjs';
+import crypto from 'crypto';
+import { parseArgs } from 'util';
+import { config } from 'dotenv';
+import { fileURLToPath } from 'url';
+import { dirname, join } from 'path';
+
+const __filename = fileURLToPath(import.meta.url);
+const __dirname = dirname(__filename);
+
+config({ path: join(__dirname, '../.env') });
+
+// Synthetic data for scale testing. Every row is derived from (seed, table,
+// index), so the same seed always yields the same rows and growing from 10k to
+// 100k blogs adds exactly the rows a fresh 100k run would have.
+//
+//   node scripts/seed.js --seed 42 --scale 10     # 100k blogs, ~320k comments, 100k contacts
+//   node scripts/seed.js --seed 42 --blogs 1000000
+//   node scripts/seed.js --seed 42 --reset        # delete this seed's rows
+//
+// Seeded rows are recognisable by their slugs (seed<seed>-...) and e-mail
+// domains (@seed<seed>.example), so --reset never touches real content.
+const { values: args } = parseArgs({
+  options: {
+    seed: { type: 'string', default: '1' },
+    scale: { type: 'string', default: '1' },
+    blogs: { type: 'string' },
+    contacts: { type: 'string' },
+    reset: { type: 'boolean', default: false }
+  }
+});
+
+const SEED = parseInt(args.seed) || 0;
+const BLOGS_PER_SCALE = 10000;
+const TARGET_BLOGS = parseInt(args.blogs) || Math.round(parseFloat(args.scale) * BLOGS_PER_SCALE);
+const TARGET_CONTACTS = parseInt(args.contacts) || TARGET_BLOGS;
+
+const AUTHORS = 20;
+const CATEGORIES = 40;
+const TAGS = 400;
+const BLOGS_PER_BATCH = 500;
+const ROWS_PER_INSERT = 1000;
+const MAX_COMMENTS_PER_BLOG = 2000;
+
+const PREFIX = `seed${SEED}`;
+const DOMAIN = `${PREFIX}.example`;
+const START = Date.UTC(2022, 0, 1);
+const SPAN_MS = 3 * 365 * 24 * 3600 * 1000;
+
+// mulberry32, seeded from (seed, table, index)
+const rngFor = (...key) => {
+  let state = crypto.createHash('sha256').update(`${SEED}:${key.join(':')}`).digest().readUInt32LE(0);
+  return () => {
+    state = (state + 0x6D2B79F5) | 0;
+    let t = Math.imul(state ^ (state >>> 15), 1 | state);
+    t = (t + Math.imul(t ^ (t >>> 7), 61 | t)) ^ t;
+    return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+  };
+};
+
+const uuidFor = (...key) => {
+  const hex = crypto.createHash('sha256').update(`${SEED}:${key.join(':')}`).digest('hex');
+  return `${hex.slice(0, 8)}-${hex.slice(8, 12)}-4${hex.slice(13, 16)}-a${hex.slice(17, 20)}-${hex.slice(20, 32)}`;
+};
+
+// Zipf-like sampler over n ranks: rank 0 is the most frequent
+const zipf = (n, exponent = 1.1) => {
+  const cumulative = new Float64Array(n);
+  let total = 0;
+  for (let rank = 0; rank < n; rank++) {
+    total += 1 / Math.pow(rank + 1, exponent);
+    cumulative[rank] = total;
+  }
+  return (rng) => {
+    const target = rng() * total;
+    let low = 0;
+    let high = n - 1;
+    while (low < high) {
+      const mid = (low + high) >> 1;
+      if (cumulative[mid] < target) low = mid + 1;
+      else high = mid;
+    }
+    return low;
+  };
+};
+
+const SYLLABLES = ['ka', 'lo', 'mi', 'ren', 'tas', 'vor', 'quin', 'del', 'sur', 'po', 'zan', 'bri',
+  'ex', 'mol', 'tri', 'nu', 'gal', 'fen', 'hox', 'ul', 'pra', 'sen', 'dor', 'yt'];
+
+const vocabulary = (() => {
+  const rng = rngFor('vocabulary');
+  const words = new Set();
+  while (words.size < 5000) {
+    const length = 2 + Math.floor(rng() * 3);
+    let word = '';
+    for (let i = 0; i < length; i++) word += SYLLABLES[Math.floor(rng() * SYLLABLES.length)];
+    if (word.length >= 4) words.add(word);
+  }
+  return [...words];
+})();
+const pickWord = zipf(vocabulary.length, 1.0);
+const pickCategory = zipf(CATEGORIES);
+const pickTag = zipf(TAGS);
+const pickAuthor = zipf(AUTHORS, 0.8);
+
+const words = (rng, count) => Array.from({ length: count }, () => vocabulary[pickWord(rng)]).join(' ');
+const between = (rng, min, max) => min + Math.floor(rng() * (max - min + 1));
+const timestamp = (ms) => new Date(Math.min(ms, Date.now()));
+const weighted = (rng, options) => {
+  let ticket = rng();
+  for (const [value, weight] of options) {
+    ticket -= weight;
+    if (ticket < 0) return value;
+  }
+  return options[options.length - 1][0];
+};
+
+const authorId = (i) => uuidFor('author', i);
+const categoryId = (i) => uuidFor('category', i);
+const tagId = (i) => uuidFor('tag', i);
+
+const blogRow = (i) => {
+  const rng = rngFor('blog', i);
+  const title = words(rng, between(rng, 4, 9));
+  const status = rng() < 0.9 ? 'published' : 'draft';
+  const createdAt = START + Math.floor(rng() * SPAN_MS);
+  return {
+    createdAt,
+    row: [
+      uuidFor('blog', i),
+      `${title} ${i}`,
+      `${PREFIX}-post-${i}`,
+      `<p>${words(rng, between(rng, 80, 400))}</p>`,
+      words(rng, between(rng, 15, 40)),
+      null,
+      rng() < 0.95 ? categoryId(pickCategory(rng)) : null,
+      status,
+      authorId(pickAuthor(rng)),
+      status === 'published' ? timestamp(createdAt + between(rng, 0, 86400) * 1000) : null,
+      timestamp(createdAt),
+      timestamp(createdAt)
+    ]
+  };
+};
+
+// 0-5 distinct tags, popular ones far more often
+const blogTagRows = (i, blogId) => {
+  const rng = rngFor('blog-tags', i);
+  const tags = new Set();
+  const count = weighted(rng, [[0, 0.1], [1, 0.2], [2, 0.3], [3, 0.2], [4, 0.1], [5, 0.1]]);
+  while (tags.size < count) tags.add(pickTag(rng));
+  return [...tags].map(tag => [blogId, tagId(tag)]);
+};
+
+// Comments per post follow a Pareto tail: most posts get a few, some get hundreds
+const commentRows = (i, blogId, blogCreatedAt) => {
+  const rng = rngFor('comments', i);
+  const count = Math.min(MAX_COMMENTS_PER_BLOG, Math.floor(1.6 / Math.pow(1 - rng(), 1 / 1.5)) - 1);
+  return Array.from({ length: count }, (_, j) => [
+    uuidFor('comment', i, j),
+    blogId,
+    `Reader ${between(rng, 1, 50000)}`,
+    `reader${between(rng, 1, 50000)}@${DOMAIN}`,
+    words(rng, between(rng, 5, 60)),
+    weighted(rng, [['approved', 0.7], ['pending', 0.2], ['rejected', 0.1]]),
+    timestamp(blogCreatedAt + Math.floor(rng() * 60 * 86400 * 1000))
+  ]);
+};
+
+const contactRow = (i) => {
+  const rng = rngFor('contact', i);
+  return [
+    uuidFor('contact', i),
+    `Visitor ${i}`,
+    `visitor${i}@${DOMAIN}`,
+    rng() < 0.8 ? words(rng, between(rng, 2, 8)) : null,
+    words(rng, between(rng, 20, 150)),
+    weighted(rng, [['new', 0.3], ['read', 0.5], ['replied', 0.2]]),
+    timestamp(START + Math.floor(rng() * SPAN_MS))
+  ];
+};
+
+// Multi-row INSERTs of at most ROWS_PER_INSERT rows
+const insertRows = async (connection, table, columns, rows) => {
+  for (let start = 0; start < rows.length; start += ROWS_PER_INSERT) {
+    await connection.query(
+      `INSERT INTO ${table} (${columns.join(', ')}) VALUES ?`,
+      [rows.slice(start, start + ROWS_PER_INSERT)]
+    );
+  }
+};
+
+const progress = (label, done, total, started, from) => {
+  const rate = (done - from) / Math.max((Date.now() - started) / 1000, 0.001);
+  process.stdout.write(`\r  ${label}: ${done}/${total} (${rate.toFixed(0)}/s)   `);
+};
+
+const seedReferenceData = async (connection) => {
+  const [roles] = await connection.execute('SELECT id FROM roles WHERE name = ?', ['editor']);
+  if (roles.length === 0) {
+    throw new Error('Editor role not found. Please run schema.sql first.');
+  }
+
+  // Seeded authors cannot log in with a known password
+  const password = await bcrypt.hash(crypto.randomBytes(16).toString('hex'), 10);
+  await connection.query(
+    'INSERT IGNORE INTO users (id, email, password, role_id, name) VALUES ?',
+    [Array.from({ length: AUTHORS }, (_, i) => [authorId(i), `author${i}@${DOMAIN}`, password, roles[0].id, `Author ${i}`])]
+  );
+  await connection.query(
+    'INSERT IGNORE INTO categories (id, name, slug, description) VALUES ?',
+    [Array.from({ length: CATEGORIES }, (_, i) => {
+      const rng = rngFor('category', i);
+      return [categoryId(i), `${words(rng, 2)} ${i}`, `${PREFIX}-category-${i}`, words(rng, 12)];
+    })]
+  );
+  await connection.query(
+    'INSERT IGNORE INTO tags (id, name, slug) VALUES ?',
+    [Array.from({ length: TAGS }, (_, i) => [tagId(i), `${words(rngFor('tag', i), 1)} ${i}`, `${PREFIX}-tag-${i}`])]
+  );
+};
+
+// Blogs go in batches, each with its tags and comments in one transaction, so
+// an interrupted run resumes from the number of seeded blogs
+const seedBlogs = async (connection) => {
+  const [[{ existing }]] = await connection.execute(
+    'SELECT COUNT(*) AS existing FROM blogs WHERE slug LIKE ?',
+    [`${PREFIX}-post-%`]
+  );
+  if (existing >= TARGET_BLOGS) {
+    console.log(`  blogs: ${existing} already seeded`);
+    return;
+  }
+
+  const started = Date.now();
+  let comments = 0;
+  for (let start = existing; start < TARGET_BLOGS; start += BLOGS_PER_BATCH) {
+    const end = Math.min(start + BLOGS_PER_BATCH, TARGET_BLOGS);
+    const blogs = [];
+    const blogTags = [];
+    const blogComments = [];
+    for (let i = start; i < end; i++) {
+      const { row, createdAt } = blogRow(i);
+      blogs.push(row);
+      blogTags.push(...blogTagRows(i, row[0]));
+      blogComments.push(...commentRows(i, row[0], createdAt));
+    }
+
+    await connection.beginTransaction();
+    try {
+      await insertRows(connection, 'blogs',
+        ['id', 'title', 'slug', 'content', 'excerpt', 'featured_image', 'category_id', 'status', 'author_id',
+          'published_at', 'created_at', 'updated_at'],
+        blogs);
+      await insertRows(connection, 'blog_tags', ['blog_id', 'tag_id'], blogTags);
+      await insertRows(connection, 'comments',
+        ['id', 'blog_id', 'author_name', 'author_email', 'content', 'status', 'created_at'],
+        blogComments);
+      await connection.commit();
+    } catch (error) {
+      await connection.rollback();
+      throw error;
+    }
+
+    comments += blogComments.length;
+    progress('blogs', end, TARGET_BLOGS, started, existing);
+  }
+  console.log(`\n  + ${TARGET_BLOGS - existing} blogs, ${comments} comments`);
+};
+
+const seedContacts = async (connection) => {
+  const [[{ existing }]] = await connection.execute(
+    'SELECT COUNT(*) AS existing FROM contacts WHERE email LIKE ?',
+    [`%@${DOMAIN}`]
+  );
+  if (existing >= TARGET_CONTACTS) {
+    console.log(`  contacts: ${existing} already seeded`);
+    return;
+  }
+
+  const started = Date.now();
+  for (let start = existing; start < TARGET_CONTACTS; start += ROWS_PER_INSERT) {
+    const end = Math.min(start + ROWS_PER_INSERT, TARGET_CONTACTS);
+    const rows = [];
+    for (let i = start; i < end; i++) rows.push(contactRow(i));
+    await insertRows(connection, 'contacts', ['id', 'name', 'email', 'subject', 'message', 'status', 'created_at'], rows);
+    progress('contacts', end, TARGET_CONTACTS, started, existing);
+  }
+  console.log(`\n  + ${TARGET_CONTACTS - existing} contacts`);
+};
+
+// Chunked deletes keep each transaction (and the counter triggers) small
+const deleteChunked = async (connection, sql, params) => {
+  let deleted = 0;
+  for (;;) {
+    const [result] = await connection.execute(`${sql} LIMIT ${ROWS_PER_INSERT}`, params);
+    deleted += result.affectedRows;
+    if (result.affectedRows === 0) return deleted;
+  }
+};
+
+const reset = async (connection) => {
+  console.log(`Deleting rows seeded with seed ${SEED}...`);
+  const blogs = await deleteChunked(connection, 'DELETE FROM blogs WHERE slug LIKE ?', [`${PREFIX}-post-%`]);
+  const contacts = await deleteChunked(connection, 'DELETE FROM contacts WHERE email LIKE ?', [`%@${DOMAIN}`]);
+  await connection.execute('DELETE FROM tags WHERE slug LIKE ?', [`${PREFIX}-tag-%`]);
+  await connection.execute('DELETE FROM categories WHERE slug LIKE ?', [`${PREFIX}-category-%`]);
+  await connection.execute('DELETE FROM users WHERE email LIKE ?', [`%@${DOMAIN}`]);
+  console.log(`✅ Deleted ${blogs} blogs (with their comments) and ${contacts} contacts`);
+};
+
+const seed = async () => {
+  let connection;
+
+  try {
+    connection = await mysql.createConnection({
+      host: process.env.DB_HOST,
+      port: parseInt(process.env.DB_PORT) || 3306,
+      user: process.env.DB_USER,
+      password: process.env.DB_PASSWORD,
+      database: process.env.DB_NAME
+    });
+
+    console.log('Connected to database');
+
+    if (args.reset) {
+      await reset(connection);
+      return;
+    }
+
+    console.log(`🌱 Seed ${SEED}: ${TARGET_BLOGS} blogs, ${TARGET_CONTACTS} contacts`);
+    const started = Date.now();
+    await seedReferenceData(connection);
+    // Generated rows only reference the rows seeded above, so skip foreign key
+    // lookups. Unique checks stay on: an interrupted or overlapping run must
+    // fail on a duplicate slug rather than store it.
+    await connection.query('SET SESSION foreign_key_checks = 0');
+    await seedBlogs(connection);
+    await seedContacts(connection);
+    console.log(`✅ Done in ${((Date.now() - started) / 1000).toFixed(1)}s`);
+  } catch (error) {
+    console.error('❌ Seeding failed:', error.message);
+    process.exitCode = 1;
+  } finally {
+    if (connection) {
+      await connection.end();
+    }
+  }
+};
+
+seed();
@@ -0,0 +1,88 @@
+import cluster from 'cluster';
+import os from 'os';
+import path from 'path';
+import { fileURLToPath } from 'url';
+import { dirname } from 'path';
+import { config } from 'dotenv';
+import { relayWorkerMessages } from './utils/clusterSync.js';
+import { versionEnv } from './utils/contentVersion.js';
+
+const __filename = fileURLToPath(import.meta.url);
+const __dirname = dirname(__filename);
+
+config({ path: path.join(__dirname, '../.env') });
+
+// Forks WEB_CONCURRENCY workers (default: one per core), each running server.js
+// on the shared port, and replaces any that crash.
+const WORKERS = parseInt(process.env.WEB_CONCURRENCY) || os.availableParallelism();
+// Connections one database server may get from all workers together
+const DB_MAX_CONNECTIONS = parseInt(process.env.DB_MAX_CONNECTIONS) || 100;
+const SHUTDOWN_TIMEOUT_MS = parseInt(process.env.SHUTDOWN_TIMEOUT_MS) || 10000;
+// A worker that dies sooner than this after starting counts as a crash loop
+const MIN_UPTIME_MS = 5000;
+const MAX_RESTART_DELAY_MS = 30000;
+
+// Split the connection budget between workers, keeping the configured size
+// whenever it already fits
+const poolSize = (configured) => Math.max(1, Math.min(configured, Math.floor(DB_MAX_CONNECTIONS / WORKERS)));
+const PRIMARY_POOL_SIZE = poolSize(parseInt(process.env.DB_POOL_SIZE) || 10);
+const REPLICA_POOL_SIZE = poolSize(parseInt(process.env.DB_REPLICA_POOL_SIZE) || parseInt(process.env.DB_POOL_SIZE) || 10);
+
+cluster.setupPrimary({ exec: path.join(__dirname, 'server.js') });
+relayWorkerMessages();
+
+let shuttingDown = false;
+let quickExits = 0;
+
+const fork = () => {
+  const worker = cluster.fork({
+    DB_POOL_SIZE: PRIMARY_POOL_SIZE,
+    DB_REPLICA_POOL_SIZE: REPLICA_POOL_SIZE,
+    ...versionEnv()
+  });
+  worker.startedAt = Date.now();
+};
+
+cluster.on('exit', (worker, code, signal) => {
+  if (shuttingDown) return;
+
+  // Back off while workers keep dying on startup (bad config, database down)
+  quickExits = Date.now() - worker.startedAt < MIN_UPTIME_MS ? quickExits + 1 : 0;
+  const delay = Math.min(MAX_RESTART_DELAY_MS, quickExits === 0 ? 0 : 1000 * 2 ** (quickExits - 1));
+  console.error(`⚠️  Worker ${worker.process.pid} exited (${signal || code}), restarting${delay ? ` in ${delay}ms` : ''}`);
+  setTimeout(fork, delay);
+});
+
+// Workers finish in-flight requests and flush buffered writes on SIGTERM;
+// anything still running after the timeout is killed
+const shutdown = (signal) => {
+  if (shuttingDown) return;
+  shuttingDown = true;
+  console.log(`\n${signal} received, stopping ${Object.keys(cluster.workers).length} workers...`);
+
+  const workers = Object.values(cluster.workers);
+  if (workers.length === 0) process.exit(0);
+
+  let running = workers.length;
+  for (const worker of workers) {
+    worker.once('exit', () => {
+      running -= 1;
+      if (running === 0) process.exit(0);
+    });
+    worker.process.kill('SIGTERM');
+  }
+
+  setTimeout(() => {
+    console.error('Workers did not stop in time, killing them');
+    for (const worker of Object.values(cluster.workers)) worker.process.kill('SIGKILL');
+    process.exit(1);
+  }, SHUTDOWN_TIMEOUT_MS + 5000).unref();
+};
+
+process.on('SIGTERM', () => shutdown('SIGTERM'));
+process.on('SIGINT', () => shutdown('SIGINT'));
+
+console.log(`🧵 Starting ${WORKERS} workers, ${PRIMARY_POOL_SIZE} database connections each`);
+for (let i = 0; i < WORKERS; i++) {
+  fork();
+}
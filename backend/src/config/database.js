@@ -1,23 +1,306 @@
 import mysql from 'mysql2/promise';
+import { AsyncLocalStorage } from 'async_hooks';
 import { config } from 'dotenv';
+import {
+  register,
+  Gauge,
+  dbQueryDuration,
+  dbPoolAcquireDuration,
+  dbSlowQueries,
+  statementLabel
+} from '../utils/metrics.js';
 
 config();
 
-const pool = mysql.createPool({
-  host: process.env.DB_HOST,
+const CONNECTION_LIMIT = parseInt(process.env.DB_POOL_SIZE) || 10;
+const SLOW_QUERY_MS = parseInt(process.env.SLOW_QUERY_MS) || 200;
+// Replicas: "host[:port][*weight],..." e.g. "10.0.0.2*2,10.0.0.3:3307"
+const REPLICA_SPECS = (process.env.DB_REPLICAS || '').split(',').map(spec => spec.trim()).filter(Boolean);
+const REPLICA_POOL_SIZE = parseInt(process.env.DB_REPLICA_POOL_SIZE) || CONNECTION_LIMIT;
+const REPLICA_CHECK_MS = parseInt(process.env.DB_REPLICA_CHECK_MS) || 5000;
+const configuredLag = parseInt(process.env.DB_REPLICA_MAX_LAG_S);
+const REPLICA_MAX_LAG_S = Number.isNaN(configuredLag) ? 10 : configuredLag;
+// How long a session keeps reading from the primary after it writes
+const STICKY_MS = parseInt(process.env.DB_STICKY_MS) || 5000;
+// How long after a write a replica still in rotation may return the old rows
+export const REPLICA_SETTLE_MS = Math.max(STICKY_MS, REPLICA_MAX_LAG_S * 1000);
+
+const createPool = ({ host, port, connectionLimit }) => mysql.createPool({
+  host,
+  port,
   user: process.env.DB_USER,
   password: process.env.DB_PASSWORD,
   database: process.env.DB_NAME,
   waitForConnections: true,
-  connectionLimit: 10,
+  connectionLimit,
   queueLimit: 0,
   ssl: process.env.DB_SSL === 'true' || process.env.NODE_ENV === 'production' ? {
     rejectUnauthorized: false // Set to true if you have CA certificate
   } : false
 });
 
+// Per-request query counters, populated when a request runs inside queryStats.run()
+export const queryStats = new AsyncLocalStorage();
+
+// Per-request routing state ({ session, wrote, primary }), set by the readRouting middleware
+export const dbSession = new AsyncLocalStorage();
+
+// Record one statement for /api/metrics, the slow-query log and, inside
+// queryStats.run(), the per-request Server-Timing counters
+const recordQuery = (sqlOrOptions, poolName, ms, stats) => {
+  const statement = statementLabel(sqlOrOptions);
+  dbQueryDuration.observe({ pool: poolName, statement }, ms / 1000);
+
+  if (ms >= SLOW_QUERY_MS) {
+    dbSlowQueries.inc({ statement });
+    const sql = String(typeof sqlOrOptions === 'string' ? sqlOrOptions : sqlOrOptions?.sql).replace(/\s+/g, ' ').trim();
+    console.warn(`🐢 Slow query on ${poolName} (${ms.toFixed(0)}ms): ${sql.slice(0, 300)}`);
+  }
+
+  if (stats) {
+    stats.count += 1;
+    stats.duration += ms;
+  }
+};
+
+const instrument = (target, method, poolName) => {
+  const original = target[method].bind(target);
+  target[method] = async (...args) => {
+    const start = process.hrtime.bigint();
+    try {
+      return await original(...args);
+    } finally {
+      recordQuery(args[0], poolName, Number(process.hrtime.bigint() - start) / 1e6, queryStats.getStore());
+    }
+  };
+};
+
+const poolNames = new Map();
+
+const instrumentPool = (pool, poolName) => {
+  poolNames.set(pool, poolName);
+  instrument(pool, 'execute', poolName);
+  instrument(pool, 'query', poolName);
+
+  // pool.execute/query and getConnection all acquire through the core pool
+  const corePool = pool.pool;
+  const acquire = corePool.getConnection.bind(corePool);
+  corePool.getConnection = (cb) => {
+    const start = process.hrtime.bigint();
+    acquire((err, connection) => {
+      dbPoolAcquireDuration.observe({ pool: poolName }, Number(process.hrtime.bigint() - start) / 1e9);
+      cb(err, connection);
+    });
+  };
+  return pool;
+};
+
+const primary = instrumentPool(createPool({
+  host: process.env.DB_HOST,
+  port: parseInt(process.env.DB_PORT) || 3306,
+  connectionLimit: CONNECTION_LIMIT
+}), 'primary');
+
+const replicas = REPLICA_SPECS.map((spec, index) => {
+  const [address, weight] = spec.split('*');
+  const [host, port] = address.split(':');
+  const name = `replica${index + 1}`;
+  return {
+    name,
+    weight: parseInt(weight) || 1,
+    healthy: false,
+    lagSeconds: null,
+    pool: instrumentPool(createPool({ host, port: parseInt(port) || 3306, connectionLimit: REPLICA_POOL_SIZE }), name)
+  };
+});
+
+// A replica serves reads while it answers and lags less than DB_REPLICA_MAX_LAG_S.
+// Lag is only checked when the user may run SHOW REPLICA/SLAVE STATUS.
+const checkReplica = async (replica) => {
+  try {
+    await replica.pool.query('SELECT 1');
+
+    let status = null;
+    for (const statement of ['SHOW REPLICA STATUS', 'SHOW SLAVE STATUS']) {
+      try {
+        [[status]] = await replica.pool.query(statement);
+        break;
+      } catch (e) {
+        // Older servers only know the SLAVE form; without privileges neither works
+      }
+    }
+
+    const lag = status ? status.Seconds_Behind_Source ?? status.Seconds_Behind_Master : undefined;
+    replica.lagSeconds = lag ?? null;
+    // NULL lag on a configured replica means replication is stopped
+    const healthy = status ? lag !== null && lag <= REPLICA_MAX_LAG_S : true;
+    if (healthy !== replica.healthy) {
+      console.log(`${healthy ? '✅' : '⚠️ '} ${replica.name} ${healthy ? 'serving reads' : `out of rotation (lag ${lag})`}`);
+    }
+    replica.healthy = healthy;
+  } catch (error) {
+    if (replica.healthy) console.error(`⚠️  ${replica.name} out of rotation:`, error.message);
+    replica.healthy = false;
+  }
+};
+
+let healthTimer = null;
+if (replicas.length > 0) {
+  const checkAll = () => Promise.all(replicas.map(checkReplica));
+  checkAll();
+  healthTimer = setInterval(checkAll, REPLICA_CHECK_MS);
+  healthTimer.unref();
+}
+
+// Sessions that wrote recently, session key -> time their stickiness ends
+const stickyUntil = new Map();
+const MAX_STICKY_SESSIONS = 10000;
+
+const markWrite = () => {
+  const store = dbSession.getStore();
+  if (!store) return;
+  store.wrote = true;
+  if (!store.session) return;
+
+  if (stickyUntil.size >= MAX_STICKY_SESSIONS) {
+    const now = Date.now();
+    for (const [session, until] of stickyUntil) {
+      if (until <= now) stickyUntil.delete(session);
+    }
+    if (stickyUntil.size >= MAX_STICKY_SESSIONS) stickyUntil.clear();
+  }
+  stickyUntil.set(store.session, Date.now() + STICKY_MS);
+};
+
+// Send the rest of this request's reads to the primary, whoever the client is:
+// for responses that get cached or versioned right after their content changed
+export const readFromPrimary = () => {
+  const store = dbSession.getStore();
+  if (store) store.primary = true;
+};
+
+const readsFromPrimary = () => {
+  const store = dbSession.getStore();
+  if (!store) return false;
+  if (store.wrote || store.primary) return true;
+  const until = store.session && stickyUntil.get(store.session);
+  return Boolean(until && until > Date.now());
+};
+
+// Weighted random choice among healthy replicas
+const pickReplica = () => {
+  const healthy = replicas.filter(replica => replica.healthy);
+  let ticket = Math.random() * healthy.reduce((sum, replica) => sum + replica.weight, 0);
+  for (const replica of healthy) {
+    ticket -= replica.weight;
+    if (ticket < 0) return replica.pool;
+  }
+  return null;
+};
+
+const isPlainRead = (sql) => {
+  const text = typeof sql === 'string' ? sql : sql?.sql || '';
+  return /^\s*(SELECT|SHOW)\b/i.test(text) && !/\b(FOR\s+UPDATE|LOCK\s+IN\s+SHARE\s+MODE|FOR\s+SHARE)\b/i.test(text);
+};
+
+// Plain reads go to a replica unless the session just wrote; everything else
+// (and every read when no replica is healthy) goes to the primary
+const route = (sql) => {
+  if (!isPlainRead(sql)) {
+    markWrite();
+    return primary;
+  }
+  if (replicas.length === 0 || readsFromPrimary()) return primary;
+  return pickReplica() || primary;
+};
+
+register(new Gauge('cms_db_pool_connections', 'Pool connections by state', ['pool', 'state'], () =>
+  [{ name: 'primary', pool: primary, limit: CONNECTION_LIMIT },
+    ...replicas.map(replica => ({ name: replica.name, pool: replica.pool, limit: REPLICA_POOL_SIZE }))]
+    .flatMap(({ name, pool, limit }) => {
+      // Read from mysql2's pool internals when scraped
+      const corePool = pool.pool;
+      const total = corePool._allConnections?.length ?? 0;
+      const idle = corePool._freeConnections?.length ?? 0;
+      return [
+        { labels: { pool: name, state: 'active' }, value: total - idle },
+        { labels: { pool: name, state: 'idle' }, value: idle },
+        { labels: { pool: name, state: 'queued' }, value: corePool._connectionQueue?.length ?? 0 },
+        { labels: { pool: name, state: 'limit' }, value: limit }
+      ];
+    })
+));
+
+register(new Gauge('cms_db_replica_healthy', 'Whether a replica is serving reads', ['pool'], () =>
+  replicas.map(replica => ({ labels: { pool: replica.name }, value: replica.healthy ? 1 : 0 }))
+));
+
+register(new Gauge('cms_db_replica_lag_seconds', 'Replication lag at the last health check', ['pool'], () =>
+  replicas
+    .filter(replica => replica.lagSeconds !== null)
+    .map(replica => ({ labels: { pool: replica.name }, value: replica.lagSeconds }))
+));
+
+// Run fn(connection) inside a transaction on one pooled primary connection.
+// Commits when fn resolves, rolls back and rethrows when it throws.
+export const withTransaction = async (fn) => {
+  markWrite();
+  const connection = await primary.getConnection();
+  instrument(connection, 'execute', 'primary');
+  instrument(connection, 'query', 'primary');
+
+  try {
+    await connection.beginTransaction();
+    const result = await fn(connection);
+    await connection.commit();
+    return result;
+  } catch (error) {
+    // Keep the original error if the rollback fails too (e.g. connection lost)
+    await connection.rollback().catch(() => {});
+    throw error;
+  } finally {
+    connection.release();
+  }
+};
+
+// Stream the rows of a SELECT in constant memory. The connection returns to
+// the pool when the stream ends; if the consumer stops early it is destroyed
+// instead, since mysql2 cannot cancel a half-read result set. The statement is
+// timed from start until the stream ends or closes.
+export const streamQuery = async (sql, params = []) => {
+  const pool = route(sql);
+  const stats = queryStats.getStore();
+  const connection = await pool.getConnection();
+  const start = process.hrtime.bigint();
+  const rows = connection.connection.query(sql, params).stream({ highWaterMark: 100 });
+
+  let ended = false;
+  let recorded = false;
+  const record = () => {
+    if (recorded) return;
+    recorded = true;
+    recordQuery(sql, poolNames.get(pool), Number(process.hrtime.bigint() - start) / 1e6, stats);
+  };
+  rows.once('end', () => {
+    ended = true;
+    record();
+    connection.release();
+  });
+  rows.once('close', () => {
+    record();
+    if (!ended) connection.destroy();
+  });
+  return rows;
+};
+
+// Close every pool once in-flight queries finish (graceful shutdown)
+export const closePools = async () => {
+  clearInterval(healthTimer);
+  await Promise.all([primary, ...replicas.map(replica => replica.pool)].map(pool => pool.end()));
+};
+
 // Test connection
-pool.getConnection()
+primary.getConnection()
   .then(connection => {
     console.log('✅ Database connected successfully');
     connection.release();
@@ -26,4 +309,15 @@ pool.getConnection()
     console.error('❌ Database connection failed:', err.message);
   });
 
-export default pool;
+// Drop-in for the pool: execute/query are routed, getConnection is always the primary
+const db = {
+  execute: (sql, params) => route(sql).execute(sql, params),
+  query: (sql, params) => route(sql).query(sql, params),
+  getConnection: () => {
+    markWrite();
+    return primary.getConnection();
+  },
+  pool: primary.pool
+};
+
+export default db;
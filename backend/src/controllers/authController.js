@@ -1,6 +1,8 @@
-import bcrypt from 'bcryptjs';
 import jwt from 'jsonwebtoken';
 import db from '../config/database.js';
+import { invalidateUser } from '../middleware/auth.js';
+import { verifyPassword } from '../utils/passwords.js';
+import { PoolBusyError } from '../utils/workerPool.js';
 
 export const login = async (req, res) => {
   try {
@@ -18,15 +20,15 @@ export const login = async (req, res) => {
        WHERE u.email = ?`,
       [email]
     );
-    console.log(users);
+
     if (users.length === 0) {
       return res.status(401).json({ error: 'Invalid credentials' });
     }
 
     const user = users[0];
 
-    // Check password
-    const isValidPassword = await bcrypt.compare(password, user.password);
+    // Check password (on the password worker pool, off the event loop)
+    const isValidPassword = await verifyPassword(password, user.password);
     if (!isValidPassword) {
       return res.status(401).json({ error: 'Invalid credentials' });
     }
@@ -46,6 +48,10 @@ export const login = async (req, res) => {
       user
     });
   } catch (error) {
+    if (error instanceof PoolBusyError) {
+      res.set('Retry-After', '1');
+      return res.status(error.status).json({ error: error.message });
+    }
     console.error('Login error:', error);
     res.status(500).json({ error: 'Login failed' });
   }
@@ -63,6 +69,8 @@ export const getMe = async (req, res) => {
 export const logout = async (req, res) => {
   try {
     // In a production app, you might want to blacklist the token
+    invalidateUser(req.user.id);
+
     res.json({ message: 'Logged out successfully' });
   } catch (error) {
     console.error('Logout error:', error);
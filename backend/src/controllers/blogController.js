@@ -1,11 +1,147 @@
 import crypto from 'crypto';
-import db from '../config/database.js';
-import { generateSlug, paginate } from '../utils/helpers.js';
+import db, { withTransaction } from '../config/database.js';
+import {
+  generateSlug,
+  paginate,
+  parseLimit,
+  decodeCursor,
+  afterCursor,
+  keysetPage,
+  cachedCount,
+  clearCountCache,
+  encodeScoreCursor,
+  decodeScoreCursor,
+  searchTerms,
+  highlight
+} from '../utils/helpers.js';
+import { responseCache, sendJson } from '../utils/responseCache.js';
+import { bumpVersion } from '../utils/contentVersion.js';
+import { imageHash, queueImageVariants, loadImageVariants } from '../utils/images.js';
+import { revalidatePages } from '../utils/revalidate.js';
+
+// Load tags for many blogs in one query and attach them as blog.tags
+const attachTags = async (blogs) => {
+  if (blogs.length === 0) return blogs;
+
+  const placeholders = blogs.map(() => '?').join(', ');
+  const [rows] = await db.execute(
+    `SELECT bt.blog_id, t.id, t.name, t.slug
+     FROM tags t
+     JOIN blog_tags bt ON t.id = bt.tag_id
+     WHERE bt.blog_id IN (${placeholders})`,
+    blogs.map(blog => blog.id)
+  );
+
+  const tagsByBlog = new Map();
+  for (const { blog_id, ...tag } of rows) {
+    if (!tagsByBlog.has(blog_id)) tagsByBlog.set(blog_id, []);
+    tagsByBlog.get(blog_id).push(tag);
+  }
+
+  for (const blog of blogs) {
+    blog.tags = tagsByBlog.get(blog.id) || [];
+  }
+  return blogs;
+};
+
+// Attach resized WebP/AVIF copies of each featured image as blog.featured_image_variants
+const attachImageVariants = async (blogs) => {
+  const hashes = [...new Set(blogs.map(blog => imageHash(blog.featured_image)).filter(Boolean))];
+  const variantsByHash = await loadImageVariants(hashes);
+
+  for (const blog of blogs) {
+    blog.featured_image_variants = variantsByHash.get(imageHash(blog.featured_image)) || [];
+  }
+  return blogs;
+};
+
+// Tag ids from a JSON body or a form-data JSON string, without duplicates
+const parseTagIds = (tags) => {
+  if (typeof tags === 'string') {
+    try {
+      tags = JSON.parse(tags);
+    } catch (e) {
+      tags = [];
+    }
+  }
+  return Array.isArray(tags) ? [...new Set(tags)] : [];
+};
+
+// Make a blog's tags exactly tagIds with at most one DELETE and one multi-row
+// INSERT, whatever the number of tags. Runs on the caller's transaction.
+const syncBlogTags = async (connection, blogId, tagIds, { isNew = false } = {}) => {
+  let current = [];
+  if (!isNew) {
+    const [rows] = await connection.execute(
+      'SELECT tag_id FROM blog_tags WHERE blog_id = ? FOR UPDATE',
+      [blogId]
+    );
+    current = rows.map(row => row.tag_id);
+  }
+
+  const wanted = new Set(tagIds);
+  const removed = current.filter(tagId => !wanted.has(tagId));
+  const added = tagIds.filter(tagId => !current.includes(tagId));
+
+  if (removed.length > 0) {
+    await connection.execute(
+      `DELETE FROM blog_tags WHERE blog_id = ? AND tag_id IN (${removed.map(() => '?').join(', ')})`,
+      [blogId, ...removed]
+    );
+  }
+  if (added.length > 0) {
+    await connection.execute(
+      `INSERT INTO blog_tags (blog_id, tag_id) VALUES ${added.map(() => '(?, ?)').join(', ')}`,
+      added.flatMap(tagId => [blogId, tagId])
+    );
+  }
+};
+
+// Cache tags for a response containing these blogs
+const blogCacheTags = (blogs) => {
+  const tags = new Set();
+  for (const blog of blogs) {
+    tags.add(`blog:${blog.id}`);
+    if (blog.category_id) tags.add(`category:${blog.category_id}`);
+    if (imageHash(blog.featured_image)) tags.add(`image:${imageHash(blog.featured_image)}`);
+    for (const tag of blog.tags || []) tags.add(`tag:${tag.id}`);
+  }
+  return [...tags];
+};
 
 export const getAllBlogs = async (req, res) => {
   try {
-    const { page = 1, limit = 10, status, category } = req.query;
-    const { limit: queryLimit, offset } = paginate(page, limit);
+    const { page = 1, limit = 10, status, category, cursor, include_total } = req.query;
+
+    // Only public (published) listings are cached; admin views always read through
+    const cacheKey = status === 'published'
+      ? `blogs:${JSON.stringify([page, limit, category, cursor, include_total])}`
+      : null;
+    if (cacheKey) {
+      const cached = responseCache.get(cacheKey);
+      if (cached) return sendJson(res, cached, 'HIT');
+    }
+
+    let after = null;
+    if (cursor) {
+      after = decodeCursor(cursor);
+      if (!after) {
+        return res.status(400).json({ error: 'Invalid cursor' });
+      }
+    }
+
+    let filters = '';
+    const params = [];
+
+    if (status) {
+      filters += ' AND b.status = ?';
+      params.push(status);
+    }
+
+    if (category) {
+      filters += ' AND c.slug = ?';
+      params.push(category);
+    }
 
     let query = `
       SELECT b.*, c.name as category_name, c.slug as category_slug,
@@ -13,60 +149,136 @@ export const getAllBlogs = async (req, res) => {
       FROM blogs b
       LEFT JOIN categories c ON b.category_id = c.id
       LEFT JOIN users u ON b.author_id = u.id
-      WHERE 1=1
+      WHERE 1=1${filters}
     `;
-    const params = [];
+    const queryParams = [...params];
+
+    // Cursor requests seek past the last row seen; page requests keep the OFFSET behaviour
+    let queryLimit;
+    if (after) {
+      queryLimit = parseLimit(limit);
+      const { clause, params: cursorParams } = afterCursor(after, 'b.');
+      query += clause;
+      queryParams.push(...cursorParams);
+      query += ` ORDER BY b.created_at DESC, b.id DESC LIMIT ${queryLimit + 1}`;
+    } else {
+      const { limit: pageLimit, offset } = paginate(page, limit);
+      queryLimit = Number.isFinite(pageLimit) ? pageLimit : 10;
+      const offsetValue = Number.isFinite(offset) ? offset : 0;
+      query += ` ORDER BY b.created_at DESC, b.id DESC LIMIT ${queryLimit + 1} OFFSET ${offsetValue}`;
+    }
 
-    if (status) {
-      query += ' AND b.status = ?';
-      params.push(status);
+    const [rows] = await db.execute(query, queryParams);
+    const { rows: blogs, nextCursor } = keysetPage(rows, queryLimit);
+
+    await Promise.all([attachTags(blogs), attachImageVariants(blogs)]);
+
+    const pagination = { limit: queryLimit, nextCursor };
+
+    // Totals are cached briefly; cursor clients only pay for them on request
+    if (!after || include_total === 'true') {
+      const total = await cachedCount(`blogs:${status || ''}:${category || ''}`, async () => {
+        const [countResult] = await db.execute(
+          `SELECT COUNT(*) as total
+           FROM blogs b
+           ${category ? 'JOIN categories c ON b.category_id = c.id' : ''}
+           WHERE 1=1${filters}`,
+          params
+        );
+        return countResult[0].total;
+      });
+      pagination.total = total;
+      pagination.totalPages = Math.ceil(total / queryLimit);
     }
 
-    if (category) {
-      query += ' AND c.slug = ?';
-      params.push(category);
+    if (!after) {
+      pagination.page = parseInt(page);
     }
 
-    const limitValue = Number.isFinite(queryLimit) ? queryLimit : 10;
-    const offsetValue = Number.isFinite(offset) ? offset : 0;
-    query += ` ORDER BY b.created_at DESC LIMIT ${limitValue} OFFSET ${offsetValue}`;
+    const body = JSON.stringify({ blogs, pagination });
+    if (cacheKey) {
+      responseCache.set(cacheKey, body, ['blogs:list', ...blogCacheTags(blogs)]);
+    }
+    sendJson(res, body, cacheKey ? 'MISS' : 'BYPASS');
+  } catch (error) {
+    console.error('Get blogs error:', error);
+    res.status(500).json({ error: 'Failed to fetch blogs' });
+  }
+};
+
+export const searchBlogs = async (req, res) => {
+  try {
+    const { q = '', limit, cursor } = req.query;
+    const query = String(q).trim();
+    const terms = searchTerms(query);
 
-    const [blogs] = await db.execute(query, params);
+    if (terms.length === 0) {
+      return res.status(400).json({ error: 'Search query must contain a word of at least 3 characters' });
+    }
 
-    // Get tags for each blog
-    for (let blog of blogs) {
-      const [tags] = await db.execute(
-        `SELECT t.id, t.name, t.slug 
-         FROM tags t
-         JOIN blog_tags bt ON t.id = bt.tag_id
-         WHERE bt.blog_id = ?`,
-        [blog.id]
-      );
-      blog.tags = tags;
+    let after = null;
+    if (cursor) {
+      after = decodeScoreCursor(cursor);
+      if (!after) {
+        return res.status(400).json({ error: 'Invalid cursor' });
+      }
     }
 
-    // Get total count
-    let countQuery = 'SELECT COUNT(*) as total FROM blogs WHERE 1=1';
-    const countParams = [];
-    if (status) {
-      countQuery += ' AND status = ?';
-      countParams.push(status);
+    const queryLimit = parseLimit(limit);
+    const cacheKey = `search:${JSON.stringify([query, queryLimit, cursor])}`;
+    const cached = responseCache.get(cacheKey);
+    if (cached) return sendJson(res, cached, 'HIT');
+
+    // Rank by relevance, then id, so the (score, id) cursor is a strict order
+    const params = [query, query];
+    let having = '';
+    if (after) {
+      having = 'HAVING score < ? OR (score = ? AND id < ?)';
+      params.push(after.score, after.score, after.id);
     }
-    const [countResult] = await db.execute(countQuery, countParams);
-    const total = countResult[0].total;
 
-    res.json({
-      blogs,
+    const [rows] = await db.execute(
+      `SELECT b.id, b.title, b.slug, b.excerpt, b.content, b.featured_image, b.category_id, b.published_at, b.created_at,
+              c.name as category_name, c.slug as category_slug, u.name as author_name,
+              MATCH(b.title, b.excerpt, b.content) AGAINST (? IN NATURAL LANGUAGE MODE) as score
+       FROM blogs b
+       LEFT JOIN categories c ON b.category_id = c.id
+       LEFT JOIN users u ON b.author_id = u.id
+       WHERE b.status = 'published'
+         AND MATCH(b.title, b.excerpt, b.content) AGAINST (? IN NATURAL LANGUAGE MODE)
+       ${having}
+       ORDER BY score DESC, b.id DESC
+       LIMIT ${queryLimit + 1}`,
+      params
+    );
+
+    const hasMore = rows.length > queryLimit;
+    const page = hasMore ? rows.slice(0, queryLimit) : rows;
+    await attachImageVariants(page);
+
+    const results = page.map(({ content, ...blog }) => ({
+      ...blog,
+      highlight: {
+        title: highlight(blog.title, terms, blog.title.length),
+        snippet: highlight(`${blog.excerpt || ''} ${content}`, terms)
+      }
+    }));
+
+    const last = page[page.length - 1];
+    const body = JSON.stringify({
+      query,
+      results,
       pagination: {
-        page: parseInt(page),
         limit: queryLimit,
-        total,
-        totalPages: Math.ceil(total / queryLimit)
+        nextCursor: hasMore ? encodeScoreCursor(last.score, last.id) : null
       }
     });
+
+    responseCache.set(cacheKey, body, ['blogs:list', ...blogCacheTags(page)]);
+    sendJson(res, body, 'MISS');
   } catch (error) {
-    console.error('Get blogs error:', error);
-    res.status(500).json({ error: 'Failed to fetch blogs' });
+    console.error('Search blogs error:', error);
+    res.status(500).json({ error: 'Failed to search blogs' });
   }
 };
 
@@ -74,6 +286,10 @@ export const getBlogBySlug = async (req, res) => {
   try {
     const { slug } = req.params;
 
+    const cacheKey = `slug:${slug}`;
+    const cached = responseCache.get(cacheKey);
+    if (cached) return sendJson(res, cached, 'HIT');
+
     const [blogs] = await db.execute(
       `SELECT b.*, c.name as category_name, c.slug as category_slug,
               u.name as author_name, u.email as author_email
@@ -90,15 +306,7 @@ export const getBlogBySlug = async (req, res) => {
 
     const blog = blogs[0];
 
-    // Get tags
-    const [tags] = await db.execute(
-      `SELECT t.id, t.name, t.slug 
-       FROM tags t
-       JOIN blog_tags bt ON t.id = bt.tag_id
-       WHERE bt.blog_id = ?`,
-      [blog.id]
-    );
-    blog.tags = tags;
+    await Promise.all([attachTags([blog]), attachImageVariants([blog])]);
 
     // Get approved comments
     const [comments] = await db.execute(
@@ -110,7 +318,11 @@ export const getBlogBySlug = async (req, res) => {
     );
     blog.comments = comments;
 
-    res.json(blog);
+    const body = JSON.stringify(blog);
+    if (blog.status === 'published') {
+      responseCache.set(cacheKey, body, [`comments:${blog.id}`, ...blogCacheTags([blog])]);
+    }
+    sendJson(res, body, blog.status === 'published' ? 'MISS' : 'BYPASS');
   } catch (error) {
     console.error('Get blog error:', error);
     res.status(500).json({ error: 'Failed to fetch blog' });
@@ -119,40 +331,32 @@ export const getBlogBySlug = async (req, res) => {
 
 export const createBlog = async (req, res) => {
   try {
-    let { title, content, excerpt, category_id, status = 'draft', tags = [] } = req.body;
+    const { title, content, excerpt, category_id, status = 'draft', tags = [] } = req.body;
     const featured_image = req.file ? `/uploads/${req.file.filename}` : null;
 
     if (!title || !content) {
       return res.status(400).json({ error: 'Title and content are required' });
     }
 
-    // Parse tags if it's a JSON string (from form-data)
-    if (typeof tags === 'string') {
-      try {
-        tags = JSON.parse(tags);
-      } catch (e) {
-        tags = [];
-      }
-    }
-
     const slug = generateSlug(title);
     const blogId = crypto.randomUUID();
     const published_at = status === 'published' ? new Date() : null;
 
-    await db.execute(
-      `INSERT INTO blogs (id, title, slug, content, excerpt, featured_image, category_id, status, author_id, published_at)
-       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)`,
-      [blogId, title, slug, content, excerpt, featured_image, category_id || null, status, req.user.id, published_at]
-    );
+    await withTransaction(async (connection) => {
+      await connection.execute(
+        `INSERT INTO blogs (id, title, slug, content, excerpt, featured_image, category_id, status, author_id, published_at)
+         VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)`,
+        [blogId, title, slug, content, excerpt, featured_image, category_id || null, status, req.user.id, published_at]
+      );
+      await syncBlogTags(connection, blogId, parseTagIds(tags), { isNew: true });
+    });
 
-    // Add tags
-    if (Array.isArray(tags) && tags.length > 0) {
-      for (const tagId of tags) {
-        await db.execute(
-          'INSERT INTO blog_tags (blog_id, tag_id) VALUES (?, ?)',
-          [blogId, tagId]
-        );
-      }
+    queueImageVariants(req.file);
+    clearCountCache('blogs:');
+    responseCache.invalidate('blogs:list');
+    bumpVersion('blogs');
+    if (status === 'published') {
+      revalidatePages({ slugs: [slug], list: true });
     }
 
     res.status(201).json({ message: 'Blog created successfully', id: blogId, slug });
@@ -171,74 +375,69 @@ export const updateBlog = async (req, res) => {
     const { title, content, excerpt, category_id, status, tags = [] } = req.body;
     const featured_image = req.file ? `/uploads/${req.file.filename}` : undefined;
 
-    // Check if blog exists
-    const [existing] = await db.execute('SELECT id, status as old_status FROM blogs WHERE id = ?', [id]);
-    if (existing.length === 0) {
-      return res.status(404).json({ error: 'Blog not found' });
-    }
-
-    const updates = [];
-    const params = [];
-
-    if (title) {
-      updates.push('title = ?', 'slug = ?');
-      params.push(title, generateSlug(title));
-    }
-    if (content) {
-      updates.push('content = ?');
-      params.push(content);
-    }
-    if (excerpt !== undefined) {
-      updates.push('excerpt = ?');
-      params.push(excerpt);
-    }
-    if (featured_image) {
-      updates.push('featured_image = ?');
-      params.push(featured_image);
-    }
-    if (category_id !== undefined) {
-      updates.push('category_id = ?');
-      params.push(category_id || null);
-    }
-    if (status) {
-      updates.push('status = ?');
-      params.push(status);
-      // Set published_at if status changed to published
-      if (status === 'published' && existing[0].old_status !== 'published') {
-        updates.push('published_at = ?');
-        params.push(new Date());
+    // Slugs the post was and is reachable under, null when it does not exist
+    const slugs = await withTransaction(async (connection) => {
+      // Check if blog exists
+      const [existing] = await connection.execute('SELECT id, slug, status as old_status FROM blogs WHERE id = ? FOR UPDATE', [id]);
+      if (existing.length === 0) {
+        return null;
       }
-    }
 
-    if (updates.length > 0) {
-      params.push(id);
-      await db.execute(
-        `UPDATE blogs SET ${updates.join(', ')} WHERE id = ?`,
-        params
-      );
-    }
+      const updates = [];
+      const params = [];
 
-    // Parse tags if it's a JSON string
-    let tagIds = tags;
-    if (typeof tagIds === 'string') {
-      try {
-        tagIds = JSON.parse(tagIds);
-      } catch (e) {
-        tagIds = [];
+      if (title) {
+        updates.push('title = ?', 'slug = ?');
+        params.push(title, generateSlug(title));
+      }
+      if (content) {
+        updates.push('content = ?');
+        params.push(content);
+      }
+      if (excerpt !== undefined) {
+        updates.push('excerpt = ?');
+        params.push(excerpt);
+      }
+      if (featured_image) {
+        updates.push('featured_image = ?');
+        params.push(featured_image);
+      }
+      if (category_id !== undefined) {
+        updates.push('category_id = ?');
+        params.push(category_id || null);
+      }
+      if (status) {
+        updates.push('status = ?');
+        params.push(status);
+        // Set published_at if status changed to published
+        if (status === 'published' && existing[0].old_status !== 'published') {
+          updates.push('published_at = ?');
+          params.push(new Date());
+        }
       }
-    }
-
-    await db.execute('DELETE FROM blog_tags WHERE blog_id = ?', [id]);
 
-    if (Array.isArray(tagIds) && tagIds.length > 0) {
-      for (const tagId of tagIds) {
-        await db.execute(
-          'INSERT INTO blog_tags (blog_id, tag_id) VALUES (?, ?)',
-          [id, tagId]
+      if (updates.length > 0) {
+        params.push(id);
+        await connection.execute(
+          `UPDATE blogs SET ${updates.join(', ')} WHERE id = ?`,
+          params
         );
       }
+
+      await syncBlogTags(connection, id, parseTagIds(tags));
+      return [existing[0].slug, title ? generateSlug(title) : null];
+    });
+
+    if (!slugs) {
+      return res.status(404).json({ error: 'Blog not found' });
     }
 
+    queueImageVariants(req.file);
+    clearCountCache('blogs:');
+    responseCache.invalidate(`blog:${id}`, 'blogs:list');
+    bumpVersion('blogs');
+    revalidatePages({ slugs, list: true });
+
     res.json({ message: 'Blog updated successfully' });
   } catch (error) {
     console.error('Update blog error:', error);
@@ -250,12 +449,18 @@ export const deleteBlog = async (req, res) => {
   try {
     const { id } = req.params;
 
+    const [existing] = await db.execute('SELECT slug FROM blogs WHERE id = ?', [id]);
     const [result] = await db.execute('DELETE FROM blogs WHERE id = ?', [id]);
 
     if (result.affectedRows === 0) {
       return res.status(404).json({ error: 'Blog not found' });
     }
 
+    clearCountCache('blogs:');
+    responseCache.invalidate(`blog:${id}`, 'blogs:list');
+    bumpVersion('blogs');
+    revalidatePages({ slugs: existing.map(row => row.slug), list: true });
+
     res.json({ message: 'Blog deleted successfully' });
   } catch (error) {
     console.error('Delete blog error:', error);
@@ -1,6 +1,9 @@
 import crypto from 'crypto';
 import db from '../config/database.js';
 import { generateSlug } from '../utils/helpers.js';
+import { responseCache } from '../utils/responseCache.js';
+import { bumpVersion } from '../utils/contentVersion.js';
+import { revalidatePages } from '../utils/revalidate.js';
 
 
 export const getAllCategories = async (req, res) => {
@@ -31,6 +34,8 @@ export const createCategory = async (req, res) => {
       [categoryId, name, slug, description]
     );
 
+    bumpVersion('categories');
+
     res.status(201).json({ message: 'Category created successfully', id: categoryId });
   } catch (error) {
     console.error('Create category error:', error);
@@ -72,6 +77,10 @@ export const updateCategory = async (req, res) => {
       return res.status(404).json({ error: 'Category not found' });
     }
 
+    responseCache.invalidate(`category:${id}`);
+    bumpVersion('categories', 'blogs');
+    revalidatePages({ all: true });
+
     res.json({ message: 'Category updated successfully' });
   } catch (error) {
     console.error('Update category error:', error);
@@ -89,6 +98,10 @@ export const deleteCategory = async (req, res) => {
       return res.status(404).json({ error: 'Category not found' });
     }
 
+    responseCache.invalidate(`category:${id}`);
+    bumpVersion('categories', 'blogs');
+    revalidatePages({ all: true });
+
     res.json({ message: 'Category deleted successfully' });
   } catch (error) {
     console.error('Delete category error:', error);
@@ -124,6 +137,8 @@ export const createTag = async (req, res) => {
       [tagId, name, slug]
     );
 
+    bumpVersion('tags');
+
     res.status(201).json({ message: 'Tag created successfully', id: tagId });
   } catch (error) {
     console.error('Create tag error:', error);
@@ -144,6 +159,10 @@ export const deleteTag = async (req, res) => {
       return res.status(404).json({ error: 'Tag not found' });
     }
 
+    responseCache.invalidate(`tag:${id}`);
+    bumpVersion('tags', 'blogs');
+    revalidatePages({ all: true });
+
     res.json({ message: 'Tag deleted successfully' });
   } catch (error) {
     console.error('Delete tag error:', error);
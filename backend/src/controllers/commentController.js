@@ -1,37 +1,148 @@
 import crypto from 'crypto';
-import db from '../config/database.js';
+import db, { streamQuery } from '../config/database.js';
+import {
+  parseLimit,
+  decodeCursor,
+  afterCursor,
+  keysetPage,
+  cachedCount,
+  clearCountCache
+} from '../utils/helpers.js';
+import { responseCache } from '../utils/responseCache.js';
+import { bumpVersion } from '../utils/contentVersion.js';
+import { sendRows } from '../utils/stream.js';
+import { parseBulkTarget, bulkModerate, bulkSummary } from '../utils/bulk.js';
+import { WriteBuffer, WriteError } from '../utils/writeBuffer.js';
+import { revalidatePages } from '../utils/revalidate.js';
+
+const STATUSES = ['pending', 'approved', 'rejected'];
+const BULK_FILTERS = ['status', 'blog_id'];
+const EXPORT_FORMATS = ['csv', 'ndjson'];
+const EXPORT_COLUMNS = ['id', 'blog_id', 'blog_title', 'author_name', 'author_email', 'content', 'status', 'created_at'];
 
 export const getAllComments = async (req, res) => {
   try {
-    const { status, blog_id } = req.query;
-    let query = `
-      SELECT c.*, b.title as blog_title, b.slug as blog_slug
-      FROM comments c
-      JOIN blogs b ON c.blog_id = b.id
-      WHERE 1=1
-    `;
+    const { status, blog_id, cursor, limit, include_total } = req.query;
+    // Without cursor/limit the full list is returned as a plain array, as before
+    const paged = cursor !== undefined || limit !== undefined;
+
+    let after = null;
+    if (cursor) {
+      after = decodeCursor(cursor);
+      if (!after) {
+        return res.status(400).json({ error: 'Invalid cursor' });
+      }
+    }
+
+    let filters = '';
     const params = [];
 
     if (status) {
-      query += ' AND c.status = ?';
+      filters += ' AND c.status = ?';
       params.push(status);
     }
 
     if (blog_id) {
-      query += ' AND c.blog_id = ?';
+      filters += ' AND c.blog_id = ?';
       params.push(blog_id);
     }
 
-    query += ' ORDER BY c.created_at DESC';
+    let query = `
+      SELECT c.*, b.title as blog_title, b.slug as blog_slug
+      FROM comments c
+      JOIN blogs b ON c.blog_id = b.id
+      WHERE 1=1${filters}
+    `;
+    const queryParams = [...params];
+
+    if (after) {
+      const { clause, params: cursorParams } = afterCursor(after, 'c.');
+      query += clause;
+      queryParams.push(...cursorParams);
+    }
+
+    query += ' ORDER BY c.created_at DESC, c.id DESC';
+
+    if (!paged) {
+      await sendRows(res, await streamQuery(query, queryParams), 'json');
+      return;
+    }
+
+    const queryLimit = parseLimit(limit, 50);
+    query += ` LIMIT ${queryLimit + 1}`;
 
-    const [comments] = await db.execute(query, params);
-    res.json(comments);
+    const [rows] = await db.execute(query, queryParams);
+    const { rows: comments, nextCursor } = keysetPage(rows, queryLimit);
+    const pagination = { limit: queryLimit, nextCursor };
+
+    if (include_total === 'true') {
+      pagination.total = await cachedCount(`comments:${status || ''}:${blog_id || ''}`, async () => {
+        const [countResult] = await db.execute(
+          `SELECT COUNT(*) as total FROM comments c WHERE 1=1${filters}`,
+          params
+        );
+        return countResult[0].total;
+      });
+    }
+
+    res.json({ comments, pagination });
   } catch (error) {
     console.error('Get comments error:', error);
     res.status(500).json({ error: 'Failed to fetch comments' });
   }
 };
 
+export const exportComments = async (req, res) => {
+  try {
+    const { status, blog_id, format = 'csv' } = req.query;
+
+    if (!EXPORT_FORMATS.includes(format)) {
+      return res.status(400).json({ error: 'Format must be csv or ndjson' });
+    }
+
+    let filters = '';
+    const params = [];
+    if (status) {
+      filters += ' AND c.status = ?';
+      params.push(status);
+    }
+    if (blog_id) {
+      filters += ' AND c.blog_id = ?';
+      params.push(blog_id);
+    }
+
+    const rows = await streamQuery(
+      `SELECT c.id, c.blog_id, b.title as blog_title, c.author_name, c.author_email, c.content, c.status, c.created_at
+       FROM comments c
+       JOIN blogs b ON c.blog_id = b.id
+       WHERE 1=1${filters}
+       ORDER BY c.created_at DESC, c.id DESC`,
+      params
+    );
+    await sendRows(res, rows, format, { columns: EXPORT_COLUMNS, filename: 'comments' });
+  } catch (error) {
+    console.error('Export comments error:', error);
+    res.status(500).json({ error: 'Failed to export comments' });
+  }
+};
+
+// Public submissions are coalesced into multi-row INSERTs
+const commentWrites = new WriteBuffer({
+  table: 'comments',
+  columns: ['id', 'blog_id', 'author_name', 'author_email', 'content'],
+  // One existence check per batch instead of one per submission
+  validate: async (rows) => {
+    const blogIds = [...new Set(rows.map(row => row.blog_id))];
+    const [blogs] = await db.execute(
+      `SELECT id FROM blogs WHERE status = 'published' AND id IN (${blogIds.map(() => '?').join(', ')})`,
+      blogIds
+    );
+    const published = new Set(blogs.map(blog => blog.id));
+    return rows.map(row => (published.has(row.blog_id) ? null : new WriteError('Blog not found', 404)));
+  },
+  afterFlush: () => clearCountCache('comments:')
+});
+
 export const createComment = async (req, res) => {
   try {
     const { blog_id, author_name, author_email, content } = req.body;
@@ -40,21 +151,15 @@ export const createComment = async (req, res) => {
       return res.status(400).json({ error: 'All fields are required' });
     }
 
-    // Check if blog exists
-    const [blogs] = await db.execute('SELECT id FROM blogs WHERE id = ? AND status = "published"', [blog_id]);
-    if (blogs.length === 0) {
-      return res.status(404).json({ error: 'Blog not found' });
-    }
-
     const commentId = crypto.randomUUID();
-
-    await db.execute(
-      'INSERT INTO comments (id, blog_id, author_name, author_email, content) VALUES (?, ?, ?, ?, ?)',
-      [commentId, blog_id, author_name, author_email, content]
-    );
+    await commentWrites.add({ id: commentId, blog_id, author_name, author_email, content });
 
     res.status(201).json({ message: 'Comment submitted for moderation', id: commentId });
   } catch (error) {
+    if (error instanceof WriteError && error.status !== 500) {
+      if (error.status === 503) res.set('Retry-After', '1');
+      return res.status(error.status).json({ error: error.message });
+    }
     console.error('Create comment error:', error);
     res.status(500).json({ error: 'Failed to create comment' });
   }
@@ -65,17 +170,25 @@ export const updateCommentStatus = async (req, res) => {
     const { id } = req.params;
     const { status } = req.body;
 
-    if (!['pending', 'approved', 'rejected'].includes(status)) {
+    if (!STATUSES.includes(status)) {
       return res.status(400).json({ error: 'Invalid status' });
     }
 
-    const [result] = await db.execute(
+    const [existing] = await db.execute('SELECT blog_id, status FROM comments WHERE id = ?', [id]);
+    if (existing.length === 0) {
+      return res.status(404).json({ error: 'Comment not found' });
+    }
+
+    await db.execute(
       'UPDATE comments SET status = ? WHERE id = ?',
       [status, id]
     );
 
-    if (result.affectedRows === 0) {
-      return res.status(404).json({ error: 'Comment not found' });
+    clearCountCache('comments:');
+    responseCache.invalidate(`comments:${existing[0].blog_id}`);
+    bumpVersion('comments');
+    if (showsOnPage(existing[0].status, status)) {
+      revalidatePages({ blogIds: [existing[0].blog_id] });
     }
 
     res.json({ message: 'Comment status updated successfully' });
@@ -89,15 +202,75 @@ export const deleteComment = async (req, res) => {
   try {
     const { id } = req.params;
 
-    const [result] = await db.execute('DELETE FROM comments WHERE id = ?', [id]);
-
-    if (result.affectedRows === 0) {
+    const [existing] = await db.execute('SELECT blog_id, status FROM comments WHERE id = ?', [id]);
+    if (existing.length === 0) {
       return res.status(404).json({ error: 'Comment not found' });
     }
 
+    await db.execute('DELETE FROM comments WHERE id = ?', [id]);
+
+    clearCountCache('comments:');
+    responseCache.invalidate(`comments:${existing[0].blog_id}`);
+    bumpVersion('comments');
+    if (showsOnPage(existing[0].status, null)) {
+      revalidatePages({ blogIds: [existing[0].blog_id] });
+    }
+
     res.json({ message: 'Comment deleted successfully' });
   } catch (error) {
     console.error('Delete comment error:', error);
     res.status(500).json({ error: 'Failed to delete comment' });
   }
 };
+
+// Post pages list approved comments only, so only changes into or out of
+// 'approved' need them regenerated (newStatus null: deleted)
+const showsOnPage = (oldStatus, newStatus) =>
+  oldStatus !== newStatus && (oldStatus === 'approved' || newStatus === 'approved');
+
+// Bulk moderation: { ids } or { filter: { status, blog_id } }, at most BULK_MAX_ROWS per call
+const bulkComments = async (req, res, status) => {
+  const target = parseBulkTarget(req.body, BULK_FILTERS);
+  if (target.error) {
+    return res.status(400).json({ error: target.error });
+  }
+
+  const outcome = await bulkModerate({ table: 'comments', target, status, columns: ['blog_id'] });
+
+  if (outcome.changed.length > 0) {
+    const blogIds = new Set(outcome.changed.map(row => row.blog_id));
+    clearCountCache('comments:');
+    responseCache.invalidate(...[...blogIds].map(blogId => `comments:${blogId}`));
+    bumpVersion('comments');
+
+    const pageBlogIds = new Set(outcome.changed
+      .filter(row => showsOnPage(row.status, status))
+      .map(row => row.blog_id));
+    if (pageBlogIds.size > 0) {
+      revalidatePages({ blogIds: [...pageBlogIds] });
+    }
+  }
+
+  res.json(bulkSummary(outcome));
+};
+
+export const bulkUpdateCommentStatus = async (req, res) => {
+  try {
+    if (!STATUSES.includes(req.body.status)) {
+      return res.status(400).json({ error: 'Invalid status' });
+    }
+    await bulkComments(req, res, req.body.status);
+  } catch (error) {
+    console.error('Bulk update comments error:', error);
+    res.status(500).json({ error: 'Failed to update comments' });
+  }
+};
+
+export const bulkDeleteComments = async (req, res) => {
+  try {
+    await bulkComments(req, res, null);
+  } catch (error) {
+    console.error('Bulk delete comments error:', error);
+    res.status(500).json({ error: 'Failed to delete comments' });
+  }
+};
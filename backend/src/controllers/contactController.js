@@ -1,5 +1,28 @@
 import crypto from 'crypto';
-import db from '../config/database.js';
+import db, { streamQuery } from '../config/database.js';
+import {
+  parseLimit,
+  decodeCursor,
+  afterCursor,
+  keysetPage,
+  cachedCount,
+  clearCountCache
+} from '../utils/helpers.js';
+import { sendRows } from '../utils/stream.js';
+import { parseBulkTarget, bulkModerate, bulkSummary } from '../utils/bulk.js';
+import { WriteBuffer, WriteError } from '../utils/writeBuffer.js';
+
+const STATUSES = ['new', 'read', 'replied'];
+const BULK_FILTERS = ['status'];
+const EXPORT_FORMATS = ['csv', 'ndjson'];
+const EXPORT_COLUMNS = ['id', 'name', 'email', 'subject', 'message', 'status', 'created_at'];
+
+// Public submissions are coalesced into multi-row INSERTs
+const contactWrites = new WriteBuffer({
+  table: 'contacts',
+  columns: ['id', 'name', 'email', 'subject', 'message'],
+  afterFlush: () => clearCountCache('contacts:')
+});
 
 export const createContact = async (req, res) => {
   try {
@@ -10,14 +33,14 @@ export const createContact = async (req, res) => {
     }
 
     const contactId = crypto.randomUUID();
-
-    await db.execute(
-      'INSERT INTO contacts (id, name, email, subject, message) VALUES (?, ?, ?, ?, ?)',
-      [contactId, name, email, subject, message]
-    );
+    await contactWrites.add({ id: contactId, name, email, subject, message });
 
     res.status(201).json({ message: 'Contact message sent successfully', id: contactId });
   } catch (error) {
+    if (error instanceof WriteError && error.status !== 500) {
+      if (error.status === 503) res.set('Retry-After', '1');
+      return res.status(error.status).json({ error: error.message });
+    }
     console.error('Create contact error:', error);
     res.status(500).json({ error: 'Failed to send message' });
   }
@@ -25,31 +48,98 @@ export const createContact = async (req, res) => {
 
 export const getAllContacts = async (req, res) => {
   try {
-    const { status } = req.query;
-    let query = 'SELECT * FROM contacts WHERE 1=1';
+    const { status, cursor, limit, include_total } = req.query;
+    // Without cursor/limit the full list is returned as a plain array, as before
+    const paged = cursor !== undefined || limit !== undefined;
+
+    let after = null;
+    if (cursor) {
+      after = decodeCursor(cursor);
+      if (!after) {
+        return res.status(400).json({ error: 'Invalid cursor' });
+      }
+    }
+
+    let filters = '';
     const params = [];
 
     if (status) {
-      query += ' AND status = ?';
+      filters += ' AND status = ?';
       params.push(status);
     }
 
-    query += ' ORDER BY created_at DESC';
+    let query = `SELECT * FROM contacts WHERE 1=1${filters}`;
+    const queryParams = [...params];
+
+    if (after) {
+      const { clause, params: cursorParams } = afterCursor(after);
+      query += clause;
+      queryParams.push(...cursorParams);
+    }
+
+    query += ' ORDER BY created_at DESC, id DESC';
+
+    if (!paged) {
+      await sendRows(res, await streamQuery(query, queryParams), 'json');
+      return;
+    }
+
+    const queryLimit = parseLimit(limit, 50);
+    query += ` LIMIT ${queryLimit + 1}`;
+
+    const [rows] = await db.execute(query, queryParams);
+    const { rows: contacts, nextCursor } = keysetPage(rows, queryLimit);
+    const pagination = { limit: queryLimit, nextCursor };
+
+    if (include_total === 'true') {
+      pagination.total = await cachedCount(`contacts:${status || ''}`, async () => {
+        const [countResult] = await db.execute(
+          `SELECT COUNT(*) as total FROM contacts WHERE 1=1${filters}`,
+          params
+        );
+        return countResult[0].total;
+      });
+    }
 
-    const [contacts] = await db.execute(query, params);
-    res.json(contacts);
+    res.json({ contacts, pagination });
   } catch (error) {
     console.error('Get contacts error:', error);
     res.status(500).json({ error: 'Failed to fetch contacts' });
   }
 };
 
+export const exportContacts = async (req, res) => {
+  try {
+    const { status, format = 'csv' } = req.query;
+
+    if (!EXPORT_FORMATS.includes(format)) {
+      return res.status(400).json({ error: 'Format must be csv or ndjson' });
+    }
+
+    let query = `SELECT ${EXPORT_COLUMNS.join(', ')} FROM contacts`;
+    const params = [];
+    if (status) {
+      query += ' WHERE status = ?';
+      params.push(status);
+    }
+    query += ' ORDER BY created_at DESC, id DESC';
+
+    await sendRows(res, await streamQuery(query, params), format, {
+      columns: EXPORT_COLUMNS,
+      filename: 'contacts'
+    });
+  } catch (error) {
+    console.error('Export contacts error:', error);
+    res.status(500).json({ error: 'Failed to export contacts' });
+  }
+};
+
 export const updateContactStatus = async (req, res) => {
   try {
     const { id } = req.params;
     const { status } = req.body;
 
-    if (!['new', 'read', 'replied'].includes(status)) {
+    if (!STATUSES.includes(status)) {
       return res.status(400).json({ error: 'Invalid status' });
     }
 
@@ -62,6 +152,8 @@ export const updateContactStatus = async (req, res) => {
       return res.status(404).json({ error: 'Contact not found' });
     }
 
+    clearCountCache('contacts:');
+
     res.json({ message: 'Contact status updated successfully' });
   } catch (error) {
     console.error('Update contact error:', error);
@@ -79,9 +171,48 @@ export const deleteContact = async (req, res) => {
       return res.status(404).json({ error: 'Contact not found' });
     }
 
+    clearCountCache('contacts:');
+
     res.json({ message: 'Contact deleted successfully' });
   } catch (error) {
     console.error('Delete contact error:', error);
     res.status(500).json({ error: 'Failed to delete contact' });
   }
 };
+
+// Bulk moderation: { ids } or { filter: { status } }, at most BULK_MAX_ROWS per call
+const bulkContacts = async (req, res, status) => {
+  const target = parseBulkTarget(req.body, BULK_FILTERS);
+  if (target.error) {
+    return res.status(400).json({ error: target.error });
+  }
+
+  const outcome = await bulkModerate({ table: 'contacts', target, status });
+
+  if (outcome.changed.length > 0) {
+    clearCountCache('contacts:');
+  }
+
+  res.json(bulkSummary(outcome));
+};
+
+export const bulkUpdateContactStatus = async (req, res) => {
+  try {
+    if (!STATUSES.includes(req.body.status)) {
+      return res.status(400).json({ error: 'Invalid status' });
+    }
+    await bulkContacts(req, res, req.body.status);
+  } catch (error) {
+    console.error('Bulk update contacts error:', error);
+    res.status(500).json({ error: 'Failed to update contacts' });
+  }
+};
+
+export const bulkDeleteContacts = async (req, res) => {
+  try {
+    await bulkContacts(req, res, null);
+  } catch (error) {
+    console.error('Bulk delete contacts error:', error);
+    res.status(500).json({ error: 'Failed to delete contacts' });
+  }
+};
@@ -1,45 +1,70 @@
 import db from '../config/database.js';
+import { responseCache } from '../utils/responseCache.js';
 
-export const getDashboardStats = async (req, res) => {
+// Counters maintained by the stats_counters triggers in scripts/schema.sql
+const loadCounters = async () => {
+  let rows = [];
   try {
-    // Get total blogs
-    const [blogsCount] = await db.execute(
-      'SELECT COUNT(*) as total, SUM(CASE WHEN status = "published" THEN 1 ELSE 0 END) as published, SUM(CASE WHEN status = "draft" THEN 1 ELSE 0 END) as drafts FROM blogs'
-    );
-
-    // Get total comments
-    const [commentsCount] = await db.execute(
-      'SELECT COUNT(*) as total, SUM(CASE WHEN status = "pending" THEN 1 ELSE 0 END) as pending, SUM(CASE WHEN status = "approved" THEN 1 ELSE 0 END) as approved FROM comments'
-    );
-
-    // Get total contacts
-    const [contactsCount] = await db.execute(
-      'SELECT COUNT(*) as total, SUM(CASE WHEN status = "new" THEN 1 ELSE 0 END) as new_messages FROM contacts'
-    );
+    [rows] = await db.execute('SELECT name, value FROM stats_counters');
+  } catch (error) {
+    if (error.code !== 'ER_NO_SUCH_TABLE') throw error;
+  }
+  if (rows.length > 0) {
+    return Object.fromEntries(rows.map(row => [row.name, Number(row.value)]));
+  }
 
-    // Get total categories and tags
-    const [categoriesCount] = await db.execute('SELECT COUNT(*) as total FROM categories');
-    const [tagsCount] = await db.execute('SELECT COUNT(*) as total FROM tags');
+  // Database not migrated to the counters table yet: one combined scan
+  const [[counts]] = await db.execute(
+    `SELECT
+       (SELECT COUNT(*) FROM blogs) as \`blogs.total\`,
+       (SELECT COUNT(*) FROM blogs WHERE status = 'published') as \`blogs.published\`,
+       (SELECT COUNT(*) FROM blogs WHERE status = 'draft') as \`blogs.draft\`,
+       (SELECT COUNT(*) FROM comments) as \`comments.total\`,
+       (SELECT COUNT(*) FROM comments WHERE status = 'pending') as \`comments.pending\`,
+       (SELECT COUNT(*) FROM comments WHERE status = 'approved') as \`comments.approved\`,
+       (SELECT COUNT(*) FROM contacts) as \`contacts.total\`,
+       (SELECT COUNT(*) FROM contacts WHERE status = 'new') as \`contacts.new\`,
+       (SELECT COUNT(*) FROM categories) as \`categories.total\`,
+       (SELECT COUNT(*) FROM tags) as \`tags.total\``
+  );
+  return counts;
+};
 
-    // Get recent blogs
-    const [recentBlogs] = await db.execute(
-      'SELECT id, title, slug, status, created_at FROM blogs ORDER BY created_at DESC LIMIT 5'
-    );
+export const getDashboardStats = async (req, res) => {
+  try {
+    // Counters and recent items are independent; fetch them concurrently
+    const [counters, [recentBlogs], [recentComments]] = await Promise.all([
+      loadCounters(),
+      db.execute(
+        'SELECT id, title, slug, status, created_at FROM blogs ORDER BY created_at DESC LIMIT 5'
+      ),
+      db.execute(
+        `SELECT c.id, c.author_name, c.content, c.status, c.created_at, b.title as blog_title 
+         FROM comments c 
+         JOIN blogs b ON c.blog_id = b.id 
+         ORDER BY c.created_at DESC LIMIT 5`
+      )
+    ]);
 
-    // Get recent comments
-    const [recentComments] = await db.execute(
-      `SELECT c.id, c.author_name, c.content, c.status, c.created_at, b.title as blog_title 
-       FROM comments c 
-       JOIN blogs b ON c.blog_id = b.id 
-       ORDER BY c.created_at DESC LIMIT 5`
-    );
+    const count = (name) => counters[name] || 0;
 
     res.json({
-      blogs: blogsCount[0],
-      comments: commentsCount[0],
-      contacts: contactsCount[0],
-      categories: categoriesCount[0].total,
-      tags: tagsCount[0].total,
+      blogs: {
+        total: count('blogs.total'),
+        published: count('blogs.published'),
+        drafts: count('blogs.draft')
+      },
+      comments: {
+        total: count('comments.total'),
+        pending: count('comments.pending'),
+        approved: count('comments.approved')
+      },
+      contacts: {
+        total: count('contacts.total'),
+        new_messages: count('contacts.new')
+      },
+      categories: count('categories.total'),
+      tags: count('tags.total'),
       recentBlogs,
       recentComments
     });
@@ -48,3 +73,12 @@ export const getDashboardStats = async (req, res) => {
     res.status(500).json({ error: 'Failed to fetch dashboard stats' });
   }
 };
+
+export const getCacheStats = async (req, res) => {
+  try {
+    res.json({ responseCache: responseCache.stats() });
+  } catch (error) {
+    console.error('Get cache stats error:', error);
+    res.status(500).json({ error: 'Failed to fetch cache stats' });
+  }
+};
@@ -1,5 +1,47 @@
 import jwt from 'jsonwebtoken';
 import db from '../config/database.js';
+import { broadcast, onBroadcast } from '../utils/clusterSync.js';
+
+// Short-lived user/role cache so protected requests skip the users JOIN roles lookup.
+// No endpoint edits users or roles, so only logout evicts entries: a role change
+// or deletion made directly in the database takes effect within
+// USER_CACHE_TTL_MS. USER_CACHE_TTL_MS=0 disables the cache.
+const USER_CACHE_TTL_MS = parseInt(process.env.USER_CACHE_TTL_MS ?? '30000');
+const USER_CACHE_MAX_ENTRIES = parseInt(process.env.USER_CACHE_MAX_ENTRIES) || 1000;
+const userCache = new Map();
+
+const loadUser = async (userId) => {
+  const cached = userCache.get(userId);
+  if (cached && cached.expiresAt > Date.now()) {
+    return cached.user;
+  }
+
+  const [users] = await db.execute(
+    `SELECT u.id, u.email, u.name, r.name as role 
+     FROM users u 
+     JOIN roles r ON u.role_id = r.id 
+     WHERE u.id = ?`,
+    [userId]
+  );
+  const user = users[0];
+
+  if (user && USER_CACHE_TTL_MS > 0) {
+    userCache.delete(userId);
+    userCache.set(userId, { user, expiresAt: Date.now() + USER_CACHE_TTL_MS });
+    if (userCache.size > USER_CACHE_MAX_ENTRIES) {
+      userCache.delete(userCache.keys().next().value);
+    }
+  }
+  return user;
+};
+
+// Call after logout or any change to a user's row or role
+export const invalidateUser = (userId) => {
+  userCache.delete(userId);
+  broadcast('users:invalidate', userId);
+};
+
+onBroadcast('users:invalidate', (userId) => userCache.delete(userId));
 
 export const authenticateToken = async (req, res, next) => {
   try {
@@ -12,20 +54,14 @@ export const authenticateToken = async (req, res, next) => {
 
     const decoded = jwt.verify(token, process.env.JWT_SECRET);
     
-    // Get user from database
-    const [users] = await db.execute(
-      `SELECT u.id, u.email, u.name, r.name as role 
-       FROM users u 
-       JOIN roles r ON u.role_id = r.id 
-       WHERE u.id = ?`,
-      [decoded.userId]
-    );
-
-    if (users.length === 0) {
+    const user = await loadUser(decoded.userId);
+
+    if (!user) {
       return res.status(401).json({ error: 'User not found' });
     }
 
-    req.user = users[0];
+    // Copy so handlers can't mutate the cached object
+    req.user = { ...user };
     next();
   } catch (error) {
     if (error.name === 'JsonWebTokenError') {
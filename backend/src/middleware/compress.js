@@ -0,0 +1,84 @@
+import zlib from 'zlib';
+
+// JSON, NDJSON, CSV and other text; images are already compressed and
+// uploads have their own .br/.gz siblings
+const COMPRESSIBLE = /^(text\/|application\/(json|x-ndjson|javascript|xml)\b|[^;]*\+json\b)/i;
+
+const createEncoder = (encoding, length) => encoding === 'br'
+  ? zlib.createBrotliCompress({
+    params: {
+      // Quality 4 keeps brotli cheaper than gzip -6 for a similar ratio
+      [zlib.constants.BROTLI_PARAM_QUALITY]: 4,
+      ...(length ? { [zlib.constants.BROTLI_PARAM_SIZE_HINT]: length } : {})
+    }
+  })
+  : zlib.createGzip();
+
+// brotli/gzip for responses over `threshold` bytes, picked from
+// Accept-Encoding. The decision is made on the first write or end, while
+// headers can still change. Streamed responses keep their backpressure:
+// res.write reports the encoder's buffer and 'drain' fires when it empties.
+export const compress = ({ threshold = 1024 } = {}) => (req, res, next) => {
+  const write = res.write;
+  const end = res.end;
+  let encoder = null;
+  let decided = false;
+
+  const decide = (chunk, encoding, ending) => {
+    decided = true;
+    if (res.headersSent) return;
+
+    const type = res.getHeader('Content-Type');
+    if (!type || !COMPRESSIBLE.test(type)) return;
+    res.vary('Accept-Encoding');
+
+    if (req.method === 'HEAD' || res.statusCode === 204 || res.statusCode === 304) return;
+    if (res.getHeader('Content-Encoding')) return;
+    if (/\bno-transform\b/.test(res.getHeader('Cache-Control') || '')) return;
+
+    // A streamed response has no length yet and is always worth compressing
+    const declared = parseInt(res.getHeader('Content-Length'));
+    const length = !Number.isNaN(declared) ? declared
+      : ending ? (chunk ? Buffer.byteLength(chunk, encoding) : 0)
+      : null;
+    if (length !== null && length < threshold) return;
+
+    const accepted = req.acceptsEncodings('br', 'gzip');
+    if (!accepted) return;
+
+    res.setHeader('Content-Encoding', accepted);
+    res.removeHeader('Content-Length');
+
+    encoder = createEncoder(accepted, length);
+    encoder.on('data', (data) => {
+      if (!write.call(res, data)) encoder.pause();
+    });
+    encoder.on('drain', () => res.emit('drain'));
+    encoder.on('end', () => end.call(res));
+    encoder.on('error', (error) => res.destroy(error));
+    res.on('drain', () => encoder.resume());
+    res.on('close', () => encoder.destroy());
+  };
+
+  res.write = function (chunk, encoding, cb) {
+    if (!decided) decide(chunk, encoding, false);
+    return encoder ? encoder.write(chunk, encoding, cb) : write.call(this, chunk, encoding, cb);
+  };
+
+  res.end = function (chunk, encoding, cb) {
+    if (typeof chunk === 'function') {
+      cb = chunk;
+      chunk = undefined;
+    } else if (typeof encoding === 'function') {
+      cb = encoding;
+      encoding = undefined;
+    }
+    if (!decided) decide(chunk, encoding, true);
+    if (!encoder) return end.call(this, chunk, encoding, cb);
+    if (cb) this.once('finish', cb);
+    encoder.end(chunk, encoding);
+    return this;
+  };
+
+  next();
+};
@@ -0,0 +1,24 @@
+import { versionTag, lastModified } from '../utils/contentVersion.js';
+import { readFromPrimary, REPLICA_SETTLE_MS } from '../config/database.js';
+
+// Sets ETag/Last-Modified from the scopes' version counters and answers a
+// matching If-None-Match with 304 before the handler runs. Last-Modified is
+// only precise to the second, so If-Modified-Since alone never yields a 304:
+// it would hide writes made later in the same second.
+export const conditionalGet = (...scopes) => (req, res, next) => {
+  res.set('ETag', versionTag(scopes));
+  res.set('Last-Modified', lastModified(scopes).toUTCString());
+  res.set('Cache-Control', 'no-cache');
+
+  if (req.get('If-None-Match') && req.fresh) {
+    return res.status(304).end();
+  }
+
+  // Until replicas have caught up with the last change to these scopes, read
+  // from the primary: this response goes out under the new ETag and may fill
+  // the response cache or a pre-rendered page
+  if (Date.now() - lastModified(scopes).getTime() < REPLICA_SETTLE_MS) {
+    readFromPrimary();
+  }
+  next();
+};
@@ -0,0 +1,32 @@
+import cluster from 'cluster';
+import { httpRequestDuration, renderMetrics, mergeWorkerMetrics } from '../utils/metrics.js';
+import { collect, onCollect } from '../utils/clusterSync.js';
+
+onCollect('metrics', () => ({ worker: cluster.worker?.id ?? 0, text: renderMetrics() }));
+
+// Observe every response's latency under its route pattern, not the raw URL
+export const trackRequests = (req, res, next) => {
+  const start = process.hrtime.bigint();
+
+  res.on('finish', () => {
+    const route = req.route ? req.baseUrl + req.route.path : req.baseUrl || 'unmatched';
+    httpRequestDuration.observe(
+      { method: req.method, route, status: res.statusCode },
+      Number(process.hrtime.bigint() - start) / 1e9
+    );
+  });
+  next();
+};
+
+// GET /api/metrics in Prometheus text format. With METRICS_TOKEN set,
+// scrapers must send it as a bearer token. In cluster mode the response
+// covers every worker, whichever one answers the scrape.
+export const serveMetrics = async (req, res) => {
+  const token = process.env.METRICS_TOKEN;
+  if (token && req.headers['authorization'] !== `Bearer ${token}`) {
+    return res.status(401).json({ error: 'Metrics token required' });
+  }
+
+  const body = cluster.isWorker ? mergeWorkerMetrics(await collect('metrics')) : renderMetrics();
+  res.type('text/plain; version=0.0.4').send(body);
+};
@@ -0,0 +1,16 @@
+import { queryStats } from '../config/database.js';
+
+// Reports database round trips and time for each response as a Server-Timing header
+export const trackQueries = (req, res, next) => {
+  const stats = { count: 0, duration: 0 };
+
+  const writeHead = res.writeHead;
+  res.writeHead = function (...args) {
+    if (!res.headersSent) {
+      res.setHeader('Server-Timing', `db;desc="${stats.count} queries";dur=${stats.duration.toFixed(1)}`);
+    }
+    return writeHead.apply(this, args);
+  };
+
+  queryStats.run(stats, next);
+};
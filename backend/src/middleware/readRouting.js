@@ -0,0 +1,8 @@
+import { dbSession } from '../config/database.js';
+
+// Tags each request with a session key so reads that follow a write from the
+// same client stay on the primary for DB_STICKY_MS (read-your-writes)
+export const readRouting = (req, res, next) => {
+  const session = req.headers.authorization || req.ip;
+  dbSession.run({ session, wrote: false, primary: false }, next);
+};
@@ -0,0 +1,117 @@
+import express from 'express';
+import fs from 'fs';
+import path from 'path';
+import { UPLOADS_DIR } from './upload.js';
+
+// UPLOADS_DELIVERY:
+//   node             - express.static (default)
+//   x-accel-redirect - nginx serves the file from UPLOADS_ACCEL_PREFIX
+//   x-sendfile       - Apache/lighttpd serve the file by absolute path
+//   proxy            - /uploads is not mounted; the proxy serves the directory itself
+export const UPLOADS_DELIVERY = process.env.UPLOADS_DELIVERY || 'node';
+const ACCEL_PREFIX = process.env.UPLOADS_ACCEL_PREFIX || '/protected-uploads/';
+const PRECOMPRESSED = process.env.UPLOADS_PRECOMPRESSED === 'true';
+
+// <sha256>.<ext> originals and <sha256>-<width>.<format> variants (and their
+// .br/.gz siblings) never change
+const CONTENT_ADDRESSED = /(^|\/)[0-9a-f]{64}(-\d+)?(\.\w+)+$/;
+
+const cachePolicy = (filePath) =>
+  CONTENT_ADDRESSED.test(filePath)
+    ? 'public, max-age=31536000, immutable'
+    // Legacy Date.now() names: cache briefly, then revalidate with ETag/Last-Modified
+    : 'public, max-age=3600';
+
+const ENCODINGS = [
+  { name: 'br', extension: '.br' },
+  { name: 'gzip', extension: '.gz' }
+];
+
+// Existence of precompressed siblings, checked once per file
+const siblings = new Map();
+const MAX_SIBLING_ENTRIES = 10000;
+
+const hasSibling = async (filePath) => {
+  if (!siblings.has(filePath)) {
+    if (siblings.size >= MAX_SIBLING_ENTRIES) siblings.clear();
+    siblings.set(filePath, fs.promises.stat(filePath).then(stat => stat.isFile(), () => false));
+  }
+  return siblings.get(filePath);
+};
+
+const requestPath = (req) => {
+  try {
+    return decodeURIComponent(req.path);
+  } catch (e) {
+    return null;
+  }
+};
+
+// Absolute path of a request path inside the uploads directory, or null for
+// anything that could reach outside it (.. segments, NUL bytes)
+const uploadsFile = (relative) => {
+  if (relative.includes('\0') || relative.split(/[\\/]/).includes('..')) return null;
+  const resolved = path.resolve(UPLOADS_DIR, `.${relative}`);
+  return resolved.startsWith(UPLOADS_DIR + path.sep) ? resolved : null;
+};
+
+// Rewrite to a .br/.gz sibling when the client accepts it; send then handles
+// ranges and conditionals against the compressed representation
+const precompressed = async (req, res, next) => {
+  if (req.method !== 'GET' && req.method !== 'HEAD') return next();
+
+  const accepted = req.acceptsEncodings(ENCODINGS.map(encoding => encoding.name));
+  const encoding = ENCODINGS.find(candidate => candidate.name === accepted);
+  res.vary('Accept-Encoding');
+  if (!encoding) return next();
+
+  // Leave anything odd to express.static, which rejects traversal itself
+  const relative = requestPath(req);
+  const file = relative && uploadsFile(relative);
+  if (!file || !(await hasSibling(file + encoding.extension))) return next();
+
+  res.locals.originalPath = relative;
+  res.set('Content-Encoding', encoding.name);
+  req.url = req.url.replace(req.path, req.path + encoding.extension);
+  next();
+};
+
+const setHeaders = (res, filePath) => {
+  res.set('Cache-Control', cachePolicy(filePath));
+  if (res.locals.originalPath) {
+    res.type(path.extname(res.locals.originalPath));
+  }
+};
+
+// Hand the file to the fronting server: only headers leave this process
+const offload = (req, res, next) => {
+  if (req.method !== 'GET' && req.method !== 'HEAD') return next();
+
+  // req.path is absolute, so normalize() cannot climb out of the uploads directory
+  const relative = requestPath(req) && path.posix.normalize(requestPath(req));
+  if (!relative || relative.split('/').some(segment => segment.startsWith('.'))) return next();
+
+  res.set('Cache-Control', cachePolicy(relative));
+  if (UPLOADS_DELIVERY === 'x-sendfile') {
+    res.set('X-Sendfile', path.join(UPLOADS_DIR, relative));
+  } else {
+    res.set('X-Accel-Redirect', path.posix.join(ACCEL_PREFIX, relative));
+  }
+  res.end();
+};
+
+export const serveUploads = () => {
+  const router = express.Router();
+
+  if (UPLOADS_DELIVERY === 'x-accel-redirect' || UPLOADS_DELIVERY === 'x-sendfile') {
+    router.use(offload);
+    return router;
+  }
+
+  if (PRECOMPRESSED) router.use(precompressed);
+  router.use(express.static(UPLOADS_DIR, {
+    index: false,
+    setHeaders
+  }));
+  return router;
+};
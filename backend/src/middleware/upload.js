@@ -1,20 +1,72 @@
 import multer from 'multer';
+import crypto from 'crypto';
+import fs from 'fs';
 import path from 'path';
+import { pipeline } from 'stream/promises';
 import { fileURLToPath } from 'url';
 import { dirname } from 'path';
 
 const __filename = fileURLToPath(import.meta.url);
 const __dirname = dirname(__filename);
 
-const storage = multer.diskStorage({
-  destination: (req, file, cb) => {
-    cb(null, path.join(__dirname, '../../uploads'));
-  },
-  filename: (req, file, cb) => {
-    const uniqueSuffix = Date.now() + '-' + Math.round(Math.random() * 1E9);
-    cb(null, uniqueSuffix + path.extname(file.originalname));
+export const UPLOADS_DIR = path.join(__dirname, '../../uploads');
+
+// One extension per image type, so the same bytes uploaded as .jpg and .jpeg
+// share a file (and its variants)
+const MIME_EXTENSIONS = {
+  'image/jpeg': '.jpg',
+  'image/png': '.png',
+  'image/gif': '.gif',
+  'image/webp': '.webp'
+};
+
+const normalizedExtension = (file) => {
+  const ext = path.extname(file.originalname).toLowerCase();
+  return MIME_EXTENSIONS[file.mimetype] || (ext === '.jpeg' ? '.jpg' : ext);
+};
+
+// Streams the upload to a temp file while hashing it, then stores it as
+// uploads/<sha256><ext>. Re-uploading the same bytes reuses the stored file.
+class ContentHashStorage {
+  _handleFile(req, file, cb) {
+    const tmpPath = path.join(UPLOADS_DIR, `.tmp-${crypto.randomUUID()}`);
+    const hash = crypto.createHash('sha256');
+    let size = 0;
+
+    file.stream.on('data', (chunk) => {
+      hash.update(chunk);
+      size += chunk.length;
+    });
+
+    pipeline(file.stream, fs.createWriteStream(tmpPath))
+      .then(async () => {
+        const digest = hash.digest('hex');
+        const filename = digest + normalizedExtension(file);
+        const finalPath = path.join(UPLOADS_DIR, filename);
+
+        let deduped = false;
+        try {
+          await fs.promises.access(finalPath);
+          deduped = true;
+          await fs.promises.unlink(tmpPath);
+        } catch (e) {
+          await fs.promises.rename(tmpPath, finalPath);
+        }
+
+        cb(null, { destination: UPLOADS_DIR, filename, path: finalPath, size, hash: digest, deduped });
+      })
+      .catch((error) => {
+        fs.promises.unlink(tmpPath).catch(() => {});
+        cb(error);
+      });
   }
-});
+
+  _removeFile(req, file, cb) {
+    // A deduped file belongs to an earlier upload as well
+    if (file.deduped) return cb(null);
+    fs.unlink(file.path, () => cb(null));
+  }
+}
 
 const fileFilter = (req, file, cb) => {
   const allowedTypes = /jpeg|jpg|png|gif|webp/;
@@ -29,7 +81,7 @@ const fileFilter = (req, file, cb) => {
 };
 
 export const upload = multer({
-  storage,
+  storage: new ContentHashStorage(),
   limits: { fileSize: 5 * 1024 * 1024 }, // 5MB
   fileFilter
 });
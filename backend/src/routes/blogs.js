@@ -1,6 +1,7 @@
 import express from 'express';
 import {
   getAllBlogs,
+  searchBlogs,
   getBlogBySlug,
   createBlog,
   updateBlog,
@@ -8,6 +9,7 @@ import {
 } from '../controllers/blogController.js';
 import { authenticateToken, requireAdmin } from '../middleware/auth.js';
 import { upload } from '../middleware/upload.js';
+import { conditionalGet } from '../middleware/conditional.js';
 
 const router = express.Router();
 
@@ -36,11 +38,56 @@ const router = express.Router();
  *           type: string
  *           enum: [published, draft]
  *         description: Filter by status
+ *       - in: query
+ *         name: category
+ *         schema:
+ *           type: string
+ *         description: Filter by category slug
+ *       - in: query
+ *         name: cursor
+ *         schema:
+ *           type: string
+ *         description: Opaque cursor from pagination.nextCursor; returns the rows after it
+ *       - in: query
+ *         name: include_total
+ *         schema:
+ *           type: boolean
+ *         description: Include a (briefly cached) total count in cursor responses
  *     responses:
  *       200:
  *         description: List of blogs
  */
-router.get('/', getAllBlogs);
+router.get('/', conditionalGet('blogs'), getAllBlogs);
+/**
+ * @swagger
+ * /blogs/search:
+ *   get:
+ *     summary: Full-text search over published blogs
+ *     tags: [Blogs]
+ *     parameters:
+ *       - in: query
+ *         name: q
+ *         required: true
+ *         schema:
+ *           type: string
+ *         description: Search words (words shorter than 3 characters are ignored)
+ *       - in: query
+ *         name: limit
+ *         schema:
+ *           type: integer
+ *         description: Results per page (max 100)
+ *       - in: query
+ *         name: cursor
+ *         schema:
+ *           type: string
+ *         description: Opaque cursor from pagination.nextCursor
+ *     responses:
+ *       200:
+ *         description: Results ranked by relevance, with highlighted title and snippet
+ *       400:
+ *         description: Missing query or invalid cursor
+ */
+router.get('/search', conditionalGet('blogs'), searchBlogs);
 /**
  * @swagger
  * /blogs/{slug}:
@@ -59,7 +106,7 @@ router.get('/', getAllBlogs);
  *       404:
  *         description: Blog not found
  */
-router.get('/:slug', getBlogBySlug);
+router.get('/:slug', conditionalGet('blogs', 'comments'), getBlogBySlug);
 
 // Protected routes
 
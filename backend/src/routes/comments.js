@@ -1,9 +1,12 @@
 import express from 'express';
 import {
   getAllComments,
+  exportComments,
   createComment,
   updateCommentStatus,
-  deleteComment
+  deleteComment,
+  bulkUpdateCommentStatus,
+  bulkDeleteComments
 } from '../controllers/commentController.js';
 import { authenticateToken, requireAdmin } from '../middleware/auth.js';
 
@@ -59,11 +62,129 @@ router.post('/', createComment);
  *         name: blog_id
  *         schema:
  *           type: string
+ *       - in: query
+ *         name: limit
+ *         schema:
+ *           type: integer
+ *         description: Page size (max 100); with cursor or limit the response is paginated
+ *       - in: query
+ *         name: cursor
+ *         schema:
+ *           type: string
+ *         description: Opaque cursor from pagination.nextCursor; returns the rows after it
+ *       - in: query
+ *         name: include_total
+ *         schema:
+ *           type: boolean
+ *         description: Include a (briefly cached) total count in cursor responses
  *     responses:
  *       200:
  *         description: List of comments
  */
 router.get('/', authenticateToken, requireAdmin, getAllComments);
+/**
+ * @swagger
+ * /comments/export:
+ *   get:
+ *     summary: Export all comments as CSV or NDJSON (streamed)
+ *     tags: [Comments]
+ *     security:
+ *       - bearerAuth: []
+ *     parameters:
+ *       - in: query
+ *         name: format
+ *         schema:
+ *           type: string
+ *           enum: [csv, ndjson]
+ *           default: csv
+ *       - in: query
+ *         name: status
+ *         schema:
+ *           type: string
+ *           enum: [approved, pending, rejected]
+ *       - in: query
+ *         name: blog_id
+ *         schema:
+ *           type: string
+ *     responses:
+ *       200:
+ *         description: File download, newest first
+ *       400:
+ *         description: Unsupported format
+ */
+router.get('/export', authenticateToken, requireAdmin, exportComments);
+/**
+ * @swagger
+ * /comments/bulk/status:
+ *   patch:
+ *     summary: Set the status of many comments (by ids or filter) in one transaction
+ *     tags: [Comments]
+ *     security:
+ *       - bearerAuth: []
+ *     requestBody:
+ *       required: true
+ *       content:
+ *         application/json:
+ *           schema:
+ *             type: object
+ *             required: [status]
+ *             properties:
+ *               status:
+ *                 type: string
+ *                 enum: [approved, pending, rejected]
+ *               ids:
+ *                 type: array
+ *                 items:
+ *                   type: string
+ *               filter:
+ *                 type: object
+ *                 description: Used when ids is absent
+ *                 properties:
+ *                   status:
+ *                     type: string
+ *                   blog_id:
+ *                     type: string
+ *     responses:
+ *       200:
+ *         description: Per-id results (updated, unchanged, not_found), counts and hasMore
+ *       400:
+ *         description: Invalid status, ids or filter
+ */
+router.patch('/bulk/status', authenticateToken, requireAdmin, bulkUpdateCommentStatus);
+/**
+ * @swagger
+ * /comments/bulk/delete:
+ *   post:
+ *     summary: Delete many comments (by ids or filter) in one transaction
+ *     tags: [Comments]
+ *     security:
+ *       - bearerAuth: []
+ *     requestBody:
+ *       required: true
+ *       content:
+ *         application/json:
+ *           schema:
+ *             type: object
+ *             properties:
+ *               ids:
+ *                 type: array
+ *                 items:
+ *                   type: string
+ *               filter:
+ *                 type: object
+ *                 description: Used when ids is absent
+ *                 properties:
+ *                   status:
+ *                     type: string
+ *                   blog_id:
+ *                     type: string
+ *     responses:
+ *       200:
+ *         description: Per-id results (deleted, not_found), counts and hasMore
+ *       400:
+ *         description: Invalid ids or filter
+ */
+router.post('/bulk/delete', authenticateToken, requireAdmin, bulkDeleteComments);
 /**
  * @swagger
  * /comments/{id}/status:
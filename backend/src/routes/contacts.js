@@ -2,8 +2,11 @@ import express from 'express';
 import {
   createContact,
   getAllContacts,
+  exportContacts,
   updateContactStatus,
-  deleteContact
+  deleteContact,
+  bulkUpdateContactStatus,
+  bulkDeleteContacts
 } from '../controllers/contactController.js';
 import { authenticateToken, requireAdmin } from '../middleware/auth.js';
 
@@ -55,11 +58,121 @@ router.post('/', createContact);
  *         schema:
  *           type: string
  *           enum: [new, read, replied]
+ *       - in: query
+ *         name: limit
+ *         schema:
+ *           type: integer
+ *         description: Page size (max 100); with cursor or limit the response is paginated
+ *       - in: query
+ *         name: cursor
+ *         schema:
+ *           type: string
+ *         description: Opaque cursor from pagination.nextCursor; returns the rows after it
+ *       - in: query
+ *         name: include_total
+ *         schema:
+ *           type: boolean
+ *         description: Include a (briefly cached) total count in cursor responses
  *     responses:
  *       200:
  *         description: List of contact messages
  */
 router.get('/', authenticateToken, requireAdmin, getAllContacts);
+/**
+ * @swagger
+ * /contacts/export:
+ *   get:
+ *     summary: Export all contacts as CSV or NDJSON (streamed)
+ *     tags: [Contacts]
+ *     security:
+ *       - bearerAuth: []
+ *     parameters:
+ *       - in: query
+ *         name: format
+ *         schema:
+ *           type: string
+ *           enum: [csv, ndjson]
+ *           default: csv
+ *       - in: query
+ *         name: status
+ *         schema:
+ *           type: string
+ *           enum: [new, read, replied]
+ *     responses:
+ *       200:
+ *         description: File download, newest first
+ *       400:
+ *         description: Unsupported format
+ */
+router.get('/export', authenticateToken, requireAdmin, exportContacts);
+/**
+ * @swagger
+ * /contacts/bulk/status:
+ *   patch:
+ *     summary: Set the status of many contacts (by ids or filter) in one transaction
+ *     tags: [Contacts]
+ *     security:
+ *       - bearerAuth: []
+ *     requestBody:
+ *       required: true
+ *       content:
+ *         application/json:
+ *           schema:
+ *             type: object
+ *             required: [status]
+ *             properties:
+ *               status:
+ *                 type: string
+ *                 enum: [new, read, replied]
+ *               ids:
+ *                 type: array
+ *                 items:
+ *                   type: string
+ *               filter:
+ *                 type: object
+ *                 description: Used when ids is absent
+ *                 properties:
+ *                   status:
+ *                     type: string
+ *     responses:
+ *       200:
+ *         description: Per-id results (updated, unchanged, not_found), counts and hasMore
+ *       400:
+ *         description: Invalid status, ids or filter
+ */
+router.patch('/bulk/status', authenticateToken, requireAdmin, bulkUpdateContactStatus);
+/**
+ * @swagger
+ * /contacts/bulk/delete:
+ *   post:
+ *     summary: Delete many contacts (by ids or filter) in one transaction
+ *     tags: [Contacts]
+ *     security:
+ *       - bearerAuth: []
+ *     requestBody:
+ *       required: true
+ *       content:
+ *         application/json:
+ *           schema:
+ *             type: object
+ *             properties:
+ *               ids:
+ *                 type: array
+ *                 items:
+ *                   type: string
+ *               filter:
+ *                 type: object
+ *                 description: Used when ids is absent
+ *                 properties:
+ *                   status:
+ *                     type: string
+ *     responses:
+ *       200:
+ *         description: Per-id results (deleted, not_found), counts and hasMore
+ *       400:
+ *         description: Invalid ids or filter
+ */
+router.post('/bulk/delete', authenticateToken, requireAdmin, bulkDeleteContacts);
 /**
  * @swagger
  * /contacts/{id}/status:
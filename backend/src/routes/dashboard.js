@@ -1,5 +1,5 @@
 import express from 'express';
-import { getDashboardStats } from '../controllers/dashboardController.js';
+import { getDashboardStats, getCacheStats } from '../controllers/dashboardController.js';
 import { authenticateToken, requireAdmin } from '../middleware/auth.js';
 
 const router = express.Router();
@@ -18,4 +18,18 @@ const router = express.Router();
  */
 router.get('/stats', authenticateToken, requireAdmin, getDashboardStats);
 
+/**
+ * @swagger
+ * /dashboard/cache:
+ *   get:
+ *     summary: Get response cache statistics
+ *     tags: [Dashboard]
+ *     security:
+ *       - bearerAuth: []
+ *     responses:
+ *       200:
+ *         description: Entries, memory use, hit/miss counters and invalidations
+ */
+router.get('/cache', authenticateToken, requireAdmin, getCacheStats);
+
 export default router;
@@ -9,6 +9,7 @@ import {
   deleteTag
 } from '../controllers/categoryController.js';
 import { authenticateToken, requireAdmin } from '../middleware/auth.js';
+import { conditionalGet } from '../middleware/conditional.js';
 
 const router = express.Router();
 
@@ -24,7 +25,7 @@ const router = express.Router();
  *       200:
  *         description: List of categories
  */
-router.get('/categories', getAllCategories);
+router.get('/categories', conditionalGet('categories'), getAllCategories);
 /**
  * @swagger
  * /categories:
@@ -112,7 +113,7 @@ router.delete('/categories/:id', authenticateToken, requireAdmin, deleteCategory
  *       200:
  *         description: List of tags
  */
-router.get('/tags', getAllTags);
+router.get('/tags', conditionalGet('tags'), getAllTags);
 /**
  * @swagger
  * /tags:
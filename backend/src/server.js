@@ -1,4 +1,5 @@
 import express from 'express';
+import cluster from 'cluster';
 import cors from 'cors';
 import path from 'path';
 import { fileURLToPath } from 'url';
@@ -11,6 +12,13 @@ import taxonomyRoutes from './routes/taxonomy.js';
 import commentRoutes from './routes/comments.js';
 import contactRoutes from './routes/contacts.js';
 import dashboardRoutes from './routes/dashboard.js';
+import { compress } from './middleware/compress.js';
+import { trackQueries } from './middleware/queryStats.js';
+import { readRouting } from './middleware/readRouting.js';
+import { trackRequests, serveMetrics } from './middleware/metrics.js';
+import { drainWriteBuffers } from './utils/writeBuffer.js';
+import { closePools } from './config/database.js';
+import { serveUploads, UPLOADS_DELIVERY } from './middleware/staticUploads.js';
 
 const __filename = fileURLToPath(import.meta.url);
 const __dirname = dirname(__filename);
@@ -19,6 +27,17 @@ config({ path: path.join(__dirname, '../.env') });
 
 const app = express();
 const PORT = process.env.BACKEND_PORT || process.env.PORT || 5000;
+const SHUTDOWN_TIMEOUT_MS = parseInt(process.env.SHUTDOWN_TIMEOUT_MS) || 10000;
+let shuttingDown = false;
+
+// Per-route latency histograms for /api/metrics
+app.use(trackRequests);
+
+// While draining, tell keep-alive clients to reconnect (to another worker or instance)
+app.use((req, res, next) => {
+  if (shuttingDown) res.set('Connection', 'close');
+  next();
+});
 
 // Middleware
 app.use(cors({
@@ -40,13 +59,26 @@ app.use(cors({
       callback(new Error(`Not allowed by CORS: ${origin}`));
     }
   },
-  credentials: true
+  credentials: true,
+  exposedHeaders: ['ETag', 'Last-Modified', 'X-Cache', 'Content-Range', 'Accept-Ranges']
 }));
+// gzip/brotli for JSON, NDJSON and CSV; images are already compressed and skipped
+app.use(compress({ threshold: 1024 }));
 app.use(express.json());
 app.use(express.urlencoded({ extended: true }));
 
-// Serve uploads folder
-app.use('/uploads', express.static(path.join(__dirname, '../uploads')));
+// Route reads to replicas (DB_REPLICAS), keeping writers on the primary
+app.use(readRouting);
+
+// Expose per-request DB round trips (Server-Timing) for benchmarking
+if (process.env.QUERY_STATS === 'true') {
+  app.use(trackQueries);
+}
+
+// Serve uploads folder (UPLOADS_DELIVERY=proxy leaves it to the fronting server)
+if (UPLOADS_DELIVERY !== 'proxy') {
+  app.use('/uploads', serveUploads());
+}
 
 // Swagger Documentation
 // API Routes
@@ -57,6 +89,9 @@ app.use('/api/comments', commentRoutes);
 app.use('/api/contacts', contactRoutes);
 app.use('/api/dashboard', dashboardRoutes);
 
+// Prometheus metrics: request latency, query timings and pool state
+app.get('/api/metrics', serveMetrics);
+
 // Health check
 app.get('/api/health', (req, res) => {
   res.json({ status: 'ok', message: 'CMS Backend API is running' });
@@ -70,7 +105,43 @@ app.use((err, req, res, next) => {
   });
 });
 
-app.listen(PORT, '0.0.0.0', () => {
+const server = app.listen(PORT, '0.0.0.0', () => {
+  if (cluster.isWorker) {
+    console.log(`👷 Worker ${process.pid} listening on port ${PORT}`);
+    return;
+  }
   console.log(`\n🚀 Backend server running on http://localhost:${PORT}`);
   console.log(`🎯 API endpoints available at http://localhost:${PORT}/api`);
 });
+
+// Stop accepting connections and let in-flight requests finish, then write
+// out buffered submissions and close the database pools before exiting
+const shutdown = async (signal) => {
+  if (shuttingDown) return;
+  shuttingDown = true;
+  console.log(`\n${signal} received, draining connections (pid ${process.pid})...`);
+
+  const closed = new Promise(resolve => server.close(resolve));
+  server.closeIdleConnections();
+  const forceClose = setTimeout(() => {
+    console.warn(`Requests still open after ${SHUTDOWN_TIMEOUT_MS}ms, closing them`);
+    server.closeAllConnections();
+  }, SHUTDOWN_TIMEOUT_MS);
+  await closed;
+  clearTimeout(forceClose);
+
+  try {
+    await drainWriteBuffers();
+  } catch (error) {
+    console.error('Flush on shutdown failed:', error);
+  }
+  try {
+    await closePools();
+  } catch (error) {
+    console.error('Closing database pools failed:', error);
+  }
+  process.exit(0);
+};
+
+process.once('SIGTERM', shutdown);
+process.once('SIGINT', shutdown);
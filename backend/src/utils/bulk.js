@@ -0,0 +1,93 @@
+import { withTransaction } from '../config/database.js';
+
+// Rows one bulk request may touch; filter requests report hasMore beyond it
+export const BULK_MAX_ROWS = parseInt(process.env.BULK_MAX_ROWS) || 5000;
+const CHUNK_SIZE = 500;
+
+const chunk = (items, size = CHUNK_SIZE) => {
+  const chunks = [];
+  for (let i = 0; i < items.length; i += size) {
+    chunks.push(items.slice(i, i + size));
+  }
+  return chunks;
+};
+
+const placeholders = (items) => items.map(() => '?').join(', ');
+
+// Validate a bulk request body: either `ids` or a `filter` on allowed columns
+export const parseBulkTarget = ({ ids, filter } = {}, filterColumns) => {
+  if (ids !== undefined) {
+    if (!Array.isArray(ids) || ids.length === 0 || !ids.every(id => typeof id === 'string')) {
+      return { error: 'ids must be a non-empty array of strings' };
+    }
+    if (ids.length > BULK_MAX_ROWS) {
+      return { error: `At most ${BULK_MAX_ROWS} ids per request` };
+    }
+    return { ids: [...new Set(ids)] };
+  }
+
+  if (filter && typeof filter === 'object') {
+    const entries = filterColumns
+      .filter(column => typeof filter[column] === 'string' && filter[column])
+      .map(column => [column, filter[column]]);
+    if (entries.length === 0) {
+      return { error: `filter needs at least one of: ${filterColumns.join(', ')}` };
+    }
+    return { filter: Object.fromEntries(entries) };
+  }
+
+  return { error: 'Provide ids or filter' };
+};
+
+// Set `status` on (or, without a status, delete) the targeted rows of `table`
+// in one transaction. Rows are locked first, then changed with one statement
+// per chunk. Returns a result per id plus the changed rows (with `columns`).
+export const bulkModerate = ({ table, target, status, columns = [] }) => withTransaction(async (connection) => {
+  const select = `SELECT ${['id', 'status', ...columns].join(', ')} FROM ${table}`;
+  let rows = [];
+  let hasMore = false;
+
+  if (target.ids) {
+    for (const ids of chunk(target.ids)) {
+      const [found] = await connection.execute(`${select} WHERE id IN (${placeholders(ids)}) FOR UPDATE`, ids);
+      rows.push(...found);
+    }
+  } else {
+    // Filter columns come from parseBulkTarget's allow-list
+    const where = Object.keys(target.filter).map(column => `${column} = ?`).join(' AND ');
+    const [found] = await connection.execute(
+      `${select} WHERE ${where} ORDER BY created_at, id LIMIT ${BULK_MAX_ROWS + 1} FOR UPDATE`,
+      Object.values(target.filter)
+    );
+    hasMore = found.length > BULK_MAX_ROWS;
+    rows = found.slice(0, BULK_MAX_ROWS);
+  }
+
+  const changed = status ? rows.filter(row => row.status !== status) : rows;
+  for (const ids of chunk(changed.map(row => row.id))) {
+    if (status) {
+      await connection.execute(`UPDATE ${table} SET status = ? WHERE id IN (${placeholders(ids)})`, [status, ...ids]);
+    } else {
+      await connection.execute(`DELETE FROM ${table} WHERE id IN (${placeholders(ids)})`, ids);
+    }
+  }
+
+  const changedIds = new Set(changed.map(row => row.id));
+  const foundIds = new Set(rows.map(row => row.id));
+  const outcome = status ? 'updated' : 'deleted';
+  const results = (target.ids || rows.map(row => row.id)).map(id => ({
+    id,
+    result: changedIds.has(id) ? outcome : foundIds.has(id) ? 'unchanged' : 'not_found'
+  }));
+
+  return { results, changed, hasMore };
+});
+
+// Response body shared by the bulk endpoints
+export const bulkSummary = ({ results, hasMore }) => {
+  const counts = {};
+  for (const { result } of results) {
+    counts[result] = (counts[result] || 0) + 1;
+  }
+  return { results, counts, hasMore };
+};
@@ -0,0 +1,104 @@
+import cluster from 'cluster';
+
+// Messaging between cluster workers, relayed by the cluster primary (cluster.js).
+// broadcast() runs a sibling's handler registered with onBroadcast(), e.g. to
+// invalidate their in-process caches; collect() gathers a value from every
+// worker, e.g. their metrics, through providers registered with onCollect().
+const COLLECT_TIMEOUT_MS = 2000;
+
+const handlers = new Map();
+const providers = new Map();
+const pending = new Map();
+let nextId = 0;
+
+export const onBroadcast = (type, handler) => {
+  handlers.set(type, handler);
+};
+
+export const broadcast = (type, payload) => {
+  if (cluster.isWorker && process.connected) {
+    process.send({ cmsBroadcast: type, payload });
+  }
+};
+
+export const onCollect = (type, provider) => {
+  providers.set(type, provider);
+};
+
+// Resolves with one value per live worker (this one included); outside
+// cluster mode, just this process's value
+export const collect = async (type) => {
+  if (!cluster.isWorker || !process.connected) {
+    return [await providers.get(type)()];
+  }
+
+  const id = `${process.pid}:${nextId++}`;
+  return new Promise((resolve) => {
+    pending.set(id, resolve);
+    process.send({ cmsCollect: type, id });
+  });
+};
+
+if (cluster.isWorker) {
+  process.on('message', async (message) => {
+    if (!message) return;
+
+    if (message.cmsBroadcast) {
+      const handler = handlers.get(message.cmsBroadcast);
+      if (handler) handler(message.payload);
+    } else if (message.cmsCollectRequest) {
+      const provider = providers.get(message.cmsCollectRequest);
+      const value = provider ? await provider() : null;
+      if (process.connected) process.send({ cmsCollectReply: message.id, value });
+    } else if (message.cmsCollectResult) {
+      const resolve = pending.get(message.cmsCollectResult);
+      pending.delete(message.cmsCollectResult);
+      if (resolve) resolve(message.values);
+    }
+  });
+}
+
+// Cluster primary side: relay broadcasts to every other worker (and to the
+// primary's own onBroadcast handlers) and fan collect requests out to all of
+// them, answering with whatever arrived in time
+export const relayWorkerMessages = () => {
+  const collecting = new Map();
+
+  const finish = (id) => {
+    const request = collecting.get(id);
+    if (!request) return;
+    collecting.delete(id);
+    clearTimeout(request.timer);
+    if (request.requester.isConnected()) {
+      request.requester.send({ cmsCollectResult: id, values: request.values.filter(value => value !== null) });
+    }
+  };
+
+  cluster.on('message', (sender, message) => {
+    if (!message) return;
+
+    if (message.cmsBroadcast) {
+      const handler = handlers.get(message.cmsBroadcast);
+      if (handler) handler(message.payload);
+      for (const worker of Object.values(cluster.workers)) {
+        if (worker !== sender && worker.isConnected()) worker.send(message);
+      }
+    } else if (message.cmsCollect) {
+      const workers = Object.values(cluster.workers).filter(worker => worker.isConnected());
+      collecting.set(message.id, {
+        requester: sender,
+        values: [],
+        expected: workers.length,
+        timer: setTimeout(() => finish(message.id), COLLECT_TIMEOUT_MS)
+      });
+      for (const worker of workers) {
+        worker.send({ cmsCollectRequest: message.cmsCollect, id: message.id });
+      }
+    } else if (message.cmsCollectReply) {
+      const request = collecting.get(message.cmsCollectReply);
+      if (!request) return;
+      request.values.push(message.value);
+      if (request.values.length >= request.expected) finish(message.cmsCollectReply);
+    }
+  });
+};
@@ -0,0 +1,55 @@
+import crypto from 'crypto';
+import { broadcast, onBroadcast } from './clusterSync.js';
+
+// Version counters per content scope, bumped by every write that changes
+// what the public read endpoints return. The epoch keeps ETags from a
+// restarted server from ever matching ones it handed out before.
+//
+// In cluster mode the primary process owns the epoch, boot time and current
+// versions and hands them to each worker it forks (versionEnv), so every
+// worker gives the same content the same ETag and Last-Modified.
+const inherited = process.env.CMS_CONTENT_VERSIONS ? JSON.parse(process.env.CMS_CONTENT_VERSIONS) : null;
+const epoch = inherited ? inherited.epoch : crypto.randomBytes(4).toString('hex');
+const bootTime = inherited ? inherited.bootTime : Date.now();
+const scopes = new Map(inherited ? Object.entries(inherited.scopes) : []);
+
+const scopeState = (scope) => {
+  if (!scopes.has(scope)) {
+    scopes.set(scope, { version: 0, updatedAt: bootTime });
+  }
+  return scopes.get(scope);
+};
+
+const bump = ({ names, at }) => {
+  for (const name of names) {
+    const state = scopeState(name);
+    state.version += 1;
+    state.updatedAt = at;
+  }
+};
+
+// Siblings apply the same bump (with the writer's timestamp) when the
+// broadcast reaches them, usually within a millisecond; until then they
+// still answer with the previous version
+export const bumpVersion = (...names) => {
+  const change = { names, at: Date.now() };
+  bump(change);
+  broadcast('version:bump', change);
+};
+onBroadcast('version:bump', bump);
+
+// Environment for a worker about to be forked: the primary's epoch and the
+// versions it has seen relayed so far. Bumps relayed after the fork reach
+// the new worker as broadcasts.
+export const versionEnv = () => ({
+  CMS_CONTENT_VERSIONS: JSON.stringify({ epoch, bootTime, scopes: Object.fromEntries(scopes) })
+});
+
+export const versionTag = (names) => {
+  const versions = names.map(name => `${name}.${scopeState(name).version}`).join('-');
+  return `"${epoch}-${versions}"`;
+};
+
+export const lastModified = (names) => {
+  return new Date(Math.max(...names.map(name => scopeState(name).updatedAt)));
+};
@@ -1,3 +1,5 @@
+import { broadcast, onBroadcast } from './clusterSync.js';
+
 export const generateSlug = (text) => {
   return text
     .toLowerCase()
@@ -10,3 +12,128 @@ export const paginate = (page = 1, limit = 10) => {
   const offset = (page - 1) * limit;
   return { limit: parseInt(limit), offset };
 };
+
+export const MAX_PAGE_SIZE = 100;
+
+export const parseLimit = (limit, fallback = 10) => {
+  const value = parseInt(limit);
+  if (!Number.isFinite(value) || value < 1) return fallback;
+  return Math.min(value, MAX_PAGE_SIZE);
+};
+
+// Opaque keyset cursor over (created_at, id)
+export const encodeCursor = (row) => {
+  const createdAt = new Date(row.created_at).toISOString();
+  return Buffer.from(JSON.stringify([createdAt, row.id])).toString('base64url');
+};
+
+export const decodeCursor = (cursor) => {
+  try {
+    const [createdAt, id] = JSON.parse(Buffer.from(cursor, 'base64url').toString());
+    const date = new Date(createdAt);
+    if (Number.isNaN(date.getTime()) || typeof id !== 'string') return null;
+    return { createdAt: date, id };
+  } catch (e) {
+    return null;
+  }
+};
+
+// WHERE fragment for rows after the cursor in ORDER BY created_at DESC, id DESC
+export const afterCursor = (cursor, alias = '') => ({
+  clause: ` AND (${alias}created_at < ? OR (${alias}created_at = ? AND ${alias}id < ?))`,
+  params: [cursor.createdAt, cursor.createdAt, cursor.id]
+});
+
+// Split a limit+1 result into the page and the cursor for the next one
+export const keysetPage = (rows, limit) => {
+  const hasMore = rows.length > limit;
+  const page = hasMore ? rows.slice(0, limit) : rows;
+  return {
+    rows: page,
+    nextCursor: hasMore ? encodeCursor(page[page.length - 1]) : null
+  };
+};
+
+// Short-lived totals so list endpoints don't run COUNT(*) on every request
+const COUNT_CACHE_TTL_MS = parseInt(process.env.COUNT_CACHE_TTL_MS) || 30000;
+const COUNT_CACHE_MAX_ENTRIES = 1000;
+const countCache = new Map();
+
+export const cachedCount = async (key, loader) => {
+  const cached = countCache.get(key);
+  if (cached && cached.expiresAt > Date.now()) {
+    return cached.total;
+  }
+
+  const total = await loader();
+  countCache.delete(key);
+  countCache.set(key, { total, expiresAt: Date.now() + COUNT_CACHE_TTL_MS });
+  if (countCache.size > COUNT_CACHE_MAX_ENTRIES) {
+    countCache.delete(countCache.keys().next().value);
+  }
+  return total;
+};
+
+const clearCounts = (prefix) => {
+  for (const key of countCache.keys()) {
+    if (key.startsWith(prefix)) countCache.delete(key);
+  }
+};
+
+export const clearCountCache = (prefix) => {
+  clearCounts(prefix);
+  broadcast('counts:clear', prefix);
+};
+onBroadcast('counts:clear', clearCounts);
+
+// Opaque cursor over (relevance score, id) for ranked search results
+export const encodeScoreCursor = (score, id) => {
+  return Buffer.from(JSON.stringify([score, id])).toString('base64url');
+};
+
+export const decodeScoreCursor = (cursor) => {
+  try {
+    const [score, id] = JSON.parse(Buffer.from(cursor, 'base64url').toString());
+    if (typeof score !== 'number' || typeof id !== 'string') return null;
+    return { score, id };
+  } catch (e) {
+    return null;
+  }
+};
+
+const escapeHtml = (text) => text
+  .replace(/&/g, '&amp;')
+  .replace(/</g, '&lt;')
+  .replace(/>/g, '&gt;')
+  .replace(/"/g, '&quot;');
+
+const escapeRegExp = (text) => text.replace(/[.*+?^${}()|[\]\\]/g, '\\$&');
+
+// Words as the FULLTEXT parser sees them (InnoDB ignores tokens shorter than 3)
+export const searchTerms = (query) => {
+  const words = query.toLowerCase().match(/[\p{L}\p{N}]+/gu) || [];
+  return [...new Set(words.filter(word => word.length >= 3))];
+};
+
+// HTML-escaped excerpt around the first matching term, with matches wrapped in <mark>
+export const highlight = (text, terms, length = 160) => {
+  const plain = (text || '').replace(/<[^>]*>/g, ' ').replace(/\s+/g, ' ').trim();
+  if (terms.length === 0) return escapeHtml(plain.slice(0, length));
+
+  // Match terms at the start of a word, so "stream" also marks "streams"
+  const pattern = new RegExp(`(?<![\\p{L}\\p{N}])(${terms.map(escapeRegExp).join('|')})`, 'giu');
+  const first = plain.search(pattern);
+
+  let start = 0;
+  if (first > length / 3) {
+    start = plain.lastIndexOf(' ', first - Math.floor(length / 3)) + 1;
+  }
+  const end = Math.min(plain.length, start + length);
+
+  // split() with a capture group alternates plain text and matched terms
+  const excerpt = plain.slice(start, end)
+    .split(pattern)
+    .map((part, index) => (index % 2 === 1 ? `<mark>${escapeHtml(part)}</mark>` : escapeHtml(part)))
+    .join('');
+  return `${start > 0 ? '…' : ''}${excerpt}${end < plain.length ? '…' : ''}`;
+};
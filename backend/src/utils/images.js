@@ -0,0 +1,85 @@
+import fs from 'fs';
+import os from 'os';
+import path from 'path';
+import db from '../config/database.js';
+import { UPLOADS_DIR } from '../middleware/upload.js';
+import { responseCache } from './responseCache.js';
+import { bumpVersion } from './contentVersion.js';
+import { WorkerPool } from './workerPool.js';
+import { revalidatePages } from './revalidate.js';
+
+const parseList = (value, fallback) => (value ? value.split(',').map(item => item.trim()).filter(Boolean) : fallback);
+
+const VARIANT_WIDTHS = parseList(process.env.IMAGE_VARIANT_WIDTHS, ['320', '640', '1280']).map(Number);
+const VARIANT_FORMATS = parseList(process.env.IMAGE_VARIANT_FORMATS, ['webp', 'avif']);
+const VARIANTS_DIR = path.join(UPLOADS_DIR, 'variants');
+const WORKER_URL = new URL('../workers/imageVariants.js', import.meta.url);
+
+const pool = new WorkerPool(WORKER_URL, parseInt(process.env.IMAGE_WORKERS) || Math.min(2, os.cpus().length));
+const inFlight = new Map();
+
+// "/uploads/<sha256>.<ext>" -> sha256. Uploads from before content hashing have no variants.
+export const imageHash = (featuredImage) => {
+  const match = /^\/uploads\/([0-9a-f]{64})\.\w+$/.exec(featuredImage || '');
+  return match ? match[1] : null;
+};
+
+const buildVariants = async (hash, filename) => {
+  const [existing] = await db.execute('SELECT 1 FROM image_variants WHERE image_hash = ? LIMIT 1', [hash]);
+  if (existing.length > 0) return;
+
+  await fs.promises.mkdir(VARIANTS_DIR, { recursive: true });
+  const variants = await pool.run({
+    hash,
+    sourcePath: path.join(UPLOADS_DIR, filename),
+    outputDir: VARIANTS_DIR,
+    widths: VARIANT_WIDTHS,
+    formats: VARIANT_FORMATS
+  });
+
+  await db.execute(
+    `INSERT IGNORE INTO image_variants (image_hash, format, width, height, bytes, path)
+     VALUES ${variants.map(() => '(?, ?, ?, ?, ?, ?)').join(', ')}`,
+    variants.flatMap(variant => [
+      hash, variant.format, variant.width, variant.height, variant.bytes, `/uploads/variants/${variant.filename}`
+    ])
+  );
+
+  // Responses cached before the variants existed only point at the original
+  responseCache.invalidate(`image:${hash}`);
+  bumpVersion('blogs');
+  const [blogs] = await db.execute('SELECT slug FROM blogs WHERE featured_image = ?', [`/uploads/${filename}`]);
+  if (blogs.length > 0) {
+    revalidatePages({ slugs: blogs.map(blog => blog.slug), list: true });
+  }
+};
+
+// Generate variants for an uploaded file in the background. Safe to call on
+// every save: images that already have variants are skipped.
+export const queueImageVariants = (file) => {
+  if (!file || !file.hash || inFlight.has(file.hash)) return;
+
+  const job = buildVariants(file.hash, file.filename)
+    .catch(error => console.error('Image variants error:', error))
+    .finally(() => inFlight.delete(file.hash));
+  inFlight.set(file.hash, job);
+};
+
+// Variants per image hash, smallest first
+export const loadImageVariants = async (hashes) => {
+  const byHash = new Map();
+  if (hashes.length === 0) return byHash;
+
+  const [rows] = await db.execute(
+    `SELECT image_hash, format, width, height, path
+     FROM image_variants
+     WHERE image_hash IN (${hashes.map(() => '?').join(', ')})
+     ORDER BY width`,
+    hashes
+  );
+  for (const { image_hash, ...variant } of rows) {
+    if (!byHash.has(image_hash)) byHash.set(image_hash, []);
+    byHash.get(image_hash).push(variant);
+  }
+  return byHash;
+};
@@ -0,0 +1,163 @@
+// Minimal Prometheus registry: counters, gauges and histograms rendered in
+// the text exposition format for GET /api/metrics.
+
+const DEFAULT_BUCKETS = [0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10];
+
+const labelKey = (labelNames, labels) => labelNames.map(name => labels[name] ?? '').join('\u0000');
+
+const escapeLabel = (value) => String(value).replace(/\\/g, '\\\\').replace(/\n/g, '\\n').replace(/"/g, '\\"');
+
+const formatLabels = (labelNames, values, extra = '') => {
+  const pairs = labelNames.map((name, i) => `${name}="${escapeLabel(values[i])}"`);
+  if (extra) pairs.push(extra);
+  return pairs.length > 0 ? `{${pairs.join(',')}}` : '';
+};
+
+class Metric {
+  constructor(type, name, help, labelNames = []) {
+    this.type = type;
+    this.name = name;
+    this.help = help;
+    this.labelNames = labelNames;
+    this.series = new Map();
+  }
+
+  entry(labels, create) {
+    const key = labelKey(this.labelNames, labels);
+    if (!this.series.has(key)) {
+      this.series.set(key, { values: this.labelNames.map(name => labels[name] ?? ''), ...create() });
+    }
+    return this.series.get(key);
+  }
+
+  header() {
+    return `# HELP ${this.name} ${this.help}\n# TYPE ${this.name} ${this.type}\n`;
+  }
+}
+
+export class Counter extends Metric {
+  constructor(name, help, labelNames) {
+    super('counter', name, help, labelNames);
+  }
+
+  inc(labels = {}, value = 1) {
+    this.entry(labels, () => ({ value: 0 })).value += value;
+  }
+
+  render() {
+    let text = this.header();
+    for (const { values, value } of this.series.values()) {
+      text += `${this.name}${formatLabels(this.labelNames, values)} ${value}\n`;
+    }
+    return text;
+  }
+}
+
+// Gauges read their current values when scraped
+export class Gauge extends Metric {
+  constructor(name, help, labelNames, collect) {
+    super('gauge', name, help, labelNames);
+    this.collect = collect;
+  }
+
+  render() {
+    let text = this.header();
+    for (const { labels = {}, value } of this.collect()) {
+      text += `${this.name}${formatLabels(this.labelNames, this.labelNames.map(name => labels[name] ?? ''))} ${value}\n`;
+    }
+    return text;
+  }
+}
+
+export class Histogram extends Metric {
+  constructor(name, help, labelNames, buckets = DEFAULT_BUCKETS) {
+    super('histogram', name, help, labelNames);
+    this.buckets = buckets;
+  }
+
+  observe(labels, seconds) {
+    const series = this.entry(labels, () => ({ counts: this.buckets.map(() => 0), sum: 0, count: 0 }));
+    for (let i = 0; i < this.buckets.length; i++) {
+      if (seconds <= this.buckets[i]) series.counts[i]++;
+    }
+    series.sum += seconds;
+    series.count++;
+  }
+
+  render() {
+    let text = this.header();
+    for (const { values, counts, sum, count } of this.series.values()) {
+      this.buckets.forEach((bucket, i) => {
+        text += `${this.name}_bucket${formatLabels(this.labelNames, values, `le="${bucket}"`)} ${counts[i]}\n`;
+      });
+      text += `${this.name}_bucket${formatLabels(this.labelNames, values, 'le="+Inf"')} ${count}\n`;
+      text += `${this.name}_sum${formatLabels(this.labelNames, values)} ${sum}\n`;
+      text += `${this.name}_count${formatLabels(this.labelNames, values)} ${count}\n`;
+    }
+    return text;
+  }
+}
+
+const metrics = [];
+
+export const register = (metric) => {
+  metrics.push(metric);
+  return metric;
+};
+
+export const renderMetrics = () => metrics.map(metric => metric.render()).join('');
+
+// HTTP latency per matched route, e.g. "/api/blogs/:slug"
+export const httpRequestDuration = register(new Histogram(
+  'cms_http_request_duration_seconds',
+  'HTTP request latency by route',
+  ['method', 'route', 'status']
+));
+
+export const dbQueryDuration = register(new Histogram(
+  'cms_db_query_duration_seconds',
+  'Query latency (including pool wait) by pool and statement shape, e.g. "SELECT blogs"',
+  ['pool', 'statement']
+));
+
+export const dbPoolAcquireDuration = register(new Histogram(
+  'cms_db_pool_acquire_seconds',
+  'Time spent waiting for a pooled connection',
+  ['pool']
+));
+
+export const dbSlowQueries = register(new Counter(
+  'cms_db_slow_queries_total',
+  'Queries slower than SLOW_QUERY_MS',
+  ['statement']
+));
+
+// "SELECT b.*, ... FROM blogs b JOIN ..." -> "SELECT blogs": bounded label cardinality
+export const statementLabel = (sql) => {
+  const text = typeof sql === 'string' ? sql : sql?.sql || '';
+  const verb = (text.match(/^\s*(\w+)/) || [, 'OTHER'])[1].toUpperCase();
+  const table = text.match(/\b(?:FROM|INTO|UPDATE|JOIN)\s+`?(\w+)/i);
+  return table ? `${verb} ${table[1]}` : verb;
+};
+
+// Combine the output of several cluster workers into one exposition: a single
+// HELP/TYPE header per family, with every sample tagged by its worker
+export const mergeWorkerMetrics = (outputs) => {
+  const families = new Map();
+  for (const { worker, text } of outputs) {
+    let family = null;
+    for (const line of text.split('\n')) {
+      if (!line) continue;
+      const header = line.match(/^# (?:HELP|TYPE) (\S+)/);
+      if (header) {
+        if (!families.has(header[1])) families.set(header[1], { headers: [], samples: [] });
+        family = families.get(header[1]);
+        if (!family.headers.includes(line)) family.headers.push(line);
+        continue;
+      }
+      family?.samples.push(line.replace(/^([^\s{]+)(?:\{(.*)\})?/, (match, name, labels) =>
+        `${name}{worker="${worker}"${labels ? `,${labels}` : ''}}`));
+    }
+  }
+  return [...families.values()].map(({ headers, samples }) => [...headers, ...samples].join('\n') + '\n').join('');
+};
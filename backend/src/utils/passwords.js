@@ -0,0 +1,20 @@
+import os from 'os';
+import { WorkerPool } from './workerPool.js';
+import { register, Gauge } from './metrics.js';
+
+const WORKER_URL = new URL('../workers/passwords.js', import.meta.url);
+
+// Password checks run on their own threads so a burst of logins cannot stall
+// the event loop. Past PASSWORD_MAX_QUEUED waiting jobs, callers get PoolBusyError (503).
+const pool = new WorkerPool(
+  WORKER_URL,
+  parseInt(process.env.PASSWORD_WORKERS) || Math.min(2, os.cpus().length),
+  { maxQueued: parseInt(process.env.PASSWORD_MAX_QUEUED) || 64 }
+);
+
+register(new Gauge('cms_password_jobs', 'Password verify jobs by state', ['state'], () => [
+  { labels: { state: 'running' }, value: pool.workers.size - pool.idle.length },
+  { labels: { state: 'queued' }, value: pool.queue.length }
+]));
+
+export const verifyPassword = (password, hash) => pool.run({ password, hash });
@@ -0,0 +1,113 @@
+import { broadcast, onBroadcast } from './clusterSync.js';
+
+// In-process TTL + LRU cache for serialized JSON responses.
+// Entries carry tags (e.g. "blog:<id>", "category:<id>") so writes can
+// invalidate exactly the responses that contain the changed rows.
+export class ResponseCache {
+  constructor({ ttlMs, maxBytes }) {
+    this.ttlMs = ttlMs;
+    this.maxBytes = maxBytes;
+    this.entries = new Map();
+    this.tagIndex = new Map();
+    this.bytes = 0;
+    this.hits = 0;
+    this.misses = 0;
+    this.evictions = 0;
+    this.invalidations = 0;
+  }
+
+  get(key) {
+    const entry = this.entries.get(key);
+    if (!entry || entry.expiresAt <= Date.now()) {
+      if (entry) this.remove(key);
+      this.misses++;
+      return undefined;
+    }
+
+    // Re-insert to mark as most recently used
+    this.entries.delete(key);
+    this.entries.set(key, entry);
+    this.hits++;
+    return entry.body;
+  }
+
+  set(key, body, tags = []) {
+    const size = Buffer.byteLength(body) + key.length;
+    if (size > this.maxBytes) return;
+
+    this.remove(key);
+    this.entries.set(key, { body, tags, size, expiresAt: Date.now() + this.ttlMs });
+    this.bytes += size;
+    for (const tag of tags) {
+      if (!this.tagIndex.has(tag)) this.tagIndex.set(tag, new Set());
+      this.tagIndex.get(tag).add(key);
+    }
+
+    while (this.bytes > this.maxBytes) {
+      this.remove(this.entries.keys().next().value);
+      this.evictions++;
+    }
+  }
+
+  remove(key) {
+    const entry = this.entries.get(key);
+    if (!entry) return;
+
+    this.entries.delete(key);
+    this.bytes -= entry.size;
+    for (const tag of entry.tags) {
+      const keys = this.tagIndex.get(tag);
+      if (!keys) continue;
+      keys.delete(key);
+      if (keys.size === 0) this.tagIndex.delete(tag);
+    }
+  }
+
+  invalidate(...tags) {
+    for (const tag of tags) {
+      const keys = this.tagIndex.get(tag);
+      if (!keys) continue;
+      for (const key of [...keys]) {
+        this.remove(key);
+        this.invalidations++;
+      }
+    }
+  }
+
+  stats() {
+    const lookups = this.hits + this.misses;
+    return {
+      entries: this.entries.size,
+      bytes: this.bytes,
+      maxBytes: this.maxBytes,
+      ttlMs: this.ttlMs,
+      hits: this.hits,
+      misses: this.misses,
+      hitRate: lookups === 0 ? 0 : this.hits / lookups,
+      evictions: this.evictions,
+      invalidations: this.invalidations
+    };
+  }
+}
+
+// RESPONSE_CACHE_MAX_BYTES=0 disables caching
+const maxBytes = parseInt(process.env.RESPONSE_CACHE_MAX_BYTES);
+
+export const responseCache = new ResponseCache({
+  ttlMs: parseInt(process.env.RESPONSE_CACHE_TTL_MS) || 60000,
+  maxBytes: Number.isFinite(maxBytes) ? maxBytes : 32 * 1024 * 1024
+});
+
+// Invalidations also reach the caches of sibling cluster workers
+const invalidateLocal = responseCache.invalidate.bind(responseCache);
+responseCache.invalidate = (...tags) => {
+  invalidateLocal(...tags);
+  broadcast('cache:invalidate', tags);
+};
+onBroadcast('cache:invalidate', (tags) => invalidateLocal(...tags));
+
+// Send a cached or freshly serialized JSON body
+export const sendJson = (res, body, cacheStatus) => {
+  res.set('X-Cache', cacheStatus);
+  res.type('json').send(body);
+};
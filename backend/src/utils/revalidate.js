@@ -0,0 +1,73 @@
+import crypto from 'crypto';
+import db, { dbSession } from '../config/database.js';
+
+// Regenerates the frontend's pre-rendered blog pages after content changes.
+// Tags match the ones frontend/src/lib/content.ts fetches with:
+//   blogs         - the home page and list pages
+//   blog-pages    - every post page (category/tag renames)
+//   blog:<slug>   - one post page
+// Requests are signed with REVALIDATE_SECRET; without FRONTEND_REVALIDATE_URL
+// and the secret nothing is sent.
+const REVALIDATE_URL = process.env.FRONTEND_REVALIDATE_URL;
+const REVALIDATE_SECRET = process.env.REVALIDATE_SECRET;
+// Changes within this window (e.g. a bulk approval) go out as one request
+const DEBOUNCE_MS = parseInt(process.env.REVALIDATE_DEBOUNCE_MS) || 250;
+const TIMEOUT_MS = 5000;
+
+const pendingTags = new Set();
+const pendingBlogIds = new Set();
+let timer = null;
+
+const sign = (body) =>
+  `sha256=${crypto.createHmac('sha256', REVALIDATE_SECRET).update(body).digest('hex')}`;
+
+const send = async () => {
+  timer = null;
+
+  try {
+    // Post pages are tagged by slug; resolve ids now, once per batch, on the
+    // primary since a replica may not have the posts yet
+    if (pendingBlogIds.size > 0) {
+      const ids = [...pendingBlogIds];
+      pendingBlogIds.clear();
+      const [rows] = await dbSession.run({ primary: true }, () => db.execute(
+        `SELECT slug FROM blogs WHERE id IN (${ids.map(() => '?').join(', ')})`,
+        ids
+      ));
+      rows.forEach(row => pendingTags.add(`blog:${row.slug}`));
+    }
+    if (pendingTags.size === 0) return;
+
+    const tags = [...pendingTags];
+    pendingTags.clear();
+    const body = JSON.stringify({ tags, timestamp: Date.now() });
+    const response = await fetch(REVALIDATE_URL, {
+      method: 'POST',
+      headers: {
+        'Content-Type': 'application/json',
+        'X-Revalidate-Signature': sign(body)
+      },
+      body,
+      signal: AbortSignal.timeout(TIMEOUT_MS)
+    });
+    if (!response.ok) {
+      console.error(`Page revalidation failed: HTTP ${response.status}`);
+    }
+  } catch (error) {
+    // The frontend's time-based revalidation catches up eventually
+    console.error('Page revalidation failed:', error.message);
+  }
+};
+
+// Queue pages for regeneration: post pages by slug or blog id, plus the list
+// pages (`list`) or every page (`all`)
+export const revalidatePages = ({ slugs = [], blogIds = [], list = false, all = false }) => {
+  if (!REVALIDATE_URL || !REVALIDATE_SECRET) return;
+
+  if (list || all) pendingTags.add('blogs');
+  if (all) pendingTags.add('blog-pages');
+  slugs.filter(Boolean).forEach(slug => pendingTags.add(`blog:${slug}`));
+  blogIds.forEach(id => pendingBlogIds.add(id));
+
+  if (!timer) timer = setTimeout(send, DEBOUNCE_MS);
+};
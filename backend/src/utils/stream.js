@@ -0,0 +1,102 @@
+import { Transform } from 'stream';
+import { pipeline } from 'stream/promises';
+
+// Row-object streams -> text, so large lists never sit in memory as one array
+
+const jsonArray = () => {
+  let first = true;
+  return new Transform({
+    writableObjectMode: true,
+    transform(row, encoding, cb) {
+      cb(null, (first ? '[' : ',') + JSON.stringify(row));
+      first = false;
+    },
+    flush(cb) {
+      cb(null, first ? '[]' : ']');
+    }
+  });
+};
+
+const ndjson = () => new Transform({
+  writableObjectMode: true,
+  transform(row, encoding, cb) {
+    cb(null, JSON.stringify(row) + '\n');
+  }
+});
+
+const csvField = (value) => {
+  if (value === null || value === undefined) return '';
+  let text = value instanceof Date ? value.toISOString() : String(value);
+  // Keep spreadsheet apps from evaluating user-submitted text as a formula
+  if (/^[=+\-@\t\r]/.test(text)) text = `'${text}`;
+  return /[",\r\n]/.test(text) ? `"${text.replace(/"/g, '""')}"` : text;
+};
+
+const csv = (columns) => {
+  const header = columns.join(',') + '\r\n';
+  let headerSent = false;
+  return new Transform({
+    writableObjectMode: true,
+    transform(row, encoding, cb) {
+      const line = columns.map(column => csvField(row[column])).join(',') + '\r\n';
+      cb(null, headerSent ? line : header + line);
+      headerSent = true;
+    },
+    flush(cb) {
+      cb(null, headerSent ? '' : header);
+    }
+  });
+};
+
+const FORMATS = {
+  json: { type: 'application/json', serializer: jsonArray },
+  ndjson: { type: 'application/x-ndjson', serializer: ndjson },
+  csv: { type: 'text/csv', serializer: csv }
+};
+
+// Resolves when the response can take more data or has gone away
+const drained = (res) => new Promise((resolve) => {
+  const done = () => {
+    res.off('drain', done);
+    res.off('close', done);
+    resolve();
+  };
+  res.on('drain', done);
+  res.on('close', done);
+});
+
+// Stream rows to the response with backpressure. Status and headers go out
+// with the first chunk, so a query that fails before any row rejects and the
+// caller answers with its normal 500. Once bytes are sent, a failure destroys
+// the response, so the client sees an aborted download rather than a
+// truncated body that looks complete.
+export const sendRows = async (res, rows, format, { columns, filename } = {}) => {
+  const { type, serializer } = FORMATS[format];
+  let started = false;
+
+  const start = () => {
+    started = true;
+    res.type(type);
+    if (filename) res.attachment(`${filename}.${format}`);
+  };
+
+  const send = async (body) => {
+    for await (const chunk of body) {
+      if (res.destroyed) throw new Error('Client disconnected');
+      if (!started) start();
+      if (!res.write(chunk)) await drained(res);
+    }
+    if (!started) start();
+    res.end();
+  };
+
+  try {
+    await pipeline(rows, serializer(columns), send);
+  } catch (error) {
+    // The client went away; the pipeline already released the query
+    if (res.destroyed) return;
+    if (!started) throw error;
+    console.error('Stream rows error:', error);
+    res.destroy(error);
+  }
+};
@@ -0,0 +1,71 @@
+import { Worker } from 'worker_threads';
+
+// Rejection when a pool's queue is full; callers answer 503
+export class PoolBusyError extends Error {
+  constructor(message = 'Server busy, please retry shortly') {
+    super(message);
+    this.status = 503;
+  }
+}
+
+// Fixed-size pool of worker threads, one job per worker at a time. Workers
+// answer each job with { result } or { error }.
+export class WorkerPool {
+  constructor(workerUrl, size, { maxQueued = Infinity } = {}) {
+    this.workerUrl = workerUrl;
+    this.size = size;
+    this.maxQueued = maxQueued;
+    this.workers = new Set();
+    this.idle = [];
+    this.queue = [];
+  }
+
+  run(job) {
+    if (this.queue.length >= this.maxQueued) {
+      return Promise.reject(new PoolBusyError());
+    }
+
+    return new Promise((resolve, reject) => {
+      this.queue.push({ job, resolve, reject });
+      this.drain();
+    });
+  }
+
+  drain() {
+    while (this.queue.length > 0) {
+      const worker = this.idle.pop() || (this.workers.size < this.size ? this.spawn() : null);
+      if (!worker) return;
+
+      worker.task = this.queue.shift();
+      worker.postMessage(worker.task.job);
+    }
+  }
+
+  spawn() {
+    const worker = new Worker(this.workerUrl);
+    this.workers.add(worker);
+
+    worker.on('message', ({ result, error }) => {
+      const { resolve, reject } = worker.task;
+      worker.task = null;
+      if (error) reject(new Error(error));
+      else resolve(result);
+      this.idle.push(worker);
+      this.drain();
+    });
+    worker.on('error', (error) => {
+      if (worker.task) worker.task.reject(error);
+      worker.task = null;
+    });
+    worker.on('exit', () => {
+      // Crashed workers are replaced on the next drain
+      this.workers.delete(worker);
+      this.idle = this.idle.filter(idle => idle !== worker);
+      this.drain();
+    });
+
+    // Idle workers must not keep the process alive
+    worker.unref();
+    return worker;
+  }
+}
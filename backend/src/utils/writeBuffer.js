@@ -0,0 +1,130 @@
+import db, { dbSession } from '../config/database.js';
+
+const FLUSH_MS = parseInt(process.env.WRITE_BUFFER_FLUSH_MS) || 20;
+const MAX_BATCH = parseInt(process.env.WRITE_BUFFER_MAX_BATCH) || 200;
+const MAX_QUEUED = parseInt(process.env.WRITE_BUFFER_MAX_QUEUED) || 5000;
+
+// Rejection carrying the HTTP status the controller should answer with
+export class WriteError extends Error {
+  constructor(message, status) {
+    super(message);
+    this.status = status;
+  }
+}
+
+const buffers = [];
+
+// Coalesces single-row INSERTs from many requests into multi-row INSERTs.
+// add() resolves once the row is stored, so callers keep their 201 semantics,
+// but all submissions share one pool connection per flush instead of one each.
+export class WriteBuffer {
+  constructor({ table, columns, validate, afterFlush }) {
+    this.table = table;
+    this.columns = columns;
+    // validate(rows) -> per-row WriteError or null, checked once per batch
+    this.validate = validate;
+    this.afterFlush = afterFlush;
+    this.queue = [];
+    this.timer = null;
+    this.flushing = null;
+    buffers.push(this);
+  }
+
+  add(row) {
+    if (this.queue.length >= MAX_QUEUED) {
+      return Promise.reject(new WriteError('Too many submissions, please retry shortly', 503));
+    }
+
+    return new Promise((resolve, reject) => {
+      this.queue.push({ row, resolve, reject });
+      if (this.queue.length >= MAX_BATCH) this.flushSoon(0);
+      else this.flushSoon(FLUSH_MS);
+    });
+  }
+
+  flushSoon(delay) {
+    if (this.flushing) return;
+    if (this.timer && delay > 0) return;
+    clearTimeout(this.timer);
+    // The timer is armed inside some request; leave its routing session so
+    // the batched write does not make that one user's reads sticky
+    this.timer = setTimeout(() => dbSession.exit(() => this.flush()), delay);
+  }
+
+  // One batch at a time; anything queued meanwhile goes out in the next one
+  async flush() {
+    this.timer = null;
+    if (this.flushing || this.queue.length === 0) return this.flushing;
+
+    const batch = this.queue.splice(0, MAX_BATCH);
+    this.flushing = this.write(batch).finally(() => {
+      this.flushing = null;
+      if (this.queue.length > 0) this.flushSoon(this.queue.length >= MAX_BATCH ? 0 : FLUSH_MS);
+    });
+    return this.flushing;
+  }
+
+  async write(batch) {
+    let accepted = batch;
+    if (this.validate) {
+      let errors;
+      try {
+        errors = await this.validate(batch.map(entry => entry.row));
+      } catch (error) {
+        // Unvalidated rows are never stored; the clients can retry
+        console.error(`Validating batched ${this.table} rows failed:`, error.message);
+        batch.forEach(entry => entry.reject(new WriteError('Service temporarily unavailable, please retry shortly', 503)));
+        return;
+      }
+      accepted = batch.filter((entry, i) => {
+        if (errors[i]) entry.reject(errors[i]);
+        return !errors[i];
+      });
+    }
+    if (accepted.length === 0) return;
+
+    try {
+      await this.insert(accepted);
+    } catch (error) {
+      // One bad row must not fail its neighbours: retry the batch row by row
+      console.error(`Batched ${this.table} insert failed, retrying rows individually:`, error.message);
+      accepted = await this.insertEach(accepted);
+    }
+
+    accepted.forEach(entry => entry.resolve());
+    if (accepted.length > 0 && this.afterFlush) this.afterFlush();
+  }
+
+  async insert(entries) {
+    const rowPlaceholders = `(${this.columns.map(() => '?').join(', ')})`;
+    await db.execute(
+      `INSERT INTO ${this.table} (${this.columns.join(', ')})
+       VALUES ${entries.map(() => rowPlaceholders).join(', ')}`,
+      entries.flatMap(entry => this.columns.map(column => entry.row[column] ?? null))
+    );
+  }
+
+  async insertEach(entries) {
+    const stored = [];
+    for (const entry of entries) {
+      try {
+        await this.insert([entry]);
+        stored.push(entry);
+      } catch (error) {
+        console.error(`Insert into ${this.table} failed:`, error.message);
+        entry.reject(new WriteError('Failed to save submission', 500));
+      }
+    }
+    return stored;
+  }
+
+  // Write everything still queued (graceful shutdown)
+  async drain() {
+    clearTimeout(this.timer);
+    while (this.flushing || this.queue.length > 0) {
+      await (this.flushing || this.flush());
+    }
+  }
+}
+
+export const drainWriteBuffers = () => Promise.all(buffers.map(buffer => buffer.drain()));
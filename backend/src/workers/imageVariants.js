@@ -0,0 +1,38 @@
+import { parentPort } from 'worker_threads';
+import path from 'path';
+import sharp from 'sharp';
+
+// One sharp pipeline per worker thread; the pool already spreads jobs across cores
+sharp.concurrency(1);
+
+const ENCODERS = {
+  webp: (image) => image.webp({ quality: 80 }),
+  avif: (image) => image.avif({ quality: 50 })
+};
+
+// Resize one source image into every configured width x format, never upscaling
+const buildVariants = async ({ hash, sourcePath, outputDir, widths, formats }) => {
+  const { width: sourceWidth } = await sharp(sourcePath).metadata();
+  const targets = widths.filter(width => width < sourceWidth);
+  // Images narrower than the largest configured width keep their own width too
+  if (sourceWidth <= Math.max(...widths)) targets.push(sourceWidth);
+
+  const variants = [];
+  for (const width of targets) {
+    for (const format of formats) {
+      const filename = `${hash}-${width}.${format}`;
+      const info = await ENCODERS[format](sharp(sourcePath).rotate().resize({ width, withoutEnlargement: true }))
+        .toFile(path.join(outputDir, filename));
+      variants.push({ format, width: info.width, height: info.height, bytes: info.size, filename });
+    }
+  }
+  return variants;
+};
+
+parentPort.on('message', async (job) => {
+  try {
+    parentPort.postMessage({ result: await buildVariants(job) });
+  } catch (error) {
+    parentPort.postMessage({ error: error.message });
+  }
+});
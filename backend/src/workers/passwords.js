@@ -0,0 +1,12 @@
+import { parentPort } from 'worker_threads';
+import bcrypt from 'bcryptjs';
+
+// Sync calls are fine here: this thread does nothing else
+parentPort.on('message', ({ password, hash }) => {
+  try {
+    const result = bcrypt.compareSync(password, hash);
+    parentPort.postMessage({ result });
+  } catch (error) {
+    parentPort.postMessage({ error: error.message });
+  }
+});
@@ -0,0 +1,861 @@
+#!/usr/bin/env python3
+"""
+Concurrent Load Benchmark for the CMS Backend
+Replays the CMSBackendTester scenarios from many workers at once and reports
+throughput plus p50/p95/p99 latency per endpoint
+"""
+
+import argparse
+import contextlib
+import io
+import itertools
+import json
+import os
+import random
+import re
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional
+from urllib.parse import quote
+
+from backend_test import CMSBackendTester, attribute_time, print_attribution
+
+# Scenario name -> relative weight. Names are CMSBackendTester scenarios or
+# the read-only scenarios defined on BenchmarkWorker.
+DEFAULT_MIX = {
+    'read_blog_list': 6,
+    'read_blog_detail': 6,
+    'test_dashboard': 2,
+    'test_blogs_crud': 1,
+    'test_comments_crud': 1,
+    'test_contacts_crud': 1,
+}
+
+# Protected endpoint next to an unauthenticated baseline; the gap is the auth cost
+AUTH_MIX = {
+    'read_auth_me': 1,
+    'read_health': 1,
+}
+
+# Public submissions with a trickle of reads to show whether writes starve them
+INGEST_MIX = {
+    'submit_comment': 5,
+    'submit_contact': 5,
+    'read_blog_list': 1,
+}
+
+# Wrong-password logins for the admin account, as a credential-stuffing run sends
+# them: every one costs the server a full bcrypt verification
+LOGIN_FLOOD_MIX = {
+    'flood_login': 1,
+}
+
+# What the other workers measure while the flood runs
+LOGIN_FLOOD_PROBE_MIX = {
+    'read_blog_list': 1,
+}
+
+# Ids per bulk delete request when cleaning up submissions
+BULK_DELETE_CHUNK = 1000
+
+UUID_SEGMENT = re.compile(r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$', re.I)
+SLUG_RESOURCES = {'blogs'}
+STATIC_SEGMENTS = {'status', 'stats', 'me', 'login', 'logout', 'health', 'search'}
+DB_TIMING = re.compile(r'db;desc="(\d+) queries";dur=([\d.]+)')
+
+
+def normalize_endpoint(method: str, endpoint: str) -> str:
+    """Collapse ids and slugs so requests group by route, e.g. GET /api/blogs/:slug"""
+    path = endpoint.split('?', 1)[0]
+    segments = path.strip('/').split('/')
+    normalized = []
+    for index, segment in enumerate(segments):
+        if UUID_SEGMENT.match(segment):
+            normalized.append(':id')
+        elif (index > 0 and segments[index - 1] in SLUG_RESOURCES
+              and segment not in STATIC_SEGMENTS and method.upper() == 'GET'):
+            normalized.append(':slug')
+        else:
+            normalized.append(segment)
+    return f"{method.upper()} /{'/'.join(normalized)}"
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, int(round(pct / 100.0 * len(sorted_values))))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def parse_db_timing(response) -> Optional[tuple]:
+    """(round trips, ms) from the backend's Server-Timing header, if QUERY_STATS is on"""
+    match = DB_TIMING.search(response.headers.get('Server-Timing', ''))
+    if not match:
+        return None
+    return int(match.group(1)), float(match.group(2))
+
+
+def parse_mix(value: str) -> Dict[str, int]:
+    """Parse a mix string such as 'read_blog_list=6,test_blogs_crud=1'"""
+    mix = {}
+    for part in value.split(','):
+        if not part.strip():
+            continue
+        name, _, weight = part.partition('=')
+        mix[name.strip()] = int(weight) if weight else 1
+    return mix
+
+
+def admin_login(tester: CMSBackendTester) -> Optional[str]:
+    """Log in as the default admin and return the token"""
+    response, success = tester.make_request('POST', '/api/auth/login', {
+        "email": "admin@example.com",
+        "password": "Admin@123"
+    })
+    if not success or response.status_code != 200:
+        print("❌ Login failed. Cannot benchmark protected endpoints.")
+        return None
+    return response.json()['token']
+
+
+class LatencyRecorder:
+    """Thread-safe collector of per-endpoint request timings"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.samples: Dict[str, List[float]] = {}
+        self.errors: Dict[str, int] = {}
+        self.started_at = None
+        self.finished_at = None
+
+    def record(self, endpoint: str, elapsed_ms: float, ok: bool):
+        """Record one request"""
+        with self.lock:
+            self.samples.setdefault(endpoint, []).append(elapsed_ms)
+            if not ok:
+                self.errors[endpoint] = self.errors.get(endpoint, 0) + 1
+
+    def summary(self) -> Dict[str, Any]:
+        """Throughput and latency percentiles per endpoint"""
+        elapsed = max((self.finished_at or time.perf_counter()) - (self.started_at or 0), 1e-9)
+        endpoints = {}
+        total = 0
+        total_errors = 0
+        for endpoint, values in sorted(self.samples.items()):
+            ordered = sorted(values)
+            errors = self.errors.get(endpoint, 0)
+            total += len(ordered)
+            total_errors += errors
+            endpoints[endpoint] = {
+                'requests': len(ordered),
+                'errors': errors,
+                'rps': len(ordered) / elapsed,
+                'p50_ms': percentile(ordered, 50),
+                'p95_ms': percentile(ordered, 95),
+                'p99_ms': percentile(ordered, 99),
+                'max_ms': ordered[-1],
+            }
+        return {
+            'duration_s': elapsed,
+            'requests': total,
+            'errors': total_errors,
+            'rps': total / elapsed,
+            'endpoints': endpoints,
+        }
+
+
+class BenchmarkWorker(CMSBackendTester):
+    """CMSBackendTester that times every request instead of logging results"""
+
+    def __init__(self, base_url: str, token: str, recorder: LatencyRecorder, slugs: List[str], seed: int,
+                 blog_ids: Optional[List[str]] = None):
+        super().__init__(base_url)
+        self.token = token
+        self.recorder = recorder
+        self.request_hooks.append(self.record_timing)
+        self.slugs = slugs
+        self.blog_ids = blog_ids or []
+        self.random = random.Random(seed)
+
+    def log_result(self, test_name: str, success: bool, message: str, details: Any = None):
+        """Keep results for the summary without printing them"""
+        self.test_results.append({
+            'test': test_name,
+            'success': success,
+            'message': message,
+            'details': details
+        })
+
+    def record_timing(self, method: str, endpoint: str, response: Any, elapsed_ms: float):
+        """Request hook that records latency under the normalized endpoint"""
+        if self.recorder:
+            ok = response is not None and response.status_code < 400
+            self.recorder.record(normalize_endpoint(method, endpoint), elapsed_ms, ok)
+
+    def read_blog_list(self):
+        """Public blog listing as the home page requests it"""
+        page = self.random.randint(1, 3)
+        self.make_request('GET', f'/api/blogs?status=published&limit=9&page={page}')
+
+    def read_blog_detail(self):
+        """Public blog detail page"""
+        if not self.slugs:
+            return self.read_blog_list()
+        self.make_request('GET', f'/api/blogs/{self.random.choice(self.slugs)}')
+
+    def read_auth_me(self):
+        """Smallest protected endpoint: token check plus user lookup"""
+        self.make_request('GET', '/api/auth/me')
+
+    def read_health(self):
+        """Unauthenticated baseline with no database work"""
+        self.make_request('GET', '/api/health')
+
+    def flood_login(self):
+        """Failed admin login; the password check still runs in full"""
+        self.make_request('POST', '/api/auth/login', {
+            "email": "admin@example.com",
+            "password": f"wrong{self.resource_suffix}"
+        })
+
+    def submit_comment(self):
+        """Public comment on a published post"""
+        if not self.blog_ids:
+            return
+        response, success = self.make_request('POST', '/api/comments', {
+            "blog_id": self.random.choice(self.blog_ids),
+            "author_name": "Load Test",
+            "author_email": "load@example.com",
+            "content": f"Benchmark comment{self.resource_suffix}"
+        })
+        if success and response.status_code == 201:
+            self.created_resources['comments'].append(response.json()['id'])
+
+    def submit_contact(self):
+        """Public contact form submission"""
+        response, success = self.make_request('POST', '/api/contacts', {
+            "name": "Load Test",
+            "email": "load@example.com",
+            "subject": "Benchmark",
+            "message": f"Benchmark message{self.resource_suffix}"
+        })
+        if success and response.status_code == 201:
+            self.created_resources['contacts'].append(response.json()['id'])
+
+    def run_scenario(self, name: str):
+        """Run one scenario with unique resource names so workers don't collide"""
+        self.resource_suffix = f" {uuid.uuid4().hex[:12]}"
+        getattr(self, name)()
+
+    def run_until(self, deadline: float, mix: Dict[str, int]):
+        """Replay the weighted scenario mix until the deadline"""
+        names = list(mix.keys())
+        weights = list(mix.values())
+        while time.perf_counter() < deadline:
+            self.run_scenario(self.random.choices(names, weights=weights)[0])
+
+    def bulk_delete(self, resource: str) -> bool:
+        """Delete created comments or contacts through the bulk endpoint"""
+        ids = self.created_resources[resource]
+        for start in range(0, len(ids), BULK_DELETE_CHUNK):
+            response, success = self.make_request('POST', f'/api/{resource}/bulk/delete',
+                                                  {"ids": ids[start:start + BULK_DELETE_CHUNK]})
+            if not success or response.status_code != 200:
+                return False
+        ids.clear()
+        return True
+
+    def cleanup(self):
+        """Delete created resources without recording their timings"""
+        self.recorder = None
+        # Whatever the bulk endpoints could not delete goes one by one
+        self.bulk_delete('comments')
+        self.bulk_delete('contacts')
+        self.cleanup_resources()
+
+
+class CMSLoadBenchmark:
+    def __init__(self, base_url: str, workers: int, duration: float, mix: Dict[str, int], seed: int = 0):
+        self.base_url = base_url
+        self.workers = workers
+        self.duration = duration
+        self.mix = mix
+        self.seed = seed
+        self.recorder = LatencyRecorder()
+        self.token = None
+        self.slugs: List[str] = []
+        self.blog_ids: List[str] = []
+
+    def setup(self) -> bool:
+        """Log in once and collect published slugs for the detail workload"""
+        tester = CMSBackendTester(self.base_url)
+        if not tester.test_health_check():
+            return False
+
+        self.token = admin_login(tester)
+        if not self.token:
+            return False
+
+        response, success = tester.make_request('GET', '/api/blogs?status=published&limit=50')
+        if success and response.status_code == 200:
+            blogs = response.json().get('blogs', [])
+            self.slugs = [blog['slug'] for blog in blogs]
+            self.blog_ids = [blog['id'] for blog in blogs]
+        return True
+
+    def run(self, verbose: bool = False) -> Dict[str, Any]:
+        """Run all workers concurrently and return the summary"""
+        mixes = [self.mix_for(index) for index in range(self.workers)]
+        unknown = {name for mix in mixes for name in mix if not hasattr(BenchmarkWorker, name)}
+        if unknown:
+            raise ValueError(f"Unknown scenarios in mix: {', '.join(sorted(unknown))}")
+
+        workers = [
+            BenchmarkWorker(self.base_url, self.token, self.recorder, self.slugs, self.seed + index, self.blog_ids)
+            for index in range(self.workers)
+        ]
+
+        # Scenario methods print section headers; keep them out of the report
+        output = contextlib.nullcontext() if verbose else contextlib.redirect_stdout(io.StringIO())
+        with output:
+            self.recorder.started_at = time.perf_counter()
+            deadline = self.recorder.started_at + self.duration
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                list(pool.map(lambda worker, mix: worker.run_until(deadline, mix), workers, mixes))
+            self.recorder.finished_at = time.perf_counter()
+
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                list(pool.map(lambda worker: worker.cleanup(), workers))
+
+        summary = self.recorder.summary()
+        summary['workers'] = self.workers
+        summary['mix'] = self.mix
+        return summary
+
+    def mix_for(self, index: int) -> Dict[str, int]:
+        """Scenario mix of one worker"""
+        return self.mix
+
+    @staticmethod
+    def print_report(summary: Dict[str, Any]):
+        """Print the per-endpoint latency table"""
+        print("\n" + "=" * 100)
+        print(f"📊 LOAD BENCHMARK - {summary['workers']} workers, {summary['duration_s']:.1f}s")
+        print("=" * 100)
+        print(f"{'Endpoint':<40} {'Reqs':>7} {'Errs':>6} {'RPS':>8} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9}")
+        for endpoint, stats in summary['endpoints'].items():
+            print(f"{endpoint:<40} {stats['requests']:>7} {stats['errors']:>6} {stats['rps']:>8.1f} "
+                  f"{stats['p50_ms']:>9.1f} {stats['p95_ms']:>9.1f} {stats['p99_ms']:>9.1f} {stats['max_ms']:>9.1f}")
+        print("-" * 100)
+        print(f"Total: {summary['requests']} requests, {summary['errors']} errors, {summary['rps']:.1f} req/s")
+        print("=" * 100)
+
+
+class LoginFloodBenchmark(CMSLoadBenchmark):
+    """Blog list probes, with the first flood_workers workers sending failed logins"""
+
+    def __init__(self, base_url: str, workers: int, flood_workers: int, duration: float, seed: int = 0):
+        super().__init__(base_url, workers + flood_workers, duration, LOGIN_FLOOD_PROBE_MIX, seed)
+        self.flood_workers = flood_workers
+
+    def mix_for(self, index: int) -> Dict[str, int]:
+        """Flooders first, probes after"""
+        return LOGIN_FLOOD_MIX if index < self.flood_workers else LOGIN_FLOOD_PROBE_MIX
+
+
+class BlogPageBenchmark:
+    """Latency and DB round trips of GET /api/blogs by page size"""
+
+    def __init__(self, base_url: str, page_sizes: List[int], iterations: int):
+        self.tester = CMSBackendTester(base_url)
+        self.page_sizes = page_sizes
+        self.iterations = iterations
+
+    def run(self) -> Dict[str, Any]:
+        """Request the first page of each size repeatedly"""
+        results = {}
+        for size in self.page_sizes:
+            latencies, trips, db_ms, rows = [], [], [], 0
+            for _ in range(self.iterations):
+                started = time.perf_counter()
+                response, success = self.tester.make_request('GET', f'/api/blogs?limit={size}')
+                latencies.append((time.perf_counter() - started) * 1000)
+                if not success or response.status_code != 200:
+                    continue
+                rows = len(response.json().get('blogs', []))
+                timing = parse_db_timing(response)
+                if timing:
+                    trips.append(timing[0])
+                    db_ms.append(timing[1])
+
+            ordered = sorted(latencies)
+            results[str(size)] = {
+                'rows': rows,
+                'db_round_trips': percentile(sorted(trips), 50) if trips else None,
+                'db_p50_ms': percentile(sorted(db_ms), 50) if db_ms else None,
+                'p50_ms': percentile(ordered, 50),
+                'p95_ms': percentile(ordered, 95),
+                'p99_ms': percentile(ordered, 99),
+            }
+        return {'iterations': self.iterations, 'page_sizes': results}
+
+    @staticmethod
+    def print_report(summary: Dict[str, Any]):
+        """Print round trips and latency per page size"""
+        print("\n" + "=" * 80)
+        print(f"📊 BLOG LIST BY PAGE SIZE - {summary['iterations']} requests each")
+        print("=" * 80)
+        print(f"{'Limit':>6} {'Rows':>6} {'DB trips':>9} {'DB p50 ms':>10} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+        for size, stats in summary['page_sizes'].items():
+            trips = f"{stats['db_round_trips']:.0f}" if stats['db_round_trips'] is not None else 'n/a'
+            db_ms = f"{stats['db_p50_ms']:.1f}" if stats['db_p50_ms'] is not None else 'n/a'
+            print(f"{size:>6} {stats['rows']:>6} {trips:>9} {db_ms:>10} "
+                  f"{stats['p50_ms']:>9.1f} {stats['p95_ms']:>9.1f} {stats['p99_ms']:>9.1f}")
+        print("=" * 80)
+        if all(stats['db_round_trips'] is None for stats in summary['page_sizes'].values()):
+            print("ℹ️  Start the backend with QUERY_STATS=true to report DB round trips")
+
+
+class SearchCorpus:
+    """Reproducible synthetic posts whose words follow a Zipf-like distribution"""
+
+    SYLLABLES = ['ka', 'lo', 'mi', 'ren', 'tas', 'vor', 'quin', 'del', 'sur', 'po', 'zan', 'bri',
+                 'ex', 'mol', 'tri', 'nu', 'gal', 'fen', 'hox', 'ul', 'pra', 'sen', 'dor', 'yt']
+
+    def __init__(self, seed: int, vocabulary_size: int = 5000):
+        self.seed = seed
+        rng = random.Random(seed)
+        words = []
+        seen = set()
+        while len(words) < vocabulary_size:
+            word = ''.join(rng.choice(self.SYLLABLES) for _ in range(rng.randint(2, 4)))
+            if len(word) >= 4 and word not in seen:
+                seen.add(word)
+                words.append(word)
+        self.words = words
+        self.cum_weights = list(itertools.accumulate(1.0 / (rank + 1) for rank in range(len(words))))
+
+    def text(self, rng: random.Random, count: int) -> str:
+        return ' '.join(rng.choices(self.words, cum_weights=self.cum_weights, k=count))
+
+    def post(self, index: int) -> Dict[str, Any]:
+        """Blog payload for one corpus post; the title is unique per seed and index"""
+        rng = random.Random(f"{self.seed}-{index}")
+        return {
+            "title": f"{self.text(rng, 6)} corpus {self.seed} post {index}",
+            "excerpt": self.text(rng, 25),
+            "content": self.text(rng, 300),
+            "status": "published"
+        }
+
+    def query_terms(self, per_class: int) -> Dict[str, List[str]]:
+        """Terms by frequency: common words match most posts, rare ones a handful"""
+        medium = len(self.words) // 20
+        rare = len(self.words) // 2
+        return {
+            'common': self.words[:per_class],
+            'medium': self.words[medium:medium + per_class],
+            'rare': self.words[rare:rare + per_class],
+        }
+
+
+class SearchBenchmark:
+    """GET /api/blogs/search latency by term frequency on a seeded corpus"""
+
+    def __init__(self, base_url: str, corpus_size: int, terms_per_class: int, workers: int, seed: int):
+        self.base_url = base_url
+        self.tester = CMSBackendTester(base_url)
+        self.corpus = SearchCorpus(seed)
+        self.corpus_size = corpus_size
+        self.terms_per_class = terms_per_class
+        self.workers = workers
+        self.created_ids: List[str] = []
+        self.local = threading.local()
+        # Appended to every query so earlier runs' cached responses never count
+        # as cold: it matches no post, so results and ranking are unchanged
+        self.nonce = f"qq{uuid.uuid4().hex[:8]}"
+
+    def worker_tester(self) -> CMSBackendTester:
+        """One keep-alive session per seeding thread"""
+        if not hasattr(self.local, 'tester'):
+            self.local.tester = CMSBackendTester(self.base_url)
+            self.local.tester.token = self.tester.token
+        return self.local.tester
+
+    def create_post(self, index: int) -> str:
+        response, success = self.worker_tester().make_request('POST', '/api/blogs', self.corpus.post(index))
+        if success and response.status_code == 201:
+            self.created_ids.append(response.json()['id'])
+            return 'created'
+        # Same seed and index already seeded by an earlier run
+        if success and response.status_code == 400:
+            return 'exists'
+        return 'failed'
+
+    def seed_corpus(self):
+        """Create the corpus through the API; re-running with the same seed skips existing posts"""
+        print(f"🌱 Seeding {self.corpus_size} posts with {self.workers} workers")
+        started = time.perf_counter()
+        outcomes: Dict[str, int] = {}
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            for outcome in pool.map(self.create_post, range(self.corpus_size)):
+                outcomes[outcome] = outcomes.get(outcome, 0) + 1
+        elapsed = time.perf_counter() - started
+        print(f"   {outcomes} in {elapsed:.1f}s")
+
+    def search(self, query: str, cursor: Optional[str] = None) -> tuple:
+        """(latency ms, response json or None)"""
+        endpoint = f'/api/blogs/search?q={quote(query)}&limit=10'
+        if cursor:
+            endpoint += f'&cursor={cursor}'
+        started = time.perf_counter()
+        response, success = self.tester.make_request('GET', endpoint)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        if not success or response.status_code != 200:
+            return elapsed_ms, None
+        return elapsed_ms, response.json()
+
+    def run(self) -> Dict[str, Any]:
+        """Cold first page, cold second page (via cursor) and warm repeat for each term"""
+        results = {}
+        for frequency, terms in self.corpus.query_terms(self.terms_per_class).items():
+            cold, second, warm, hits = [], [], [], []
+            for term in terms:
+                query = f'{term} {self.nonce}'
+                elapsed_ms, data = self.search(query)
+                cold.append(elapsed_ms)
+                if data is None:
+                    continue
+                hits.append(len(data['results']))
+                if data['pagination']['nextCursor']:
+                    second.append(self.search(query, data['pagination']['nextCursor'])[0])
+                warm.append(self.search(query)[0])
+
+            results[frequency] = {
+                'terms': len(terms),
+                'avg_results': sum(hits) / len(hits) if hits else 0,
+                'cold_p50_ms': percentile(sorted(cold), 50),
+                'cold_p95_ms': percentile(sorted(cold), 95),
+                'cold_p99_ms': percentile(sorted(cold), 99),
+                'page2_p50_ms': percentile(sorted(second), 50),
+                'warm_p50_ms': percentile(sorted(warm), 50),
+            }
+        return {'corpus_seed': self.corpus.seed, 'seeded': self.corpus_size, 'frequencies': results}
+
+    def cleanup(self):
+        """Delete the posts created by this run"""
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            list(pool.map(lambda blog_id: self.worker_tester().make_request('DELETE', f'/api/blogs/{blog_id}'),
+                          self.created_ids))
+
+    @staticmethod
+    def print_report(summary: Dict[str, Any]):
+        """Print search latency by term frequency"""
+        print("\n" + "=" * 90)
+        print(f"📊 FULL-TEXT SEARCH - corpus seed {summary['corpus_seed']}")
+        print("=" * 90)
+        print(f"{'Terms':<8} {'Count':>6} {'Results':>8} {'cold p50':>9} {'cold p95':>9} {'cold p99':>9} "
+              f"{'page2 p50':>10} {'warm p50':>9}")
+        for frequency, stats in summary['frequencies'].items():
+            print(f"{frequency:<8} {stats['terms']:>6} {stats['avg_results']:>8.1f} {stats['cold_p50_ms']:>9.1f} "
+                  f"{stats['cold_p95_ms']:>9.1f} {stats['cold_p99_ms']:>9.1f} {stats['page2_p50_ms']:>10.1f} "
+                  f"{stats['warm_p50_ms']:>9.1f}")
+        print("=" * 90)
+
+
+class ScaleBenchmark:
+    """List, slug, dashboard and comment query latency at growing table sizes"""
+
+    def __init__(self, base_url: str, scales: List[int], iterations: int, seed: int, seeder: Optional[str]):
+        self.tester = CMSBackendTester(base_url)
+        self.scales = scales
+        self.iterations = iterations
+        self.seed = seed
+        self.seeder = seeder
+        self.rng = random.Random(seed)
+        self.cursor: Optional[str] = None
+        self.blog_id: Optional[str] = None
+
+    def seed_rows(self, blogs: int) -> bool:
+        """Grow the seeded data set to `blogs` posts; rows from smaller scales are kept"""
+        print(f"🌱 Seeding {blogs} blogs (seed {self.seed})")
+        started = time.perf_counter()
+        result = subprocess.run(['node', self.seeder, '--seed', str(self.seed), '--blogs', str(blogs)])
+        if result.returncode != 0:
+            print(f"❌ Seeder exited with {result.returncode}")
+            return False
+        print(f"   done in {time.perf_counter() - started:.1f}s")
+        return True
+
+    def probes(self, scale: int) -> Dict[str, Any]:
+        """Endpoint label -> callable returning the next URL to request"""
+        def cursor_page():
+            # Walk forward page by page, starting over at the end
+            return '/api/blogs?limit=10' + (f'&cursor={self.cursor}' if self.cursor else '')
+
+        def by_blog():
+            return f'/api/comments?blog_id={self.blog_id}&limit=50' if self.blog_id else None
+
+        # Admin listings (no status filter) skip the response cache, so these
+        # time the queries rather than cache lookups
+        return {
+            'GET /api/blogs (page 1)': lambda: '/api/blogs?limit=10',
+            'GET /api/blogs (deep page)': lambda: f'/api/blogs?limit=10&page={self.rng.randint(1, max(1, scale // 10))}',
+            'GET /api/blogs (cursor)': cursor_page,
+            'GET /api/blogs/:slug': lambda: f'/api/blogs/seed{self.seed}-post-{self.rng.randrange(scale)}',
+            'GET /api/dashboard/stats': lambda: '/api/dashboard/stats',
+            'GET /api/comments (pending)': lambda: '/api/comments?status=pending&limit=50',
+            'GET /api/comments (by blog)': by_blog,
+        }
+
+    def observe(self, label: str, data: Dict[str, Any]):
+        """Keep the state later probes build on: the next cursor and a real blog id"""
+        if not isinstance(data, dict):
+            return
+        if label == 'GET /api/blogs (cursor)':
+            self.cursor = data.get('pagination', {}).get('nextCursor')
+        elif label == 'GET /api/blogs/:slug':
+            self.blog_id = data.get('id', self.blog_id)
+
+    def measure(self, scale: int) -> Dict[str, Any]:
+        """Time each probe `iterations` times; the first request of each is reported as cold"""
+        results = {}
+        for label, next_endpoint in self.probes(scale).items():
+            latencies, db_ms, errors = [], [], 0
+            for _ in range(self.iterations):
+                endpoint = next_endpoint()
+                if endpoint is None:
+                    errors += 1
+                    continue
+                started = time.perf_counter()
+                response, success = self.tester.make_request('GET', endpoint)
+                latencies.append((time.perf_counter() - started) * 1000)
+                if not success or response.status_code != 200:
+                    errors += 1
+                    continue
+                self.observe(label, response.json())
+                timing = parse_db_timing(response)
+                if timing:
+                    db_ms.append(timing[1])
+
+            ordered = sorted(latencies)
+            results[label] = {
+                'requests': len(latencies),
+                'errors': errors,
+                'cold_ms': latencies[0] if latencies else None,
+                'p50_ms': percentile(ordered, 50),
+                'p95_ms': percentile(ordered, 95),
+                'p99_ms': percentile(ordered, 99),
+                'db_p50_ms': percentile(sorted(db_ms), 50) if db_ms else None,
+            }
+        return results
+
+    def run(self) -> Optional[Dict[str, Any]]:
+        """Seed up to each scale in turn, then measure"""
+        scales = {}
+        for scale in sorted(self.scales):
+            if self.seeder and not self.seed_rows(scale):
+                return None
+            self.cursor = None
+            print(f"⏱️  Measuring at {scale} blogs")
+            scales[str(scale)] = self.measure(scale)
+        return {'seed': self.seed, 'iterations': self.iterations, 'scales': scales}
+
+    @staticmethod
+    def print_report(summary: Dict[str, Any]):
+        """Print per-endpoint latency for every scale"""
+        print("\n" + "=" * 100)
+        print(f"📊 SCALE - seed {summary['seed']}, {summary['iterations']} requests per endpoint")
+        print("=" * 100)
+        print(f"{'Blogs':>8} {'Endpoint':<30} {'Errors':>6} {'cold ms':>9} {'p50 ms':>9} {'p95 ms':>9} "
+              f"{'p99 ms':>9} {'DB p50 ms':>10}")
+        for scale, endpoints in summary['scales'].items():
+            for label, stats in endpoints.items():
+                if not stats['requests']:
+                    print(f"{scale:>8} {label:<30} {stats['errors']:>6} {'n/a':>9}")
+                    continue
+                db_ms = f"{stats['db_p50_ms']:.1f}" if stats['db_p50_ms'] is not None else 'n/a'
+                print(f"{scale:>8} {label:<30} {stats['errors']:>6} {stats['cold_ms']:>9.1f} {stats['p50_ms']:>9.1f} "
+                      f"{stats['p95_ms']:>9.1f} {stats['p99_ms']:>9.1f} {db_ms:>10}")
+        print("=" * 100)
+        if all(stats['db_p50_ms'] is None for endpoints in summary['scales'].values() for stats in endpoints.values()):
+            print("ℹ️  Start the backend with QUERY_STATS=true to report DB time")
+
+
+def run_load(args) -> Optional[Dict[str, Any]]:
+    """Mixed read/write load from concurrent workers"""
+    benchmark = CMSLoadBenchmark(args.base_url, args.workers, args.duration, args.mix, args.seed)
+    if not benchmark.setup():
+        return None
+
+    print(f"🚀 Generating load for {args.duration:.0f}s with {args.workers} workers")
+    summary = benchmark.run(verbose=args.verbose)
+    benchmark.print_report(summary)
+    return summary
+
+
+def run_auth(args) -> Optional[Dict[str, Any]]:
+    """Protected-endpoint latency against an unauthenticated baseline"""
+    print("ℹ️  Run once against a backend started with USER_CACHE_TTL_MS=0 and once with the default to compare")
+    args.mix = AUTH_MIX
+    return run_load(args)
+
+
+def run_ingest(args) -> Optional[Dict[str, Any]]:
+    """Sustained public comment/contact submissions with a read probe alongside"""
+    args.mix = INGEST_MIX
+    summary = run_load(args)
+    if summary is None:
+        return None
+
+    submissions = [stats for endpoint, stats in summary['endpoints'].items()
+                   if endpoint in ('POST /api/comments', 'POST /api/contacts')]
+    accepted = sum(stats['requests'] - stats['errors'] for stats in submissions)
+    rejected = sum(stats['errors'] for stats in submissions)
+    summary['accepted_per_s'] = accepted / summary['duration_s']
+    print(f"📥 {accepted} submissions stored ({summary['accepted_per_s']:.1f}/s), {rejected} rejected or failed")
+    return summary
+
+
+def run_login_flood(args) -> Optional[Dict[str, Any]]:
+    """GET /api/blogs latency alone, then while failed logins flood the server"""
+    phases = {}
+    for phase, flood_workers in (('baseline', 0), ('flood', args.flood_workers)):
+        benchmark = LoginFloodBenchmark(args.base_url, args.workers, flood_workers, args.duration, args.seed)
+        if not benchmark.setup():
+            return None
+
+        print(f"🚀 {phase}: {args.workers} workers reading, {flood_workers} sending failed logins, {args.duration:.0f}s")
+        phases[phase] = benchmark.run(verbose=args.verbose)
+        benchmark.print_report(phases[phase])
+
+    probe = 'GET /api/blogs'
+    baseline = phases['baseline']['endpoints'].get(probe)
+    flood = phases['flood']['endpoints'].get(probe)
+    logins = phases['flood']['endpoints'].get('POST /api/auth/login', {})
+    if baseline and flood:
+        print(f"🔐 {probe} p99 {baseline['p99_ms']:.1f} ms alone, {flood['p99_ms']:.1f} ms during "
+              f"{logins.get('rps', 0):.1f} logins/s ({flood['p99_ms'] / max(baseline['p99_ms'], 1e-9):.1f}x)")
+    return {'phases': phases, 'flood_workers': args.flood_workers}
+
+
+def run_search(args) -> Optional[Dict[str, Any]]:
+    """Full-text search latency on a seeded corpus"""
+    benchmark = SearchBenchmark(args.base_url, args.corpus_size, args.iterations, args.workers, args.seed)
+    if not benchmark.tester.test_health_check():
+        return None
+    benchmark.tester.token = admin_login(benchmark.tester)
+    if not benchmark.tester.token:
+        return None
+
+    if args.corpus_size:
+        benchmark.seed_corpus()
+    summary = benchmark.run()
+    benchmark.print_report(summary)
+
+    if args.cleanup:
+        benchmark.cleanup()
+    return summary
+
+
+def run_blog_pages(args) -> Optional[Dict[str, Any]]:
+    """Blog list latency and DB round trips by page size"""
+    benchmark = BlogPageBenchmark(args.base_url, args.page_sizes, args.iterations)
+    if not benchmark.tester.test_health_check():
+        return None
+
+    summary = benchmark.run()
+    benchmark.print_report(summary)
+    return summary
+
+
+def run_scale(args) -> Optional[Dict[str, Any]]:
+    """Endpoint latency as the seeded tables grow"""
+    seeder = None if args.no_seed else args.seeder
+    benchmark = ScaleBenchmark(args.base_url, args.scales, args.iterations, args.seed, seeder)
+    if not benchmark.tester.test_health_check():
+        return None
+    benchmark.tester.token = admin_login(benchmark.tester)
+    if not benchmark.tester.token:
+        return None
+
+    summary = benchmark.run()
+    if summary is not None:
+        benchmark.print_report(summary)
+    return summary
+
+
+MODES = {
+    'load': run_load,
+    'auth': run_auth,
+    'blog-pages': run_blog_pages,
+    'search': run_search,
+    'ingest': run_ingest,
+    'login-flood': run_login_flood,
+    'scale': run_scale,
+}
+
+
+def main():
+    """Main function to run a benchmark mode"""
+    parser = argparse.ArgumentParser(description="Concurrent load benchmark for the CMS backend")
+    parser.add_argument('--mode', choices=sorted(MODES), default='load')
+    parser.add_argument('--base-url', default="http://localhost:5000")
+    parser.add_argument('--workers', type=int, default=16, help="Concurrent workers")
+    parser.add_argument('--duration', type=float, default=30, help="Seconds to generate load")
+    parser.add_argument('--mix', type=parse_mix, default=DEFAULT_MIX,
+                        help="Weighted scenarios, e.g. read_blog_list=6,test_blogs_crud=1")
+    parser.add_argument('--seed', type=int, default=0, help="Seed for scenario selection")
+    parser.add_argument('--json', dest='json_path', help="Also write the summary to this file")
+    parser.add_argument('--verbose', action='store_true', help="Show scenario output")
+    parser.add_argument('--page-sizes', type=lambda v: [int(n) for n in v.split(',')], default=[10, 50, 100],
+                        help="blog-pages: comma separated page sizes")
+    parser.add_argument('--iterations', type=int, default=50,
+                        help="blog-pages: requests per page size; search: terms per frequency class; "
+                             "scale: requests per endpoint")
+    parser.add_argument('--corpus-size', type=int, default=0,
+                        help="search: published posts to create through the API first, e.g. 100000 "
+                             "(reproducible from --seed; posts from an earlier run are skipped). "
+                             "Only use against a dedicated database")
+    parser.add_argument('--cleanup', action='store_true', help="search: delete the posts seeded by this run")
+    parser.add_argument('--flood-workers', type=int, default=32,
+                        help="login-flood: workers sending failed logins next to the --workers readers")
+    parser.add_argument('--scales', type=lambda v: [int(n) for n in v.split(',')], default=[10000, 100000, 1000000],
+                        help="scale: comma separated blog counts to seed and measure at")
+    parser.add_argument('--seeder', default=os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                                         'backend', 'scripts', 'seed.js'),
+                        help="scale: path to the seed script (run with node)")
+    parser.add_argument('--no-seed', action='store_true', help="scale: measure the data already in the database")
+    parser.add_argument('--metrics', action='store_true',
+                        help="Scrape /api/metrics before and after to split server time by route and statement")
+    parser.add_argument('--metrics-token', default=os.environ.get('METRICS_TOKEN'), help="Bearer token for /api/metrics")
+    args = parser.parse_args()
+
+    scraper = CMSBackendTester(args.base_url)
+    before = scraper.scrape_metrics(args.metrics_token) if args.metrics else None
+    if args.metrics and before is None:
+        print("⚠️  /api/metrics is not available; skipping server time attribution")
+
+    summary = MODES[args.mode](args)
+    if summary is None:
+        print("❌ Backend is not ready. Exiting benchmark.")
+        sys.exit(1)
+
+    if before is not None:
+        after = scraper.scrape_metrics(args.metrics_token)
+        if after is not None:
+            summary['server'] = attribute_time(before, after)
+            print_attribution(summary['server'])
+
+    if args.json_path:
+        with open(args.json_path, 'w') as f:
+            json.dump(summary, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
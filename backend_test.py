@@ -4,15 +4,99 @@ Comprehensive Backend API Testing for CMS
 Tests all CRUD operations and identifies bugs in the Express backend
 """
 
+import argparse
 import requests
 import json
 import os
+import re
 import sys
-from typing import Dict, Any, Optional
+import time
+from collections import defaultdict
+from typing import Dict, Any, Optional, List, Callable
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+PROM_SAMPLE = re.compile(r'^([a-zA-Z_:][\w:]*)(?:\{(.*)\})?\s+(\S+)$')
+PROM_LABEL = re.compile(r'(\w+)="((?:[^"\\]|\\.)*)"')
+
+
+def parse_prometheus(text: str) -> Dict[tuple, float]:
+    """Prometheus text format -> {(name, ((label, value), ...)): value}"""
+    samples = {}
+    for line in text.splitlines():
+        match = PROM_SAMPLE.match(line.strip())
+        if not match:
+            continue
+        name, labels, value = match.groups()
+        key = (name, tuple(sorted(PROM_LABEL.findall(labels or ''))))
+        samples[key] = float(value)
+    return samples
+
+
+def attribute_time(before: Dict[tuple, float], after: Dict[tuple, float]) -> Dict[str, Any]:
+    """Split server-side time between routes, statements and pool wait over a run"""
+    delta = {key: value - before.get(key, 0.0) for key, value in after.items()}
+
+    def totals(metric: str, label: str) -> Dict[str, Dict[str, float]]:
+        grouped: Dict[str, Dict[str, float]] = {}
+        for (name, labels), value in delta.items():
+            if name not in (f'{metric}_sum', f'{metric}_count'):
+                continue
+            # Series without the label (older servers, unlabelled histograms) group as 'all'
+            group = label.format_map(defaultdict(lambda: 'all', labels))
+            entry = grouped.setdefault(group, {'count': 0, 'total_ms': 0.0})
+            if name.endswith('_count'):
+                entry['count'] += int(value)
+            else:
+                entry['total_ms'] += value * 1000
+        for entry in grouped.values():
+            entry['avg_ms'] = entry['total_ms'] / entry['count'] if entry['count'] else 0.0
+        return {group: entry for group, entry in grouped.items() if entry['count']}
+
+    # Sum series that share a statement but differ in other labels (e.g. worker)
+    slow: Dict[str, int] = {}
+    for (name, labels), value in delta.items():
+        if name == 'cms_db_slow_queries_total' and value:
+            statement = dict(labels)['statement']
+            slow[statement] = slow.get(statement, 0) + int(value)
+    return {
+        'routes': totals('cms_http_request_duration_seconds', '{method} {route}'),
+        'statements': totals('cms_db_query_duration_seconds', '{statement}'),
+        'pools': totals('cms_db_query_duration_seconds', '{pool}'),
+        'pool_wait': totals('cms_db_pool_acquire_seconds', 'all').get('all', {'count': 0, 'total_ms': 0.0, 'avg_ms': 0.0}),
+        'slow_queries': slow,
+    }
+
+
+def print_attribution(attribution: Dict[str, Any], top: int = 10):
+    """Print where server time went, largest totals first"""
+    print("\n" + "=" * 80)
+    print("⏱️  SERVER TIME (from /api/metrics)")
+    print("=" * 80)
+    sections = (('Route', attribution['routes']), ('Statement', attribution['statements']),
+                ('Pool', attribution.get('pools', {})))
+    for title, groups in sections:
+        print(f"{title:<48} {'Count':>8} {'Total ms':>11} {'Avg ms':>9}")
+        ranked = sorted(groups.items(), key=lambda item: item[1]['total_ms'], reverse=True)[:top]
+        for group, entry in ranked:
+            print(f"{group:<48} {entry['count']:>8} {entry['total_ms']:>11.1f} {entry['avg_ms']:>9.2f}")
+        print("-" * 80)
+    wait = attribution['pool_wait']
+    print(f"Pool acquire: {wait['count']} waits, {wait['total_ms']:.1f} ms total, {wait['avg_ms']:.2f} ms avg")
+    for statement, count in attribution['slow_queries'].items():
+        print(f"🐢 {count} slow {statement}")
+    print("=" * 80)
+
 
 class CMSBackendTester:
-    def __init__(self):
-        self.base_url = "http://localhost:5000"
+    def __init__(self, base_url: str = "http://localhost:5000", pool_size: int = 10, retries: int = 3,
+                 backoff: float = 0.3, timeout: float = 30):
+        self.base_url = base_url
+        self.resource_suffix = ""
+        self.timeout = timeout
+        self.session = self.create_session(pool_size, retries, backoff)
+        # Called as hook(method, endpoint, response_or_None, elapsed_ms) after every request
+        self.request_hooks: List[Callable[[str, str, Optional[requests.Response], float], None]] = []
         self.token = None
         self.user_data = None
         self.test_results = []
@@ -23,6 +107,35 @@ class CMSBackendTester:
             'comments': [],
             'contacts': []
         }
+
+    @staticmethod
+    def create_session(pool_size: int, retries: int, backoff: float) -> requests.Session:
+        """Keep-alive session with a bounded connection pool and retries on idempotent requests"""
+        session = requests.Session()
+        retry = Retry(
+            total=retries,
+            backoff_factor=backoff,
+            status_forcelist=(502, 503, 504),
+            raise_on_status=False,
+            allowed_methods=frozenset(['GET', 'PUT', 'DELETE', 'HEAD', 'OPTIONS'])
+        )
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+    @property
+    def token(self) -> Optional[str]:
+        return self._token
+
+    @token.setter
+    def token(self, value: Optional[str]):
+        """Set the bearer token once on the session instead of on every request"""
+        self._token = value
+        if value:
+            self.session.headers['Authorization'] = f'Bearer {value}'
+        else:
+            self.session.headers.pop('Authorization', None)
         
     def log_result(self, test_name: str, success: bool, message: str, details: Any = None):
         """Log test result"""
@@ -39,48 +152,41 @@ class CMSBackendTester:
             print(f"   Details: {details}")
     
     def make_request(self, method: str, endpoint: str, data: Any = None, files: Any = None, headers: Dict = None) -> tuple:
-        """Make HTTP request and return response and success status"""
+        """Make HTTP request over the pooled session and return response and success status"""
         url = f"{self.base_url}{endpoint}"
-        
-        # Default headers
-        default_headers = {}
-        if self.token:
-            default_headers['Authorization'] = f'Bearer {self.token}'
-        
-        if headers:
-            default_headers.update(headers)
-            
+        method = method.upper()
+        if method not in ('GET', 'POST', 'PUT', 'DELETE', 'PATCH'):
+            return None, False
+
+        kwargs = {'headers': headers, 'timeout': self.timeout}
+        if method in ('POST', 'PUT', 'PATCH'):
+            if files:
+                kwargs['data'] = data
+                kwargs['files'] = files
+            elif data:
+                kwargs['json'] = data
+
+        response = None
+        started = time.perf_counter()
         try:
-            if method.upper() == 'GET':
-                response = requests.get(url, headers=default_headers)
-            elif method.upper() == 'POST':
-                if files:
-                    response = requests.post(url, data=data, files=files, headers=default_headers)
-                else:
-                    if data:
-                        default_headers['Content-Type'] = 'application/json'
-                    response = requests.post(url, json=data, headers=default_headers)
-            elif method.upper() == 'PUT':
-                if files:
-                    response = requests.put(url, data=data, files=files, headers=default_headers)
-                else:
-                    if data:
-                        default_headers['Content-Type'] = 'application/json'
-                    response = requests.put(url, json=data, headers=default_headers)
-            elif method.upper() == 'DELETE':
-                response = requests.delete(url, headers=default_headers)
-            elif method.upper() == 'PATCH':
-                if data:
-                    default_headers['Content-Type'] = 'application/json'
-                response = requests.patch(url, json=data, headers=default_headers)
-            else:
-                return None, False
-                
+            response = self.session.request(method, url, **kwargs)
             return response, True
         except Exception as e:
             print(f"Request failed: {e}")
             return None, False
+        finally:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            for hook in self.request_hooks:
+                hook(method, endpoint, response, elapsed_ms)
     
+    def scrape_metrics(self, metrics_token: Optional[str] = None) -> Optional[Dict[tuple, float]]:
+        """Parsed GET /api/metrics, or None when the backend does not expose it"""
+        headers = {'Authorization': f'Bearer {metrics_token}'} if metrics_token else None
+        response, success = self.make_request('GET', '/api/metrics', headers=headers)
+        if not success or response.status_code != 200:
+            return None
+        return parse_prometheus(response.text)
+
     def test_health_check(self):
         """Test health check endpoint"""
         response, success = self.make_request('GET', '/api/health')
@@ -157,7 +263,7 @@ class CMSBackendTester:
         
         # CREATE category
         category_data = {
-            "name": "Test Category",
+            "name": f"Test Category{self.resource_suffix}",
             "description": "Test category description"
         }
         
@@ -170,7 +276,7 @@ class CMSBackendTester:
                 
                 # UPDATE category
                 update_data = {
-                    "name": "Updated Test Category",
+                    "name": f"Updated Test Category{self.resource_suffix}",
                     "description": "Updated description"
                 }
                 
@@ -203,7 +309,7 @@ class CMSBackendTester:
         
         # CREATE tag
         tag_data = {
-            "name": "Test Tag"
+            "name": f"Test Tag{self.resource_suffix}"
         }
         
         response, success = self.make_request('POST', '/api/tags', tag_data)
@@ -242,7 +348,7 @@ class CMSBackendTester:
         
         # CREATE blog without image
         blog_data = {
-            "title": "Test Blog Post",
+            "title": f"Test Blog Post{self.resource_suffix}",
             "content": "This is a test blog post content with some detailed information.",
             "excerpt": "Test blog excerpt",
             "status": "published",
@@ -270,7 +376,7 @@ class CMSBackendTester:
                 
                 # UPDATE blog
                 update_data = {
-                    "title": "Updated Test Blog Post",
+                    "title": f"Updated Test Blog Post{self.resource_suffix}",
                     "content": "Updated content",
                     "excerpt": "Updated excerpt",
                     "status": "draft"
@@ -291,7 +397,7 @@ class CMSBackendTester:
         
         # Test CREATE blog with form-data (simulating file upload)
         form_data = {
-            "title": "Test Blog with Image",
+            "title": f"Test Blog with Image{self.resource_suffix}",
             "content": "Blog content with image",
             "excerpt": "Blog excerpt",
             "status": "published",
@@ -526,8 +632,25 @@ class CMSBackendTester:
 
 def main():
     """Main function to run tests"""
-    tester = CMSBackendTester()
+    parser = argparse.ArgumentParser(description="CMS backend API tests")
+    parser.add_argument('--base-url', default="http://localhost:5000")
+    parser.add_argument('--pool-size', type=int, default=10, help="Keep-alive connections per host")
+    parser.add_argument('--retries', type=int, default=3, help="Retries for idempotent requests")
+    parser.add_argument('--backoff', type=float, default=0.3, help="Retry backoff factor in seconds")
+    parser.add_argument('--timeout', type=float, default=30, help="Per-request timeout in seconds")
+    parser.add_argument('--metrics', action='store_true', help="Report server time per route and statement")
+    parser.add_argument('--metrics-token', default=os.environ.get('METRICS_TOKEN'), help="Bearer token for /api/metrics")
+    args = parser.parse_args()
+
+    tester = CMSBackendTester(args.base_url, args.pool_size, args.retries, args.backoff, args.timeout)
+    before = tester.scrape_metrics(args.metrics_token) if args.metrics else None
+    if args.metrics and before is None:
+        print("⚠️  /api/metrics is not available; skipping server time attribution")
     success = tester.run_all_tests()
+    if before is not None:
+        after = tester.scrape_metrics(args.metrics_token)
+        if after is not None:
+            print_attribution(attribute_time(before, after))
     
     if not success:
         sys.exit(1)
@@ -2,23 +2,32 @@
 
 import { useEffect, useState } from 'react';
 import { apiClient } from '@/lib/api';
-import { Comment } from '@/types';
+import { BulkResult, Comment, CommentPage } from '@/types';
 import { Button } from '@/components/ui/Button';
 import { Card, CardContent } from '@/components/ui/Card';
 import { formatDate } from '@/lib/utils';
-import { Check, X, Trash2 } from 'lucide-react';
+import { Check, Download, X, Trash2 } from 'lucide-react';
+
+const PAGE_SIZE = 50;
 
 export default function CommentsPage() {
   const [comments, setComments] = useState<Comment[]>([]);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [total, setTotal] = useState<number | null>(null);
+  const [selected, setSelected] = useState<Set<string>>(new Set());
 
   useEffect(() => {
     loadComments();
   }, []);
 
-  const loadComments = async () => {
+  const loadComments = async (cursor?: string) => {
     try {
-      const data = await apiClient.getComments({});
-      setComments(data);
+      const data: CommentPage = await apiClient.getComments(
+        cursor ? { limit: PAGE_SIZE, cursor } : { limit: PAGE_SIZE, include_total: true }
+      );
+      setComments(prev => (cursor ? [...prev, ...data.comments] : data.comments));
+      setNextCursor(data.pagination.nextCursor);
+      if (data.pagination.total !== undefined) setTotal(data.pagination.total);
     } catch (error) {
       console.error('Failed to load comments:', error);
     }
@@ -27,7 +36,7 @@ export default function CommentsPage() {
   const updateStatus = async (id: string, status: string) => {
     try {
       await apiClient.updateCommentStatus(id, status);
-      loadComments();
+      setComments(prev => prev.map(item => (item.id === id ? { ...item, status: status as Comment['status'] } : item)));
     } catch (error: any) {
       alert('Error: ' + error.message);
     }
@@ -37,21 +46,122 @@ export default function CommentsPage() {
     if (!confirm('Delete this comment?')) return;
     try {
       await apiClient.deleteComment(id);
+      setComments(prev => prev.filter(item => item.id !== id));
+      setTotal(prev => (prev === null ? prev : prev - 1));
+    } catch (error: any) {
+      alert('Error: ' + error.message);
+    }
+  };
+
+  const toggleSelected = (id: string) => {
+    setSelected(prev => {
+      const next = new Set(prev);
+      if (next.has(id)) next.delete(id);
+      else next.add(id);
+      return next;
+    });
+  };
+
+  const toggleAll = () => {
+    setSelected(prev => (prev.size === comments.length ? new Set() : new Set(comments.map(item => item.id))));
+  };
+
+  const bulkUpdate = async (status: Comment['status']) => {
+    try {
+      const data = await apiClient.bulkUpdateCommentStatus({ ids: [...selected] }, status);
+      const found = new Set(data.results.filter(item => item.result !== 'not_found').map(item => item.id));
+      setComments(prev => prev.map(item => (found.has(item.id) ? { ...item, status } : item)));
+      setSelected(new Set());
+    } catch (error: any) {
+      alert('Error: ' + error.message);
+    }
+  };
+
+  const bulkDelete = async () => {
+    if (!confirm(`Delete ${selected.size} comments?`)) return;
+    try {
+      const data = await apiClient.bulkDeleteComments({ ids: [...selected] });
+      const gone = new Set(data.results.map(item => item.id));
+      setComments(prev => prev.filter(item => !gone.has(item.id)));
+      setTotal(prev => (prev === null ? prev : prev - (data.counts.deleted || 0)));
+      setSelected(new Set());
+    } catch (error: any) {
+      alert('Error: ' + error.message);
+    }
+  };
+
+  // Filter requests are capped server-side; repeat until nothing is left
+  const deleteAllRejected = async () => {
+    if (!confirm('Delete every rejected comment?')) return;
+    try {
+      let data: BulkResult;
+      do {
+        data = await apiClient.bulkDeleteComments({ filter: { status: 'rejected' } });
+      } while (data.hasMore && data.counts.deleted);
+      setSelected(new Set());
       loadComments();
     } catch (error: any) {
       alert('Error: ' + error.message);
     }
   };
 
+  const handleExport = async () => {
+    try {
+      await apiClient.exportComments('csv');
+    } catch (error: any) {
+      alert('Error: ' + error.message);
+    }
+  };
+
   return (
     <div>
-      <h1 className="text-3xl font-bold mb-6">Comments</h1>
+      <div className="flex justify-between items-center mb-6">
+        <h1 className="text-3xl font-bold">
+          Comments
+          {total !== null && <span className="ml-2 text-lg font-normal text-gray-500">({total})</span>}
+        </h1>
+        <div className="flex gap-2">
+          <Button variant="outline" onClick={deleteAllRejected}>
+            Delete all rejected
+          </Button>
+          <Button variant="outline" onClick={handleExport}>
+            <Download className="h-4 w-4 mr-2" />
+            Export CSV
+          </Button>
+        </div>
+      </div>
+
+      {comments.length > 0 && (
+        <div className="flex items-center gap-3 mb-4">
+          <input type="checkbox" className="h-4 w-4" checked={selected.size === comments.length} onChange={toggleAll} />
+          <span className="text-sm text-gray-600">{selected.size} selected</span>
+          {selected.size > 0 && (
+            <>
+              <Button size="sm" variant="outline" onClick={() => bulkUpdate('approved')}>
+                <Check className="h-4 w-4 mr-2" /> Approve
+              </Button>
+              <Button size="sm" variant="outline" onClick={() => bulkUpdate('rejected')}>
+                <X className="h-4 w-4 mr-2" /> Reject
+              </Button>
+              <Button size="sm" variant="destructive" onClick={bulkDelete}>
+                <Trash2 className="h-4 w-4 mr-2" /> Delete
+              </Button>
+            </>
+          )}
+        </div>
+      )}
 
       <div className="space-y-4">
         {comments.map(comment => (
           <Card key={comment.id}>
             <CardContent className="p-6">
-              <div className="flex justify-between items-start">
+              <div className="flex justify-between items-start gap-4">
+                <input
+                  type="checkbox"
+                  className="h-4 w-4 mt-1"
+                  checked={selected.has(comment.id)}
+                  onChange={() => toggleSelected(comment.id)}
+                />
                 <div className="flex-1">
                   <div className="flex items-center gap-3 mb-2">
                     <span className="font-medium">{comment.author_name}</span>
@@ -84,6 +194,14 @@ export default function CommentsPage() {
           </Card>
         ))}
       </div>
+
+      {nextCursor && (
+        <div className="flex justify-center mt-6">
+          <Button variant="outline" onClick={() => loadComments(nextCursor)}>
+            Load more
+          </Button>
+        </div>
+      )}
     </div>
   );
 }
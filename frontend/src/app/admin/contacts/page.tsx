@@ -2,23 +2,32 @@
 
 import { useEffect, useState } from 'react';
 import { apiClient } from '@/lib/api';
-import { Contact } from '@/types';
+import { BulkResult, Contact, ContactPage } from '@/types';
 import { Button } from '@/components/ui/Button';
 import { Card, CardContent } from '@/components/ui/Card';
 import { formatDate } from '@/lib/utils';
-import { Mail, Trash2 } from 'lucide-react';
+import { Download, Mail, Trash2 } from 'lucide-react';
+
+const PAGE_SIZE = 50;
 
 export default function ContactsPage() {
   const [contacts, setContacts] = useState<Contact[]>([]);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [total, setTotal] = useState<number | null>(null);
+  const [selected, setSelected] = useState<Set<string>>(new Set());
 
   useEffect(() => {
     loadContacts();
   }, []);
 
-  const loadContacts = async () => {
+  const loadContacts = async (cursor?: string) => {
     try {
-      const data = await apiClient.getContacts({});
-      setContacts(data);
+      const data: ContactPage = await apiClient.getContacts(
+        cursor ? { limit: PAGE_SIZE, cursor } : { limit: PAGE_SIZE, include_total: true }
+      );
+      setContacts(prev => (cursor ? [...prev, ...data.contacts] : data.contacts));
+      setNextCursor(data.pagination.nextCursor);
+      if (data.pagination.total !== undefined) setTotal(data.pagination.total);
     } catch (error) {
       console.error('Failed to load contacts:', error);
     }
@@ -27,7 +36,7 @@ export default function ContactsPage() {
   const updateStatus = async (id: string, status: string) => {
     try {
       await apiClient.updateContactStatus(id, status);
-      loadContacts();
+      setContacts(prev => prev.map(item => (item.id === id ? { ...item, status: status as Contact['status'] } : item)));
     } catch (error: any) {
       alert('Error: ' + error.message);
     }
@@ -37,21 +46,117 @@ export default function ContactsPage() {
     if (!confirm('Delete this contact?')) return;
     try {
       await apiClient.deleteContact(id);
+      setContacts(prev => prev.filter(item => item.id !== id));
+      setTotal(prev => (prev === null ? prev : prev - 1));
+    } catch (error: any) {
+      alert('Error: ' + error.message);
+    }
+  };
+
+  const toggleSelected = (id: string) => {
+    setSelected(prev => {
+      const next = new Set(prev);
+      if (next.has(id)) next.delete(id);
+      else next.add(id);
+      return next;
+    });
+  };
+
+  const toggleAll = () => {
+    setSelected(prev => (prev.size === contacts.length ? new Set() : new Set(contacts.map(item => item.id))));
+  };
+
+  const bulkUpdate = async (status: Contact['status']) => {
+    try {
+      const data = await apiClient.bulkUpdateContactStatus({ ids: [...selected] }, status);
+      const found = new Set(data.results.filter(item => item.result !== 'not_found').map(item => item.id));
+      setContacts(prev => prev.map(item => (found.has(item.id) ? { ...item, status } : item)));
+      setSelected(new Set());
+    } catch (error: any) {
+      alert('Error: ' + error.message);
+    }
+  };
+
+  const bulkDelete = async () => {
+    if (!confirm(`Delete ${selected.size} contacts?`)) return;
+    try {
+      const data = await apiClient.bulkDeleteContacts({ ids: [...selected] });
+      const gone = new Set(data.results.map(item => item.id));
+      setContacts(prev => prev.filter(item => !gone.has(item.id)));
+      setTotal(prev => (prev === null ? prev : prev - (data.counts.deleted || 0)));
+      setSelected(new Set());
+    } catch (error: any) {
+      alert('Error: ' + error.message);
+    }
+  };
+
+  // Filter requests are capped server-side; repeat until nothing is left
+  const markAllNewRead = async () => {
+    try {
+      let data: BulkResult;
+      do {
+        data = await apiClient.bulkUpdateContactStatus({ filter: { status: 'new' } }, 'read');
+      } while (data.hasMore && data.counts.updated);
+      setSelected(new Set());
       loadContacts();
     } catch (error: any) {
       alert('Error: ' + error.message);
     }
   };
 
+  const handleExport = async () => {
+    try {
+      await apiClient.exportContacts('csv');
+    } catch (error: any) {
+      alert('Error: ' + error.message);
+    }
+  };
+
   return (
     <div>
-      <h1 className="text-3xl font-bold mb-6">Contact Messages</h1>
+      <div className="flex justify-between items-center mb-6">
+        <h1 className="text-3xl font-bold">
+          Contact Messages
+          {total !== null && <span className="ml-2 text-lg font-normal text-gray-500">({total})</span>}
+        </h1>
+        <div className="flex gap-2">
+          <Button variant="outline" onClick={markAllNewRead}>
+            Mark all new as read
+          </Button>
+          <Button variant="outline" onClick={handleExport}>
+            <Download className="h-4 w-4 mr-2" />
+            Export CSV
+          </Button>
+        </div>
+      </div>
+
+      {contacts.length > 0 && (
+        <div className="flex items-center gap-3 mb-4">
+          <input type="checkbox" className="h-4 w-4" checked={selected.size === contacts.length} onChange={toggleAll} />
+          <span className="text-sm text-gray-600">{selected.size} selected</span>
+          {selected.size > 0 && (
+            <>
+              <Button size="sm" variant="outline" onClick={() => bulkUpdate('read')}>Mark Read</Button>
+              <Button size="sm" variant="outline" onClick={() => bulkUpdate('replied')}>Mark Replied</Button>
+              <Button size="sm" variant="destructive" onClick={bulkDelete}>
+                <Trash2 className="h-4 w-4 mr-2" /> Delete
+              </Button>
+            </>
+          )}
+        </div>
+      )}
 
       <div className="space-y-4">
         {contacts.map(contact => (
           <Card key={contact.id}>
             <CardContent className="p-6">
-              <div className="flex justify-between items-start">
+              <div className="flex justify-between items-start gap-4">
+                <input
+                  type="checkbox"
+                  className="h-4 w-4 mt-1"
+                  checked={selected.has(contact.id)}
+                  onChange={() => toggleSelected(contact.id)}
+                />
                 <div className="flex-1">
                   <div className="flex items-center gap-3 mb-2">
                     <Mail className="h-4 w-4 text-gray-500" />
@@ -81,6 +186,14 @@ export default function ContactsPage() {
           </Card>
         ))}
       </div>
+
+      {nextCursor && (
+        <div className="flex justify-center mt-6">
+          <Button variant="outline" onClick={() => loadContacts(nextCursor)}>
+            Load more
+          </Button>
+        </div>
+      )}
     </div>
   );
 }
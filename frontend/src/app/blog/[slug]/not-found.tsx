@@ -0,0 +1,15 @@
+import Link from 'next/link';
+import { Button } from '@/components/ui/Button';
+
+export default function BlogNotFound() {
+  return (
+    <div className="min-h-screen flex items-center justify-center">
+      <div className="text-center">
+        <h1 className="text-2xl font-bold mb-4">Blog not found</h1>
+        <Link href="/">
+          <Button>Go back home</Button>
+        </Link>
+      </div>
+    </div>
+  );
+}
@@ -1,88 +1,28 @@
-'use client';
-
-import { useEffect, useState } from 'react';
-import { useParams } from 'next/navigation';
+import { notFound } from 'next/navigation';
 import Link from 'next/link';
-import { apiClient } from '@/lib/api';
-import { Blog } from '@/types';
 import { Button } from '@/components/ui/Button';
-import { Input } from '@/components/ui/Input';
-import { Textarea } from '@/components/ui/Textarea';
-import { Label } from '@/components/ui/Label';
+import { FeaturedImage } from '@/components/FeaturedImage';
+import { CommentForm } from '@/components/CommentForm';
 import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/Card';
+import { getPrerenderSlugs, getPublishedBlog, REVALIDATE_SECONDS } from '@/lib/content';
 import { formatDate } from '@/lib/utils';
 import { ArrowLeft, User, Calendar, Tag } from 'lucide-react';
 
-export default function BlogDetailPage() {
-  const params = useParams();
-  const slug = params?.slug as string;
-  const [blog, setBlog] = useState<Blog | null>(null);
-  const [loading, setLoading] = useState(true);
-  const [commentForm, setCommentForm] = useState({
-    author_name: '',
-    author_email: '',
-    content: ''
-  });
-  const [submitting, setSubmitting] = useState(false);
-  const [message, setMessage] = useState('');
-
-  useEffect(() => {
-    if (slug) {
-      loadBlog();
-    }
-    // eslint-disable-next-line react-hooks/exhaustive-deps
-  }, [slug]);
-
-  const loadBlog = async () => {
-    try {
-      setLoading(true);
-      const data = await apiClient.getBlogBySlug(slug);
-      setBlog(data);
-    } catch (error) {
-      console.error('Failed to load blog:', error);
-    } finally {
-      setLoading(false);
-    }
-  };
+// Pre-rendered; regenerated when the backend revalidates "blog:<slug>"
+export const revalidate = REVALIDATE_SECONDS;
 
-  const handleCommentSubmit = async (e: React.FormEvent) => {
-    e.preventDefault();
-    if (!blog) return;
-
-    try {
-      setSubmitting(true);
-      await apiClient.createComment({
-        blog_id: blog.id,
-        ...commentForm
-      });
-      setMessage('Comment submitted for moderation!');
-      setCommentForm({ author_name: '', author_email: '', content: '' });
-    } catch (error: any) {
-      setMessage(`Error: ${error.message}`);
-    } finally {
-      setSubmitting(false);
-    }
-  };
+// Newest posts are built ahead; older ones render on first visit, then stay cached
+export async function generateStaticParams() {
+  const slugs = await getPrerenderSlugs();
+  return slugs.map((slug) => ({ slug }));
+}
 
-  if (loading) {
-    return (
-      <div className="min-h-screen flex items-center justify-center">
-        <p className="text-gray-600">Loading...</p>
-      </div>
-    );
-  }
+export default async function BlogDetailPage({ params }: { params: Promise<{ slug: string }> }) {
+  const { slug } = await params;
+  const blog = await getPublishedBlog(slug);
 
   if (!blog) {
-    return (
-      <div className="min-h-screen flex items-center justify-center">
-        <div className="text-center">
-          <h1 className="text-2xl font-bold mb-4">Blog not found</h1>
-          <Link href="/">
-            <Button>Go back home</Button>
-          </Link>
-        </div>
-      </div>
-    );
+    notFound();
   }
 
   return (
@@ -102,9 +42,12 @@ export default function BlogDetailPage() {
         {/* Featured Image */}
         {blog.featured_image && (
           <div className="mb-8 rounded-lg overflow-hidden shadow-lg">
-            <img
-              src={`http://localhost:5000${blog.featured_image}`}
+            <FeaturedImage
+              src={blog.featured_image}
+              variants={blog.featured_image_variants}
               alt={blog.title}
+              sizes="(min-width: 896px) 896px, 100vw"
+              loading="eager"
               className="w-full h-96 object-cover"
             />
           </div>
@@ -176,48 +119,7 @@ export default function BlogDetailPage() {
             )}
 
             {/* Comment Form */}
-            <div className="border-t pt-6">
-              <h3 className="text-lg font-semibold mb-4">Leave a Comment</h3>
-              {message && (
-                <div className={`mb-4 p-3 rounded ${message.includes('Error') ? 'bg-red-100 text-red-700' : 'bg-green-100 text-green-700'}`}>
-                  {message}
-                </div>
-              )}
-              <form onSubmit={handleCommentSubmit} className="space-y-4">
-                <div>
-                  <Label htmlFor="author_name">Name</Label>
-                  <Input
-                    id="author_name"
-                    value={commentForm.author_name}
-                    onChange={(e) => setCommentForm({ ...commentForm, author_name: e.target.value })}
-                    required
-                  />
-                </div>
-                <div>
-                  <Label htmlFor="author_email">Email</Label>
-                  <Input
-                    id="author_email"
-                    type="email"
-                    value={commentForm.author_email}
-                    onChange={(e) => setCommentForm({ ...commentForm, author_email: e.target.value })}
-                    required
-                  />
-                </div>
-                <div>
-                  <Label htmlFor="content">Comment</Label>
-                  <Textarea
-                    id="content"
-                    rows={4}
-                    value={commentForm.content}
-                    onChange={(e) => setCommentForm({ ...commentForm, content: e.target.value })}
-                    required
-                  />
-                </div>
-                <Button type="submit" disabled={submitting}>
-                  {submitting ? 'Submitting...' : 'Submit Comment'}
-                </Button>
-              </form>
-            </div>
+            <CommentForm blogId={blog.id} />
           </CardContent>
         </Card>
       </article>
@@ -0,0 +1,24 @@
+import { notFound, redirect } from 'next/navigation';
+import { BlogIndex } from '@/components/BlogIndex';
+import { getPrerenderListPages, getPublishedPage, REVALIDATE_SECONDS } from '@/lib/content';
+
+export const revalidate = REVALIDATE_SECONDS;
+
+// The first few list pages are built ahead; later ones render on first visit
+export async function generateStaticParams() {
+  const pages = await getPrerenderListPages();
+  return pages.map((page) => ({ page: String(page) }));
+}
+
+export default async function BlogListPage({ params }: { params: Promise<{ page: string }> }) {
+  const { page } = await params;
+  const currentPage = Number(page);
+  if (!Number.isInteger(currentPage) || currentPage < 1) notFound();
+  if (currentPage === 1) redirect('/');
+
+  const { blogs, pagination } = await getPublishedPage(currentPage);
+  const totalPages = pagination.totalPages || 1;
+  if (currentPage > totalPages) notFound();
+
+  return <BlogIndex blogs={blogs} currentPage={currentPage} totalPages={totalPages} />;
+}
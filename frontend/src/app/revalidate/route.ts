@@ -0,0 +1,47 @@
+import crypto from 'crypto';
+import { revalidateTag } from 'next/cache';
+
+// Webhook the backend calls after content changes (backend/src/utils/revalidate.js).
+// Body: { tags: string[], timestamp: number }, signed with HMAC-SHA256 over the
+// raw body using REVALIDATE_SECRET and sent as X-Revalidate-Signature: sha256=<hex>.
+const MAX_AGE_MS = 5 * 60 * 1000;
+const TAG_PATTERN = /^(blogs|blog-pages|blog:[\w-]+)$/;
+
+const validSignature = (body: string, header: string | null, secret: string) => {
+  const expected = Buffer.from(`sha256=${crypto.createHmac('sha256', secret).update(body).digest('hex')}`);
+  const received = Buffer.from(header || '');
+  return received.length === expected.length && crypto.timingSafeEqual(received, expected);
+};
+
+export async function POST(request: Request) {
+  const secret = process.env.REVALIDATE_SECRET;
+  if (!secret) {
+    return Response.json({ error: 'Revalidation is not configured' }, { status: 503 });
+  }
+
+  const body = await request.text();
+  if (!validSignature(body, request.headers.get('x-revalidate-signature'), secret)) {
+    return Response.json({ error: 'Invalid signature' }, { status: 401 });
+  }
+
+  let payload: { tags?: unknown; timestamp?: unknown };
+  try {
+    payload = JSON.parse(body);
+  } catch {
+    return Response.json({ error: 'Invalid JSON' }, { status: 400 });
+  }
+
+  // Signed requests older than a few minutes are replays
+  if (typeof payload.timestamp !== 'number' || Math.abs(Date.now() - payload.timestamp) > MAX_AGE_MS) {
+    return Response.json({ error: 'Stale request' }, { status: 401 });
+  }
+  if (!Array.isArray(payload.tags)) {
+    return Response.json({ error: 'tags must be an array' }, { status: 400 });
+  }
+
+  const tags = payload.tags.filter((tag): tag is string => typeof tag === 'string' && TAG_PATTERN.test(tag));
+  // Expire now: the next visit renders fresh content instead of one stale copy
+  tags.forEach((tag) => revalidateTag(tag, { expire: 0 }));
+
+  return Response.json({ revalidated: tags });
+}
@@ -0,0 +1,82 @@
+'use client';
+
+import { useState } from 'react';
+import { apiClient } from '@/lib/api';
+import { Button } from '@/components/ui/Button';
+import { Input } from '@/components/ui/Input';
+import { Textarea } from '@/components/ui/Textarea';
+import { Label } from '@/components/ui/Label';
+
+// Interactive part of the pre-rendered post page; submissions go straight to the API
+export function CommentForm({ blogId }: { blogId: string }) {
+  const [commentForm, setCommentForm] = useState({
+    author_name: '',
+    author_email: '',
+    content: ''
+  });
+  const [submitting, setSubmitting] = useState(false);
+  const [message, setMessage] = useState('');
+
+  const handleCommentSubmit = async (e: React.FormEvent) => {
+    e.preventDefault();
+
+    try {
+      setSubmitting(true);
+      await apiClient.createComment({
+        blog_id: blogId,
+        ...commentForm
+      });
+      setMessage('Comment submitted for moderation!');
+      setCommentForm({ author_name: '', author_email: '', content: '' });
+    } catch (error: any) {
+      setMessage(`Error: ${error.message}`);
+    } finally {
+      setSubmitting(false);
+    }
+  };
+
+  return (
+    <div className="border-t pt-6">
+      <h3 className="text-lg font-semibold mb-4">Leave a Comment</h3>
+      {message && (
+        <div className={`mb-4 p-3 rounded ${message.includes('Error') ? 'bg-red-100 text-red-700' : 'bg-green-100 text-green-700'}`}>
+          {message}
+        </div>
+      )}
+      <form onSubmit={handleCommentSubmit} className="space-y-4">
+        <div>
+          <Label htmlFor="author_name">Name</Label>
+          <Input
+            id="author_name"
+            value={commentForm.author_name}
+            onChange={(e) => setCommentForm({ ...commentForm, author_name: e.target.value })}
+            required
+          />
+        </div>
+        <div>
+          <Label htmlFor="author_email">Email</Label>
+          <Input
+            id="author_email"
+            type="email"
+            value={commentForm.author_email}
+            onChange={(e) => setCommentForm({ ...commentForm, author_email: e.target.value })}
+            required
+          />
+        </div>
+        <div>
+          <Label htmlFor="content">Comment</Label>
+          <Textarea
+            id="content"
+            rows={4}
+            value={commentForm.content}
+            onChange={(e) => setCommentForm({ ...commentForm, content: e.target.value })}
+            required
+          />
+        </div>
+        <Button type="submit" disabled={submitting}>
+          {submitting ? 'Submitting...' : 'Submit Comment'}
+        </Button>
+      </form>
+    </div>
+  );
+}
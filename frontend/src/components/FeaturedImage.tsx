@@ -0,0 +1,31 @@
+import { ImageVariant } from '@/types';
+
+const UPLOADS_ORIGIN = 'http://localhost:5000';
+
+interface FeaturedImageProps {
+  src: string;
+  variants?: ImageVariant[];
+  alt: string;
+  sizes: string;
+  className?: string;
+  loading?: 'lazy' | 'eager';
+}
+
+// Serves the smallest AVIF/WebP variant that fits, falling back to the original upload
+export function FeaturedImage({ src, variants = [], alt, sizes, className, loading = 'lazy' }: FeaturedImageProps) {
+  const srcSet = (format: ImageVariant['format']) =>
+    variants
+      .filter((variant) => variant.format === format)
+      .map((variant) => `${UPLOADS_ORIGIN}${variant.path} ${variant.width}w`)
+      .join(', ');
+
+  return (
+    <picture>
+      {(['avif', 'webp'] as const).map((format) => {
+        const set = srcSet(format);
+        return set ? <source key={format} type={`image/${format}`} srcSet={set} sizes={sizes} /> : null;
+      })}
+      <img src={`${UPLOADS_ORIGIN}${src}`} alt={alt} className={className} loading={loading} decoding="async" />
+    </picture>
+  );
+}
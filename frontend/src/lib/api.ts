@@ -1,8 +1,20 @@
+import { BulkResult, BulkTarget } from '@/types';
+
 const API_URL = process.env.NEXT_PUBLIC_API_URL || (typeof window !== 'undefined' ? `${window.location.origin}/api` : '/api');
 
+// Bodies kept for conditional revalidation (If-None-Match / If-Modified-Since)
+const MAX_VALIDATORS = 100;
+
+interface CachedResponse {
+  etag: string;
+  lastModified: string | null;
+  data: any;
+}
+
 class ApiClient {
   private baseUrl: string;
   private token: string | null = null;
+  private validators = new Map<string, CachedResponse>();
 
   constructor(baseUrl: string) {
     this.baseUrl = baseUrl;
@@ -36,20 +48,52 @@ class ApiClient {
       headers['Authorization'] = `Bearer ${this.token}`;
     }
 
+    // Revalidate GETs we already hold a copy of; a 304 reuses it
+    const isGet = !options.method || options.method.toUpperCase() === 'GET';
+    const cached = isGet ? this.validators.get(endpoint) : undefined;
+    if (cached) {
+      headers['If-None-Match'] = cached.etag;
+      if (cached.lastModified) {
+        headers['If-Modified-Since'] = cached.lastModified;
+      }
+    }
+
     const response = await fetch(`${this.baseUrl}${endpoint}`, {
       ...options,
       headers,
     });
 
+    if (response.status === 304 && cached) {
+      return cached.data;
+    }
+
     const data = await response.json();
 
     if (!response.ok) {
       throw new Error(data.error || 'Request failed');
     }
 
+    const etag = response.headers.get('ETag');
+    if (isGet && etag) {
+      this.rememberValidator(endpoint, {
+        etag,
+        lastModified: response.headers.get('Last-Modified'),
+        data,
+      });
+    }
+
     return data;
   }
 
+  private rememberValidator(endpoint: string, entry: CachedResponse) {
+    this.validators.delete(endpoint);
+    this.validators.set(endpoint, entry);
+    if (this.validators.size > MAX_VALIDATORS) {
+      const oldest = this.validators.keys().next().value;
+      if (oldest !== undefined) this.validators.delete(oldest);
+    }
+  }
+
   private async uploadRequest(endpoint: string, formData: FormData) {
     const headers: Record<string, string> = {};
 
@@ -72,6 +116,29 @@ class ApiClient {
     return data;
   }
 
+  // Streamed exports arrive as files; hand them to the browser as a download
+  private async download(endpoint: string, filename: string) {
+    const headers: Record<string, string> = {};
+
+    if (this.token) {
+      headers['Authorization'] = `Bearer ${this.token}`;
+    }
+
+    const response = await fetch(`${this.baseUrl}${endpoint}`, { headers });
+
+    if (!response.ok) {
+      const data = await response.json();
+      throw new Error(data.error || 'Download failed');
+    }
+
+    const url = URL.createObjectURL(await response.blob());
+    const link = document.createElement('a');
+    link.href = url;
+    link.download = filename;
+    link.click();
+    URL.revokeObjectURL(url);
+  }
+
   // Auth
   async login(email: string, password: string) {
     const data = await this.request('/auth/login', {
@@ -92,11 +159,23 @@ class ApiClient {
   }
 
   // Blogs
-  async getBlogs(params?: { page?: number; limit?: number; status?: string; category?: string }) {
+  async getBlogs(params?: {
+    page?: number;
+    limit?: number;
+    status?: string;
+    category?: string;
+    cursor?: string;
+    include_total?: boolean;
+  }) {
     const queryString = params ? '?' + new URLSearchParams(params as any).toString() : '';
     return this.request(`/blogs${queryString}`);
   }
 
+  async searchBlogs(q: string, params?: { limit?: number; cursor?: string }) {
+    const queryString = new URLSearchParams({ q, ...(params as any) }).toString();
+    return this.request(`/blogs/search?${queryString}`);
+  }
+
   async getBlogBySlug(slug: string) {
     return this.request(`/blogs/${slug}`);
   }
@@ -168,11 +247,21 @@ class ApiClient {
   }
 
   // Comments
-  async getComments(params?: { status?: string; blog_id?: string }) {
+  async getComments(params?: {
+    status?: string;
+    blog_id?: string;
+    limit?: number;
+    cursor?: string;
+    include_total?: boolean;
+  }) {
     const queryString = params ? '?' + new URLSearchParams(params as any).toString() : '';
     return this.request(`/comments${queryString}`);
   }
 
+  async exportComments(format: 'csv' | 'ndjson' = 'csv') {
+    return this.download(`/comments/export?format=${format}`, `comments.${format}`);
+  }
+
   async createComment(data: {
     blog_id: string;
     author_name: string;
@@ -196,12 +285,30 @@ class ApiClient {
     return this.request(`/comments/${id}`, { method: 'DELETE' });
   }
 
+  async bulkUpdateCommentStatus(target: BulkTarget, status: string): Promise<BulkResult> {
+    return this.request('/comments/bulk/status', {
+      method: 'PATCH',
+      body: JSON.stringify({ ...target, status }),
+    });
+  }
+
+  async bulkDeleteComments(target: BulkTarget): Promise<BulkResult> {
+    return this.request('/comments/bulk/delete', {
+      method: 'POST',
+      body: JSON.stringify(target),
+    });
+  }
+
   // Contacts
-  async getContacts(params?: { status?: string }) {
+  async getContacts(params?: { status?: string; limit?: number; cursor?: string; include_total?: boolean }) {
     const queryString = params ? '?' + new URLSearchParams(params as any).toString() : '';
     return this.request(`/contacts${queryString}`);
   }
 
+  async exportContacts(format: 'csv' | 'ndjson' = 'csv') {
+    return this.download(`/contacts/export?format=${format}`, `contacts.${format}`);
+  }
+
   async createContact(data: {
     name: string;
     email: string;
@@ -225,6 +332,20 @@ class ApiClient {
     return this.request(`/contacts/${id}`, { method: 'DELETE' });
   }
 
+  async bulkUpdateContactStatus(target: BulkTarget, status: string): Promise<BulkResult> {
+    return this.request('/contacts/bulk/status', {
+      method: 'PATCH',
+      body: JSON.stringify({ ...target, status }),
+    });
+  }
+
+  async bulkDeleteContacts(target: BulkTarget): Promise<BulkResult> {
+    return this.request('/contacts/bulk/delete', {
+      method: 'POST',
+      body: JSON.stringify(target),
+    });
+  }
+
   // Dashboard
   async getDashboardStats() {
     return this.request('/dashboard/stats');
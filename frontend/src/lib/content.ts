@@ -0,0 +1,79 @@
+import { Blog, CursorPagination } from '@/types';
+
+// Server-side reads for the pre-rendered public pages. Responses land in the
+// Next.js data cache under the tags below and stay there until the backend
+// calls /revalidate with them (see backend/src/utils/revalidate.js), so a
+// cached page costs the API nothing.
+//   blogs         - list pages
+//   blog-pages    - every post page
+//   blog:<slug>   - one post page
+const API_URL = process.env.API_INTERNAL_URL || process.env.NEXT_PUBLIC_API_URL || 'http://localhost:5000/api';
+
+// Safety net in case a revalidation webhook is lost
+export const REVALIDATE_SECONDS = 3600;
+
+export const POSTS_PER_PAGE = 9;
+// Pages rendered at build time; the rest render on first request, then stay cached
+const PRERENDER_POSTS = parseInt(process.env.PRERENDER_POSTS || '') || 500;
+const PRERENDER_LIST_PAGES = 5;
+
+interface BlogListPage {
+  blogs: Blog[];
+  pagination: CursorPagination & { page?: number; totalPages?: number };
+}
+
+async function get<T>(endpoint: string, tags: string[]): Promise<T | null> {
+  const response = await fetch(`${API_URL}${endpoint}`, {
+    next: { tags, revalidate: REVALIDATE_SECONDS },
+  });
+
+  if (response.status === 404) return null;
+  if (!response.ok) {
+    throw new Error(`GET ${endpoint} failed: HTTP ${response.status}`);
+  }
+  return response.json();
+}
+
+export async function getPublishedPage(page: number): Promise<BlogListPage> {
+  const params = new URLSearchParams({ status: 'published', page: String(page), limit: String(POSTS_PER_PAGE) });
+  const data = await get<BlogListPage>(`/blogs?${params}`, ['blogs']);
+  return data || { blogs: [], pagination: { limit: POSTS_PER_PAGE, nextCursor: null, page, totalPages: 0 } };
+}
+
+// Drafts are not public: their URLs 404 like missing posts
+export async function getPublishedBlog(slug: string): Promise<Blog | null> {
+  const blog = await get<Blog>(`/blogs/${encodeURIComponent(slug)}`, ['blog-pages', `blog:${slug}`]);
+  return blog && blog.status === 'published' ? blog : null;
+}
+
+// Newest published slugs, walked with the list cursor
+export async function getPrerenderSlugs(): Promise<string[]> {
+  const slugs: string[] = [];
+  let cursor: string | null = null;
+
+  try {
+    do {
+      const params = new URLSearchParams({ status: 'published', limit: '100' });
+      if (cursor) params.set('cursor', cursor);
+      const data = await get<BlogListPage>(`/blogs?${params}`, ['blogs']);
+      if (!data) break;
+      slugs.push(...data.blogs.map((blog) => blog.slug));
+      cursor = data.pagination.nextCursor;
+    } while (cursor && slugs.length < PRERENDER_POSTS);
+  } catch (error) {
+    // Build without a reachable backend: every page renders on first request instead
+    console.warn('Skipping post pre-rendering:', error);
+  }
+  return slugs.slice(0, PRERENDER_POSTS);
+}
+
+export async function getPrerenderListPages(): Promise<number[]> {
+  try {
+    const { pagination } = await getPublishedPage(1);
+    const totalPages = Math.min(pagination.totalPages || 1, PRERENDER_LIST_PAGES);
+    return Array.from({ length: Math.max(totalPages - 1, 0) }, (_, i) => i + 2);
+  } catch (error) {
+    console.warn('Skipping list page pre-rendering:', error);
+    return [];
+  }
+}
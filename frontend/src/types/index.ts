@@ -5,6 +5,13 @@ export interface User {
   role: string;
 }
 
+export interface ImageVariant {
+  format: 'webp' | 'avif';
+  width: number;
+  height: number;
+  path: string;
+}
+
 export interface Blog {
   id: string;
   title: string;
@@ -12,6 +19,7 @@ export interface Blog {
   content: string;
   excerpt?: string;
   featured_image?: string;
+  featured_image_variants?: ImageVariant[];
   category_id?: string;
   category_name?: string;
   category_slug?: string;
@@ -26,6 +34,20 @@ export interface Blog {
   comments?: Comment[];
 }
 
+export interface BlogSearchResult extends Omit<Blog, 'content' | 'status' | 'author_id' | 'updated_at'> {
+  score: number;
+  highlight: {
+    title: string;
+    snippet: string;
+  };
+}
+
+export interface BlogSearchPage {
+  query: string;
+  results: BlogSearchResult[];
+  pagination: CursorPagination;
+}
+
 export interface Category {
   id: string;
   name: string;
@@ -85,6 +107,30 @@ export interface DashboardStats {
   recentComments: Comment[];
 }
 
+export interface CursorPagination {
+  limit: number;
+  nextCursor: string | null;
+  total?: number;
+}
+
+export interface CommentPage {
+  comments: Comment[];
+  pagination: CursorPagination;
+}
+
+export interface ContactPage {
+  contacts: Contact[];
+  pagination: CursorPagination;
+}
+
+export type BulkTarget = { ids: string[] } | { filter: Record<string, string> };
+
+export interface BulkResult {
+  results: { id: string; result: 'updated' | 'deleted' | 'unchanged' | 'not_found' }[];
+  counts: Partial<Record<'updated' | 'deleted' | 'unchanged' | 'not_found', number>>;
+  hasMore: boolean;
+}
+
 export interface AuthResponse {
   token: string;
   user: User;